@@ -4,7 +4,7 @@
 # BibleBookOrders.py
 #
 # Module handling BibleBookOrderSystem_*.xml to produce C and Python data tables
-#   Last modified: 2011-01-26 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,16 +28,15 @@ Module handling BibleBookOrder_*.xml to produce C and Python data tables.
 """
 
 progName = "Bible Book Order Systems handler"
-versionString = "0.58"
+versionString = "0.64"
 
 
 import os, logging
 from gettext import gettext as _
 from collections import OrderedDict
-from xml.etree.cElementTree import ElementTree
 
 from singleton import singleton
-import Globals
+import Globals, DataCache, StartupProfiler, DeferredValidation
 from BibleBooksCodes import BibleBooksCodes
 
 
@@ -68,65 +67,93 @@ class _BibleBookOrdersConverter:
 
 
         # These are fields that we will fill later
-        self.XMLSystems = {}
+        self.XMLSystems, self.__systemFilepaths = {}, OrderedDict()
         self.__DataDicts, self.__DataLists = {}, {} # Used for import
 
         # Make sure we have the bible books codes data loaded and available
         self.BibleBooksCodes = BibleBooksCodes().loadData()
     # end of __init__
 
-    def loadSystems( self, XMLFolder=None ):
+    def indexSystems( self, XMLFolder=None ):
         """
-        Load and pre-process the specified book order systems.
+        Find the available book order systems (without loading them).
         """
-        if not self.XMLSystems: # Only ever do this once
+        if not self.__systemFilepaths: # Only ever do this once
             if XMLFolder==None: XMLFolder = "DataFiles/BookOrders"
             self.__XMLFolder = XMLFolder
-            if Globals.verbosityLevel > 2: print( _("Loading book order systems from {}...").format( self.__XMLFolder ) )
             filenamePrefix = "BIBLEBOOKORDER_"
-            for filename in os.listdir( XMLFolder ):
-                filepart, extension = os.path.splitext( filename )
-                if extension.upper() == '.XML' and filepart.upper().startswith(filenamePrefix):
-                    bookOrderSystemCode = filepart[len(filenamePrefix):]
-                    if Globals.verbosityLevel > 3: print( _("  Loading{} book order system from {}...").format( bookOrderSystemCode, filename ) )
-                    self.XMLSystems[bookOrderSystemCode] = {}
-                    self.XMLSystems[bookOrderSystemCode]["tree"] = ElementTree().parse( os.path.join( XMLFolder, filename ) )
-                    assert( self.XMLSystems[bookOrderSystemCode]["tree"] ) # Fail here if we didn't load anything at all
-
-                    # Check and remove the header element
-                    if self.XMLSystems[bookOrderSystemCode]["tree"].tag  == self.treeTag:
-                        header = self.XMLSystems[bookOrderSystemCode]["tree"][0]
-                        if header.tag == self.headerTag:
-                            self.XMLSystems[bookOrderSystemCode]["header"] = header
-                            self.XMLSystems[bookOrderSystemCode]["tree"].remove( header )
-                            if len(header)>1:
-                                logging.info( _("Unexpected elements in header") )
-                            elif len(header)==0:
-                                logging.info( _("Missing work element in header") )
-                            else:
-                                work = header[0]
-                                if work.tag == "work":
-                                    self.XMLSystems[bookOrderSystemCode]["version"] = work.find("version").text
-                                    self.XMLSystems[bookOrderSystemCode]["date"] = work.find("date").text
-                                    self.XMLSystems[bookOrderSystemCode]["title"] = work.find("title").text
-                                else:
-                                    logging.warning( _("Missing work element in header") )
-                        else:
-                            logging.warning( _("Missing header element (looking for '{}' tag)").format( headerTag ) )
-                    else:
-                        logging.error( _("Expected to load '{}' but got '{}'").format( treeTag, self.XMLSystems[bookOrderSystemCode]["tree"].tag ) )
-                    bookCount = 0 # There must be an easier way to do this
-                    for subelement in self.XMLSystems[bookOrderSystemCode]["tree"]:
-                        bookCount += 1
-                    logging.info( _("    Loaded {} books").format( bookCount ) )
-
-                if Globals.strictCheckingFlag:
-                    self.__validateSystem( self.XMLSystems[bookOrderSystemCode]["tree"], bookOrderSystemCode )
-        else: # The data must have been already loaded
+            for filepath in DataCache.getFolderFilepaths( XMLFolder, filenamePrefix ):
+                filepart, extension = os.path.splitext( os.path.basename( filepath ) )
+                self.__systemFilepaths[filepart[len(filenamePrefix):]] = filepath
+        else: # The folder must have been already indexed
             if XMLFolder is not None and XMLFolder!=self.__XMLFolder: logging.error( _("Bible book order systems are already loaded -- your different folder of '{}' was ignored").format( XMLFolder ) )
         return self
+    # end of indexSystems
+
+    def loadSystems( self, XMLFolder=None ):
+        """
+        Load and pre-process the specified book order systems.
+        """
+        self.indexSystems( XMLFolder )
+        if len(self.XMLSystems) < len(self.__systemFilepaths): # Only ever do this once
+            if Globals.verbosityLevel > 2: print( _("Loading book order systems from {}...").format( self.__XMLFolder ) )
+            if Globals.maxProcesses > 1: # Load and validate the files in parallel
+                codesToLoad = [code for code in self.__systemFilepaths if code not in self.XMLSystems]
+                results = Globals.runInParallel( _loadSystemInWorker, [(self.__XMLFolder, code) for code in codesToLoad] )
+                for bookOrderSystemCode, result in zip( codesToLoad, results ): # Merge them in the same order as a serial load
+                    self.XMLSystems[bookOrderSystemCode] = result
+            for bookOrderSystemCode in self.__systemFilepaths:
+                self.loadSystem( bookOrderSystemCode )
+        return self
     # end of loadSystems
 
+    def loadSystem( self, bookOrderSystemCode ):
+        """
+        Load and pre-process the specified book order system
+            (which must have already been found by indexSystems).
+        """
+        if bookOrderSystemCode not in self.XMLSystems: # Only ever do this once
+            filepath = self.__systemFilepaths[bookOrderSystemCode]
+            if Globals.verbosityLevel > 3: print( _("Loading {} book order system from {}...").format( bookOrderSystemCode, filepath ) )
+            self.XMLSystems[bookOrderSystemCode] = {}
+            from xml.etree.cElementTree import ElementTree # Not imported until we actually have XML to parse
+            with StartupProfiler.profilePhase( __name__, "parse" ):
+                self.XMLSystems[bookOrderSystemCode]["tree"] = ElementTree().parse( filepath )
+            assert( self.XMLSystems[bookOrderSystemCode]["tree"] ) # Fail here if we didn't load anything at all
+
+            # Check and remove the header element
+            if self.XMLSystems[bookOrderSystemCode]["tree"].tag  == self.treeTag:
+                header = self.XMLSystems[bookOrderSystemCode]["tree"][0]
+                if header.tag == self.headerTag:
+                    self.XMLSystems[bookOrderSystemCode]["header"] = header
+                    self.XMLSystems[bookOrderSystemCode]["tree"].remove( header )
+                    if len(header)>1:
+                        logging.info( _("Unexpected elements in header") )
+                    elif len(header)==0:
+                        logging.info( _("Missing work element in header") )
+                    else:
+                        work = header[0]
+                        if work.tag == "work":
+                            self.XMLSystems[bookOrderSystemCode]["version"] = work.find("version").text
+                            self.XMLSystems[bookOrderSystemCode]["date"] = work.find("date").text
+                            self.XMLSystems[bookOrderSystemCode]["title"] = work.find("title").text
+                        else:
+                            logging.warning( _("Missing work element in header") )
+                else:
+                    logging.warning( _("Missing header element (looking for '{}' tag)").format( self.headerTag ) )
+            else:
+                logging.error( _("Expected to load '{}' but got '{}'").format( self.treeTag, self.XMLSystems[bookOrderSystemCode]["tree"].tag ) )
+            bookCount = 0 # There must be an easier way to do this
+            for subelement in self.XMLSystems[bookOrderSystemCode]["tree"]:
+                bookCount += 1
+            logging.info( _("    Loaded {} books").format( bookCount ) )
+
+            if Globals.strictCheckingFlag:
+                DeferredValidation.runOrDefer( __name__, self.__validateSystem, self.XMLSystems[bookOrderSystemCode]["tree"], bookOrderSystemCode )
+        return self
+    # end of loadSystem
+
+    @StartupProfiler.profiledPhase( "validate" )
     def __validateSystem( self, bookOrderTree, systemName ):
         """ Do a semi-automatic check of the XML file validity. """
         assert( bookOrderTree )
@@ -236,6 +263,7 @@ class _BibleBookOrdersConverter:
         return len( self.XMLSystems )
     # end of __len__
 
+    @StartupProfiler.profiledPhase( "import" )
     def importDataToPython( self ):
         """
         Loads (and pivots) the data (not including the header) into suitable Python containers to use in a Python program.
@@ -348,14 +376,16 @@ class _BibleBookOrdersConverter:
     def exportDataToC( self, filepath=None ):
         """
         Writes the information tables to a .h file that can be included in c and c++ programs.
+        The system table also gets a perfect-hash lookup function (bookOrderSystemTableLookup)
+            which returns the index of the system name in the table (or -1).
         """
         def writeStructure( hFile, structName, structure ):
             """ Writes a typedef to the .h file. """
-            hFile.write( "typedef struct{}EntryStruct {{\n".format( structName ) )
+            hFile.write( "typedef struct {}EntryStruct {{\n".format( structName ) )
             for declaration in structure.split(';'):
                 adjDeclaration = declaration.strip()
                 if adjDeclaration: hFile.write( "   {};\n".format( adjDeclaration ) )
-            hFile.write( "}}{}Entry;\n\n".format( structName ) )
+            hFile.write( "}} {}Entry;\n\n".format( structName ) )
         # end of writeStructure
 
         def exportPythonDict( cFile, theDict, dictName, structName, sortedBy, structure ):
@@ -380,18 +410,19 @@ class _BibleBookOrdersConverter:
             #    break # We only check the first (random) entry we get
             fieldsCount = 2
 
-            cFile.write( "const static{}\n{}[{}] = {{\n  // Fields ({}) are{}\n  // Sorted by{}\n".format( structName, dictName, len(theDict), fieldsCount, structure, sortedBy ) )
+            cFile.write( "const static {}\n {}[{}] = {{\n  // Fields ({}) are {}\n  // Sorted by {}\n".format( structName, dictName, len(theDict), fieldsCount, structure, sortedBy ) )
             for dictKey in sorted(theDict.keys()):
                 if isinstance( dictKey, str ):
-                    cFile.write( "  {{\"{}\",{}}},\n".format( dictKey, convertEntry(theDict[dictKey]) ) )
+                    cFile.write( "  {{\"{}\", {}}},\n".format( dictKey, convertEntry(theDict[dictKey]) ) )
                 elif isinstance( dictKey, int ):
-                    cFile.write( "  {{{},{}}},\n".format( dictKey, convertEntry(theDict[dictKey]) ) )
+                    cFile.write( "  {{{}, {}}},\n".format( dictKey, convertEntry(theDict[dictKey]) ) )
                 else:
                     logging.error( _("Can't handle this type of data yet: {}").format( dictKey ) )
-            cFile.write( "}}; //{} ({} entries)\n\n".format( dictName, len(theDict) ) )
+            cFile.write( "}}; // {} ({} entries)\n\n".format( dictName, len(theDict) ) )
         # end of exportPythonDict
 
         from datetime import datetime
+        import PerfectHash
 
         assert( self.XMLSystems )
         self.importDataToPython()
@@ -404,39 +435,40 @@ class _BibleBookOrdersConverter:
         ifdefName = self.filenameBase.upper() + "_Tables_h"
 
         with open( hFilepath, 'wt' ) as myHFile, open( cFilepath, 'wt' ) as myCFile:
-            myHFile.write( "//{}\n//\n".format( hFilepath ) )
-            myCFile.write( "//{}\n//\n".format( cFilepath ) )
+            myHFile.write( "// {}\n//\n".format( hFilepath ) )
+            myCFile.write( "// {}\n//\n".format( cFilepath ) )
             lines = "// This UTF-8 file was automatically generated by BibleBookOrders.py V{} on {}\n//\n".format( versionString, datetime.now() )
             myHFile.write( lines ); myCFile.write( lines )
-            myCFile.write( "//  {}{} loaded from the original XML file.\n//\n\n".format( len(self.XMLSystems), self.treeTag ) )
-            myHFile.write( "\n#ifndef{}\n#define{}\n\n".format( ifdefName, ifdefName ) )
+            myCFile.write( "//   {} {} loaded from the original XML file.\n//\n\n".format( len(self.XMLSystems), self.treeTag ) )
+            myHFile.write( "\n#ifndef {}\n#define {}\n\n".format( ifdefName, ifdefName ) )
             myCFile.write( '#include "{}"\n\n'.format( os.path.basename(hFilepath) ) )
+            PerfectHash.writeCHashFunction( myCFile )
 
             CHAR = "const unsigned char"
             BYTE = "const int"
             N1 = "bookOrderByRef"
             N2 = "bookOrderByIndex"
-            S1 = "{} referenceAbbreviation[3+1];{} indexNumber;".format(CHAR,BYTE)
-            S2 = "{} indexNumber;{} referenceAbbreviation[3+1];".format(BYTE,CHAR)
+            S1 = "{} referenceAbbreviation[3+1]; {} indexNumber;".format(CHAR,BYTE)
+            S2 = "{} indexNumber; {} referenceAbbreviation[3+1];".format(BYTE,CHAR)
             writeStructure( myHFile, N1, S1 )
             writeStructure( myHFile, N2, S2 )
-            writeStructure( myHFile, "table", "{}* systemName;{}Entry* byReference;{}Entry* byBook;".format(CHAR,N1,N2) ) # I'm not sure if I need one or two asterisks on those last two
+            writeStructure( myHFile, "table", "{}* systemName; {}Entry* byReference; {}Entry* byBook;".format(CHAR,N1,N2) ) # I'm not sure if I need one or two asterisks on those last two
                                                                                                         # They're supposed to be pointers to an array of structures
-            myHFile.write( "#endif //{}\n\n".format( ifdefName ) )
-            myHFile.write( "// end of{}".format( os.path.basename(hFilepath) ) )
-
             for systemName in self.__DataDicts: # Now write out the actual data into the .c file
                 bookDataDict, idDataDict = self.__DataDicts[systemName]
-                myCFile.write( "\n//{}\n".format( systemName ) )
+                myCFile.write( "\n// {}\n".format( systemName ) )
                 exportPythonDict( myCFile, bookDataDict, systemName+"BookDataDict", N1+"Entry", "referenceAbbreviation", S1 )
                 exportPythonDict( myCFile, idDataDict, systemName+"IndexNumberDataDict", N2+"Entry", "indexNumber", S2 )
 
             # Write out the final table of pointers to the above information
             myCFile.write( "\n// Pointers to above data\nconst static tableEntry bookOrderSystemTable[{}] = {{\n".format( len(self.__DataDicts) ) )
             for systemName in self.__DataDicts: # Now write out the actual pointer data into the .c file
-                myCFile.write( '  {{ "{}",{},{} }},\n'.format( systemName, systemName+"BookDataDict", systemName+"IndexNumberDataDict" ) )
-            myCFile.write( "}}; //{} entries\n\n".format( len(self.__DataDicts) ) )
-            myCFile.write( "// end of{}".format( os.path.basename(cFilepath) ) )
+                myCFile.write( '  {{ "{}", {}, {} }},\n'.format( systemName, systemName+"BookDataDict", systemName+"IndexNumberDataDict" ) )
+            myCFile.write( "}}; // {} entries\n\n".format( len(self.__DataDicts) ) )
+            PerfectHash.writeCLookupFunction( myHFile, myCFile, list(self.__DataDicts.keys()), "bookOrderSystemTable", "systemName" )
+            myHFile.write( "#endif // {}\n\n".format( ifdefName ) )
+            myHFile.write( "// end of {}".format( os.path.basename(hFilepath) ) )
+            myCFile.write( "// end of {}".format( os.path.basename(cFilepath) ) )
     # end of exportDataToC
 
     def obsoleteCheckBookOrderSystem( self, systemName, bookOrderSchemeToCheck ):
@@ -490,6 +522,18 @@ class _BibleBookOrdersConverter:
 # end of _BibleBookOrdersConverter class
 
 
+def _loadSystemInWorker( arguments ):
+    """
+    Loads (and validates) a single book order system in a worker process (used by loadSystems).
+
+    Returns the loaded XML data for the system.
+    """
+    XMLFolder, bookOrderSystemCode = arguments
+    bboc = _BibleBookOrdersConverter().indexSystems( XMLFolder )
+    return bboc.loadSystem( bookOrderSystemCode ).XMLSystems[bookOrderSystemCode]
+# end of _loadSystemInWorker
+
+
 @singleton # Can only ever have one instance
 class BibleBookOrderSystems:
     """
@@ -508,11 +552,17 @@ class BibleBookOrderSystems:
         self.__DataDicts = self.__DataLists = None # We'll import into these in loadData
     # end of __init__
 
+    @StartupProfiler.profiledPhase( "loadData" )
     def loadData( self, XMLFolder=None ):
         """ Loads the XML data file and imports it to dictionary format (if not done already). """
         if not self.__DataDicts or not self.__DataLists: # Don't do this unnecessarily
-            self.__bboc.loadSystems( XMLFolder ) # Load the XML (if not done already)
-            self.__DataDicts, self.__DataLists = self.__bboc.importDataToPython() # Get the various dictionaries organised for quick lookup
+            sourceFilepaths = DataCache.getFolderFilepaths( XMLFolder if XMLFolder is not None else "DataFiles/BookOrders", "BibleBookOrder_" ) + [ __file__ ]
+            result = DataCache.loadSnapshot( "BibleBookOrders", sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+            if result is None:
+                self.__bboc.loadSystems( XMLFolder ) # Load the XML (if not done already)
+                result = self.__bboc.importDataToPython()
+                DataCache.saveSnapshot( "BibleBookOrders", sourceFilepaths, result )
+            self.__DataDicts, self.__DataLists = result # Get the various dictionaries organised for quick lookup
             assert( len(self.__DataDicts) == len(self.__DataLists) )
             del self.__bboc # Now the converter class (that handles the XML) is no longer needed
         return self
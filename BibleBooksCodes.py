@@ -4,7 +4,7 @@
 # BibleBooksCodes.py
 #
 # Module handling BibleBooksCodes.xml to produce C and Python data tables
-#   Last modified: 2011-01-23 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,16 +28,15 @@ Module handling BibleBooksCodes.xml to produce C and Python data tables.
 """
 
 progName = "Bible Books Codes handler"
-versionString = "0.96"
+versionString = "0.103"
 
 
 import logging, os.path
 from gettext import gettext as _
 from collections import OrderedDict
-from xml.etree.cElementTree import ElementTree
 
 from singleton import singleton
-import Globals
+import Globals, DataCache, StartupProfiler, DeferredValidation
 
 
 @singleton # Can only ever have one instance
@@ -85,7 +84,7 @@ class _BibleBooksCodesConverter:
                 XMLFilepath = os.path.join( "DataFiles", self._filenameBase + ".xml" )
             self.__load( XMLFilepath )
             if Globals.strictCheckingFlag:
-                self.__validate()
+                DeferredValidation.runOrDefer( __name__, self.__validate )
         else: # The data must have been already loaded
             if XMLFilepath is not None and XMLFilepath!=self.__XMLFilepath: logging.error( _("Bible books codes are already loaded -- your different filepath of '{}' was ignored").format( XMLFilepath ) )
         return self
@@ -101,7 +100,9 @@ class _BibleBooksCodesConverter:
         assert( self._XMLtree is None or len(self._XMLtree)==0 ) # Make sure we're not doing this twice
 
         if Globals.verbosityLevel > 2: print( _("Loading BibleBooksCodes XML file from '{}'...").format( self.__XMLFilepath ) )
-        self._XMLtree = ElementTree().parse( self.__XMLFilepath )
+        from xml.etree.cElementTree import ElementTree # Not imported until we actually have XML to parse
+        with StartupProfiler.profilePhase( __name__, "parse" ):
+            self._XMLtree = ElementTree().parse( self.__XMLFilepath )
         assert( self._XMLtree ) # Fail here if we didn't load anything at all
 
         if self._XMLtree.tag == self._treeTag:
@@ -128,6 +129,7 @@ class _BibleBooksCodesConverter:
             logging.error( _("Expected to load '{}' but got '{}'").format( self._treeTag, self._XMLtree.tag ) )
     # end of __load
 
+    @StartupProfiler.profiledPhase( "validate" )
     def __validate( self ):
         """
         Check/validate the loaded data.
@@ -220,6 +222,7 @@ class _BibleBooksCodesConverter:
         return result
     # end of __str__
 
+    @StartupProfiler.profiledPhase( "import" )
     def importDataToPython( self ):
         """
         Loads (and pivots) the data (not including the header) into suitable Python containers to use in a Python program.
@@ -258,55 +261,74 @@ class _BibleBooksCodesConverter:
             # This part should be customized or added to for however you need to process the data
             #   Add .upper() if you require the abbreviations to be uppercase (or .lower() for lower case)
             #   The referenceAbbreviation is UPPER CASE by definition
+            # There's only one record for each book -- all of the dictionaries just point to it
+            record = { "referenceAbbreviation":referenceAbbreviation, "referenceNumber":intID, "SBLAbbreviation":SBLAbbreviation, "OSISAbbreviation":OSISAbbreviation,
+                        "SwordAbbreviation":SwordAbbreviation, "CCELNumberString":CCELNumberString,
+                        "ParatextAbbreviation":ParatextAbbreviation, "ParatextNumberString":ParatextNumberString,
+                        "NETBibleAbbreviation":NETBibleAbbreviation, "ByzantineAbbreviation":ByzantineAbbreviation,
+                        "numExpectedChapters":expectedChapters, "possibleAlternativeBooks":possibleAlternativeBooks, "nameEnglish":nameEnglish }
             if "referenceAbbreviation" in self._compulsoryElements or referenceAbbreviation:
                 if "referenceAbbreviation" in self._uniqueElements: assert( referenceAbbreviation not in myRADict ) # Shouldn't be any duplicates
-                #myRADict[referenceAbbreviation] = ( intID, SBLAbbreviation, OSISAbbreviation, SwordAbbreviation, CCELNumberString, ParatextAbbreviation, ParatextNumberString, NETBibleAbbreviation, ByzantineAbbreviation, expectedChapters, possibleAlternativeBooks, nameEnglish, )
-                myRADict[referenceAbbreviation] = { "referenceNumber":intID, "SBLAbbreviation":SBLAbbreviation, "OSISAbbreviation":OSISAbbreviation,
-                                                    "SwordAbbreviation":SwordAbbreviation, "CCELNumberString":CCELNumberString,
-                                                    "ParatextAbbreviation":ParatextAbbreviation, "ParatextNumberString":ParatextNumberString,
-                                                    "NETBibleAbbreviation":NETBibleAbbreviation, "ByzantineAbbreviation":ByzantineAbbreviation,
-                                                    "numExpectedChapters":expectedChapters, "possibleAlternativeBooks":possibleAlternativeBooks, "nameEnglish":nameEnglish }
+                myRADict[referenceAbbreviation] = record
             if "referenceNumber" in self._compulsoryElements or ID:
                 if "referenceNumber" in self._uniqueElements: assert( intID not in myIDDict ) # Shouldn't be any duplicates
-                #myIDDict[intID] = ( referenceAbbreviation, SBLAbbreviation, OSISAbbreviation, SwordAbbreviation, CCELNumberString, ParatextAbbreviation, ParatextNumberString, NETBibleAbbreviation, ByzantineAbbreviation, expectedChapters, possibleAlternativeBooks, nameEnglish, )
-                myIDDict[intID] = { "referenceAbbreviation":referenceAbbreviation, "SBLAbbreviation":SBLAbbreviation, "OSISAbbreviation":OSISAbbreviation,
-                                    "SwordAbbreviation":SwordAbbreviation, "CCELNumberString":CCELNumberString,
-                                    "ParatextAbbreviation":ParatextAbbreviation, "ParatextNumberString":ParatextNumberString,
-                                    "NETBibleAbbreviation":NETBibleAbbreviation, "ByzantineAbbreviation":ByzantineAbbreviation,
-                                    "numExpectedChapters":expectedChapters, "possibleAlternativeBooks":possibleAlternativeBooks, "nameEnglish":nameEnglish }
+                myIDDict[intID] = record
             if "SBLAbbreviation" in self._compulsoryElements or SBLAbbreviation:
-                if "SBLAbbreviation" in self._uniqueElements: ssert( SBLAbbreviation not in myOADict ) # Shouldn't be any duplicates 
-                mySBLDict[SBLAbbreviation] = ( intID, referenceAbbreviation, )
+                if "SBLAbbreviation" in self._uniqueElements: assert( SBLAbbreviation not in mySBLDict ) # Shouldn't be any duplicates 
+                mySBLDict[SBLAbbreviation] = record
             if "OSISAbbreviation" in self._compulsoryElements or OSISAbbreviation:
                 if "OSISAbbreviation" in self._uniqueElements: assert( OSISAbbreviation not in myOADict ) # Shouldn't be any duplicates 
-                myOADict[OSISAbbreviation] = ( intID, referenceAbbreviation )
+                myOADict[OSISAbbreviation] = record
             if "SwordAbbreviation" in self._compulsoryElements or SwordAbbreviation:
                 if "SwordAbbreviation" in self._uniqueElements: assert( SwordAbbreviation not in mySwDict ) # Shouldn't be any duplicates
-                mySwDict[SwordAbbreviation] = ( intID, referenceAbbreviation, )
+                mySwDict[SwordAbbreviation] = record
             if "CCELNumberString" in self._compulsoryElements or CCELNumberString:
                 if "CCELNumberString" in self._uniqueElements: assert( CCELNumberString not in myCCELDict ) # Shouldn't be any duplicates
-                myCCELDict[CCELNumberString] = ( intID, referenceAbbreviation, )
+                myCCELDict[CCELNumberString] = record
             if "ParatextAbbreviation" in self._compulsoryElements or ParatextAbbreviation:
                 if "ParatextAbbreviation" in self._uniqueElements: assert( ParatextAbbreviation not in myPADict ) # Shouldn't be any duplicates
-                myPADict[ParatextAbbreviation] = ( intID, referenceAbbreviation, ParatextNumberString, )
+                myPADict[ParatextAbbreviation] = record
             if "ParatextNumberString" in self._compulsoryElements or ParatextNumberString:
                 if "ParatextNumberString" in self._uniqueElements: assert( ParatextNumberString not in myPNDict ) # Shouldn't be any duplicates
-                myPNDict[ParatextNumberString] = ( intID, referenceAbbreviation, ParatextAbbreviation, )
+                myPNDict[ParatextNumberString] = record
             if "NETBibleAbbreviation" in self._compulsoryElements or NETBibleAbbreviation:
-                if "NETBibleAbbreviation" in self._uniqueElements: assert( NETBibleAbbreviation not in myBzDict ) # Shouldn't be any duplicates
-                myNETDict[NETBibleAbbreviation] = ( intID, referenceAbbreviation, )
+                if "NETBibleAbbreviation" in self._uniqueElements: assert( NETBibleAbbreviation not in myNETDict ) # Shouldn't be any duplicates
+                myNETDict[NETBibleAbbreviation] = record
             if "ByzantineAbbreviation" in self._compulsoryElements or ByzantineAbbreviation:
                 if "ByzantineAbbreviation" in self._uniqueElements: assert( ByzantineAbbreviation not in myBzDict ) # Shouldn't be any duplicates
-                myBzDict[ByzantineAbbreviation] = ( intID, referenceAbbreviation, )
+                myBzDict[ByzantineAbbreviation] = record
             if "nameEnglish" in self._compulsoryElements or ParatextNumberString:
                 if "nameEnglish" in self._uniqueElements: assert( nameEnglish not in myENDict ) # Shouldn't be any duplicates
-                myENDict[nameEnglish] = ( intID, referenceAbbreviation )
+                myENDict[nameEnglish] = record
         self.__DataDicts = { "referenceNumberDict":myIDDict, "referenceAbbreviationDict":myRADict, "SBLDict":mySBLDict, "OSISAbbreviationDict":myOADict, "SwordAbbreviationDict":mySwDict,
                         "CCELDict":myCCELDict, "ParatextAbbreviationDict":myPADict, "ParatextNumberDict":myPNDict, "NETBibleAbbreviationDict":myNETDict,
                         "ByzantineAbbreviationDict":myBzDict, "EnglishNameDict":myENDict }
         return self.__DataDicts # Just delete any of the dictionaries that you don't need
     # end of importDataToPython
 
+    def __getExportDicts( self ):
+        """
+        Returns copies of the imported dictionaries in the layout used by the exported tables,
+            i.e., with the key field left out of the full records
+            and with just the referenceNumber and referenceAbbreviation (plus the other Paratext field) for the other codes.
+        """
+        exportDicts = {}
+        for dictName,dictData in self.__DataDicts.items():
+            exportDict = OrderedDict() if isinstance( dictData, OrderedDict ) else {}
+            for key,record in dictData.items():
+                if dictName == "referenceAbbreviationDict":
+                    exportDict[key] = { field:value for field,value in record.items() if field != "referenceAbbreviation" }
+                elif dictName == "referenceNumberDict":
+                    exportDict[key] = { field:value for field,value in record.items() if field != "referenceNumber" }
+                elif dictName == "ParatextAbbreviationDict":
+                    exportDict[key] = ( record["referenceNumber"], record["referenceAbbreviation"], record["ParatextNumberString"], )
+                elif dictName == "ParatextNumberDict":
+                    exportDict[key] = ( record["referenceNumber"], record["referenceAbbreviation"], record["ParatextAbbreviation"], )
+                else: exportDict[key] = ( record["referenceNumber"], record["referenceAbbreviation"], )
+            exportDicts[dictName] = exportDict
+        return exportDicts
+    # end of __getExportDicts
+
     def exportDataToPython( self, filepath=None ):
         """
         Writes the information tables to a .py file that can be cut and pasted into a Python program.
@@ -342,7 +364,7 @@ class _BibleBooksCodesConverter:
                             "CCELDict":("CCELNumberString",mostEntries), "SBLDict":("SBLAbbreviation",mostEntries), "OSISAbbreviationDict":("OSISAbbreviation",mostEntries), "SwordAbbreviationDict":("SwordAbbreviation",mostEntries),
                             "ParatextAbbreviationDict":("ParatextAbbreviation",mostEntries), "ParatextNumberDict":("ParatextNumberString",mostEntries),
                             "NETBibleAbbreviationDict":("NETBibleAbbreviation",mostEntries), "ByzantineAbbreviationDict":("ByzantineAbbreviation",mostEntries), "EnglishNameDict":("nameEnglish",mostEntries) }
-            for dictName,dictData in self.__DataDicts.items():
+            for dictName,dictData in self.__getExportDicts().items():
                 exportPythonDict( myFile, dictData, dictName, dictInfo[dictName][0], dictInfo[dictName][1] )
             myFile.write( "# end of {}".format( os.path.basename(filepath) ) )
     # end of exportDataToPython
@@ -369,13 +391,15 @@ class _BibleBooksCodesConverter:
             #if self.versionString: myFile.write( "#  Version: {}\n".format( self.versionString ) )
             #if self.dateString: myFile.write( "#  Date: {}\n#\n".format( self.dateString ) )
             #myFile.write( "#   {} {} loaded from the original XML file.\n#\n\n".format( len(self._XMLtree), self._treeTag ) )
-            json.dump( self.__DataDicts, myFile, indent=2 )
+            json.dump( self.__getExportDicts(), myFile, indent=2 )
             #myFile.write( "\n\n# end of {}".format( os.path.basename(filepath) ) )
     # end of exportDataToJSON
 
     def exportDataToC( self, filepath=None ):
         """
         Writes the information tables to a .h and .c files that can be included in c and c++ programs.
+        Each table with string keys also gets a perfect-hash lookup function (e.g., OSISAbbreviationDictLookup)
+            which returns the index of the key in the table (or -1).
 
         NOTE: The (optional) filepath should not have the file extension specified -- this is added automatically.
         """
@@ -391,9 +415,9 @@ class _BibleBooksCodesConverter:
                         elif isinstance( field, str): result += '"' + str(field).replace('"','\\"') + '"'
                         elif isinstance( field, int): result += str(field)
                         else: logging.error( _("Cannot convert unknown field type '{}' in entry '{}'").format( field, entry ) )
-                elif isinstance( entry, dict ):
-                    for key in sorted(entry.keys()):
-                        field = entry[key]
+                elif isinstance( entry, dict ): # Write the fields in the same order as the structure
+                    for key in fieldNames[1:]: # The first field is the dictionary key
+                        field = entry.get( key )
                         if result: result += ", " # Separate the fields
                         if field is None: result += '""'
                         elif isinstance( field, str): result += '"' + str(field).replace('"','\\"') + '"'
@@ -404,6 +428,10 @@ class _BibleBooksCodesConverter:
                 return result
             # end of convertEntry
 
+            fieldNames = [] # In the order that they're declared in the structure
+            for declaration in structure.split(';'):
+                if declaration.strip(): fieldNames.append( declaration.split()[-1].lstrip('*').split('[')[0] )
+
             for dictKey in theDict.keys(): # Have to iterate this :(
                 fieldsCount = len( theDict[dictKey] ) + 1 # Add one since we include the key in the count
                 break # We only check the first (random) entry we get
@@ -423,10 +451,13 @@ class _BibleBooksCodesConverter:
                     cFile.write( "  {{{}, {}}},\n".format( dictKey, convertEntry(theDict[dictKey]) ) )
                 else:
                     logging.error( _("Can't handle this type of key data yet: {}").format( dictKey ) )
-            cFile.write( "]}}; // {} ({} entries)\n\n".format( dictName, len(theDict) ) )
+            cFile.write( "}}; // {} ({} entries)\n\n".format( dictName, len(theDict) ) )
+            if isinstance( dictKey, str ): # Add a perfect-hash lookup function for the string keys
+                PerfectHash.writeCLookupFunction( hFile, cFile, sorted(theDict.keys()), dictName, sortedBy )
         # end of exportPythonDict
 
         from datetime import datetime
+        import PerfectHash
 
         assert( self._XMLtree )
         self.importDataToPython()
@@ -455,6 +486,7 @@ class _BibleBooksCodesConverter:
             myCFile.write( "//   {} {} loaded from the original XML file.\n//\n\n".format( len(self._XMLtree), self._treeTag ) )
             myHFile.write( "\n#ifndef {}\n#define {}\n\n".format( ifdefName, ifdefName ) )
             myCFile.write( '#include "{}"\n\n'.format( os.path.basename(hFilepath) ) )
+            PerfectHash.writeCHashFunction( myCFile )
 
             CHAR = "const unsigned char"
             BYTE = "const int"
@@ -475,7 +507,7 @@ class _BibleBooksCodesConverter:
                 "ByzantineAbbreviationDict":("ByzantineAbbreviation", "{}* ByzantineAbbreviation; {} referenceNumber; {} referenceAbbreviation[3+1];".format(CHAR,BYTE,CHAR) ),
                 "EnglishNameDict":("nameEnglish", "{}* nameEnglish; {} referenceNumber; {} referenceAbbreviation[3+1];".format(CHAR,BYTE,CHAR) ) }
 
-            for dictName,dictData in self.__DataDicts.items():
+            for dictName,dictData in self.__getExportDicts().items():
                 exportPythonDict( myHFile, myCFile, dictData, dictName, dictInfo[dictName][0], dictInfo[dictName][1] )
 
             myHFile.write( "#endif // {}\n\n".format( ifdefName ) )
@@ -485,6 +517,14 @@ class _BibleBooksCodesConverter:
 # end of _BibleBooksCodesConverter class
 
 
+# The book code systems that BibleBooksCodes.translate understands
+#   The values are the dictionary which is indexed by that code, and the field in the book records which holds it
+codeSystems = { "BBB":("referenceAbbreviationDict","referenceAbbreviation"), "referenceNumber":("referenceNumberDict","referenceNumber"),
+                "OSIS":("OSISAbbreviationDict","OSISAbbreviation"), "SBL":("SBLDict","SBLAbbreviation"), "Sword":("SwordAbbreviationDict","SwordAbbreviation"),
+                "Paratext":("ParatextAbbreviationDict","ParatextAbbreviation"), "ParatextNumber":("ParatextNumberDict","ParatextNumberString"),
+                "CCEL":("CCELDict","CCELNumberString"), "NET":("NETBibleAbbreviationDict","NETBibleAbbreviation"), "Byzantine":("ByzantineAbbreviationDict","ByzantineAbbreviation") }
+
+
 @singleton # Can only ever have one instance
 class BibleBooksCodes:
     """
@@ -501,13 +541,19 @@ class BibleBooksCodes:
         """
         self._bbcc = _BibleBooksCodesConverter()
         self.__DataDicts = None # We'll import into this in loadData
+        self.__translationTables = {} # Built as needed by translate
     # end of __init__
 
+    @StartupProfiler.profiledPhase( "loadData" )
     def loadData( self, XMLFilepath=None ):
         """ Loads the XML data file and imports it to dictionary format (if not done already). """
         if not self.__DataDicts: # We need to load them once -- don't do this unnecessarily
-            self._bbcc.loadAndValidate( XMLFilepath ) # Load the XML (if not done already)
-            self.__DataDicts = self._bbcc.importDataToPython() # Get the various dictionaries organised for quick lookup
+            sourceFilepaths = [ XMLFilepath if XMLFilepath is not None else os.path.join( "DataFiles", "BibleBooksCodes.xml" ), __file__ ]
+            self.__DataDicts = DataCache.loadSnapshot( "BibleBooksCodes", sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+            if self.__DataDicts is None:
+                self._bbcc.loadAndValidate( XMLFilepath ) # Load the XML (if not done already)
+                self.__DataDicts = self._bbcc.importDataToPython() # Get the various dictionaries organised for quick lookup
+                DataCache.saveSnapshot( "BibleBooksCodes", sourceFilepaths, self.__DataDicts )
             del self._bbcc # Now the converter class (that handles the XML) is no longer needed
         return self
     # end of loadData
@@ -582,7 +628,24 @@ class BibleBooksCodes:
 
     def getBBBFromOSIS( self, osisAbbreviation ):
         """ Return the reference abbreviation strin for the given OSIS book code string. """
-        return self.__DataDicts["OSISAbbreviationDict"][osisAbbreviation][1]
+        return self.__DataDicts["OSISAbbreviationDict"][osisAbbreviation]["referenceAbbreviation"]
+
+    def translate( self, codes, fromSystem, toSystem ):
+        """
+        Returns a list of the book codes translated from one system to another,
+            e.g., translate( ['Gen','1Cor'], "OSIS", "BBB" ) returns ['GEN','CO1'].
+
+        The systems are the keys of codeSystems (e.g., "BBB", "OSIS", "Paratext", "SBL", "Sword", "CCEL", "NET", "Byzantine").
+        Codes that aren't in the fromSystem (and books which have no code in the toSystem) give None.
+        """
+        key = (fromSystem, toSystem,)
+        if key not in self.__translationTables: # Build the table the first time it's needed
+            if fromSystem not in codeSystems: raise ValueError( _("Unknown book code system '{}'").format( fromSystem ) )
+            if toSystem not in codeSystems: raise ValueError( _("Unknown book code system '{}'").format( toSystem ) )
+            toField = codeSystems[toSystem][1]
+            self.__translationTables[key] = { code:record[toField] for code,record in self.__DataDicts[codeSystems[fromSystem][0]].items() }
+        return list( map( self.__translationTables[key].get, codes ) )
+    # end of translate
 
     def getExpectedChaptersList( self, BBB ):
         """
@@ -715,6 +778,7 @@ def main():
         print( "Names for Sirach are:", bbc.getEnglishNameList_NR('SIR') )
         print( "All BBBs:", bbc.getAllReferenceAbbreviations() )
         print( "PT triples:", bbc.getAllParatextBooksCodeNumberTriples() )
+        print( "OSIS to Paratext:", bbc.translate( ["Gen","Matt","1Cor","Rev","Xyz"], "OSIS", "Paratext" ) )
         print( "Single chapter books (and OSIS):\n  {}\n  {}".format(bbc.getSingleChapterBooksList(), bbc.getOSISSingleChapterBooksList()) )
 # end of main
 
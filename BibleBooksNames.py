@@ -4,7 +4,7 @@
 # BibleBooksNames.py
 #
 # Module handling BibleBooksNamesSystem_*.xml to produce C and Python data tables
-#   Last modified: 2011-01-25 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,18 +28,16 @@ Module handling BibleBooksNamesSystem_*.xml to produce C and Python data tables.
 """
 
 progName = "Bible Books Names Systems handler"
-versionString = "0.28"
+versionString = "0.33"
 
 
 import os, logging
 from gettext import gettext as _
 from collections import OrderedDict
-from xml.etree.cElementTree import ElementTree
 
 from singleton import singleton
-import Globals
+import Globals, DataCache, StartupProfiler, DeferredValidation
 from BibleBooksCodes import BibleBooksCodes
-from ISO_639_3_Languages import ISO_639_3_Languages
 
 
 @singleton # Can only ever have one instance
@@ -71,61 +69,97 @@ class _BibleBooksNamesSystemsConverter:
 
         # These are fields that we will fill later
         self.XMLSystems, self.__BookNamesSystemsDict, self.__expandedInputSystems = {}, {}, {}
+        self.__systemFilepaths = OrderedDict()
 
         # Get the data tables that we need for proper checking
         self.__BibleBooksCodes = BibleBooksCodes().loadData()
-        self.__ISOLanguages = ISO_639_3_Languages().loadData() if Globals.strictCheckingFlag else None
+        if Globals.strictCheckingFlag:
+            from ISO_639_3_Languages import ISO_639_3_Languages # Only needed for checking
+            self.__ISOLanguages = ISO_639_3_Languages().loadData()
+        else: self.__ISOLanguages = None
     # end of __init__
 
-    def loadSystems( self, folder=None ):
-        """
-        Load and pre-process the specified booksNames systems.
-        """
-        if not self.XMLSystems: # Only ever do this once
-            if folder==None: folder = "DataFiles/BookNames"
-            if Globals.verbosityLevel > 2: print( _("Loading book names systems from {}...").format( folder ) )
-            for filename in os.listdir( folder ):
-                filepart, extension = os.path.splitext( filename )
-                if extension.upper() == '.XML' and filepart.upper().startswith(self.filenameBase.upper()+"_"):
-                    booksNamesSystemCode = filepart[len(self.filenameBase)+1:]
-                    if Globals.verbosityLevel > 3: print( _("Loading {} books names system from {}...").format( booksNamesSystemCode, filename ) )
-                    self.XMLSystems[booksNamesSystemCode] = {}
-                    self.XMLSystems[booksNamesSystemCode]["languageCode"] = booksNamesSystemCode.split('_',1)[0]
-                    self.XMLSystems[booksNamesSystemCode]["tree"] = ElementTree().parse( os.path.join( folder, filename ) )
-                    assert( self.XMLSystems[booksNamesSystemCode]["tree"] ) # Fail here if we didn't load anything at all
-
-                    # Check and remove the header element
-                    if self.XMLSystems[booksNamesSystemCode]["tree"].tag  == self.treeTag:
-                        header = self.XMLSystems[booksNamesSystemCode]["tree"][0]
-                        if header.tag == self.headerTag:
-                            self.XMLSystems[booksNamesSystemCode]["header"] = header
-                            self.XMLSystems[booksNamesSystemCode]["tree"].remove( header )
-                            if len(header)>1:
-                                logging.info( _("Unexpected elements in header") )
-                            elif len(header)==0:
-                                logging.info( _("Missing work element in header") )
-                            else:
-                                work = header[0]
-                                if work.tag == "work":
-                                    self.XMLSystems[booksNamesSystemCode]["version"] = work.find("version").text
-                                    self.XMLSystems[booksNamesSystemCode]["date"] = work.find("date").text
-                                    self.XMLSystems[booksNamesSystemCode]["title"] = work.find("title").text
-                                else:
-                                    logging.warning( _("Missing work element in header") )
-                        else:
-                            logging.warning( _("Missing header element (looking for '{}' tag)").format( headerTag ) )
-                    else:
-                        logging.error( _("Expected to load '{}' but got '{}'").format( self.treeTag, self.XMLSystems[booksNamesSystemCode]["tree"].tag ) )
-                    bookCount = 0 # There must be an easier way to do this
-                    for subelement in self.XMLSystems[booksNamesSystemCode]["tree"]:
-                        bookCount += 1
-                    logging.info( _("    Loaded {} books").format( bookCount ) )
-
-                    if Globals.strictCheckingFlag:
-                        self.__validateSystem( booksNamesSystemCode )
+    def indexSystems( self, XMLFolder=None ):
+        """
+        Find the available books names systems (without loading them).
+        """
+        if not self.__systemFilepaths: # Only ever do this once
+            if XMLFolder==None: XMLFolder = "DataFiles/BookNames"
+            self.__XMLFolder = XMLFolder
+            filenamePrefix = self.filenameBase.upper()+"_"
+            for filepath in DataCache.getFolderFilepaths( XMLFolder, filenamePrefix ):
+                filepart, extension = os.path.splitext( os.path.basename( filepath ) )
+                self.__systemFilepaths[filepart[len(filenamePrefix):]] = filepath
+        else: # The folder must have been already indexed
+            if XMLFolder is not None and XMLFolder!=self.__XMLFolder: logging.error( _("Bible books names systems are already loaded -- your different folder of '{}' was ignored").format( XMLFolder ) )
+        return self
+    # end of indexSystems
+
+    def loadSystems( self, XMLFolder=None ):
+        """
+        Load and pre-process the specified books names systems.
+        """
+        self.indexSystems( XMLFolder )
+        if len(self.XMLSystems) < len(self.__systemFilepaths): # Only ever do this once
+            if Globals.verbosityLevel > 2: print( _("Loading books names systems from {}...").format( self.__XMLFolder ) )
+            if Globals.maxProcesses > 1: # Load and validate the files in parallel
+                codesToLoad = [code for code in self.__systemFilepaths if code not in self.XMLSystems]
+                results = Globals.runInParallel( _loadSystemInWorker, [(self.__XMLFolder, code) for code in codesToLoad] )
+                for booksNamesSystemCode, result in zip( codesToLoad, results ): # Merge them in the same order as a serial load
+                    self.XMLSystems[booksNamesSystemCode] = result
+            for booksNamesSystemCode in self.__systemFilepaths:
+                self.loadSystem( booksNamesSystemCode )
         return self
     # end of loadSystems
 
+    def loadSystem( self, booksNamesSystemCode ):
+        """
+        Load and pre-process the specified books names system
+            (which must have already been found by indexSystems).
+        """
+        if booksNamesSystemCode not in self.XMLSystems: # Only ever do this once
+            filepath = self.__systemFilepaths[booksNamesSystemCode]
+            if Globals.verbosityLevel > 3: print( _("Loading {} books names system from {}...").format( booksNamesSystemCode, filepath ) )
+            self.XMLSystems[booksNamesSystemCode] = {}
+            self.XMLSystems[booksNamesSystemCode]["languageCode"] = booksNamesSystemCode.split('_',1)[0]
+            from xml.etree.cElementTree import ElementTree # Not imported until we actually have XML to parse
+            with StartupProfiler.profilePhase( __name__, "parse" ):
+                self.XMLSystems[booksNamesSystemCode]["tree"] = ElementTree().parse( filepath )
+            assert( self.XMLSystems[booksNamesSystemCode]["tree"] ) # Fail here if we didn't load anything at all
+
+            # Check and remove the header element
+            if self.XMLSystems[booksNamesSystemCode]["tree"].tag  == self.treeTag:
+                header = self.XMLSystems[booksNamesSystemCode]["tree"][0]
+                if header.tag == self.headerTag:
+                    self.XMLSystems[booksNamesSystemCode]["header"] = header
+                    self.XMLSystems[booksNamesSystemCode]["tree"].remove( header )
+                    if len(header)>1:
+                        logging.info( _("Unexpected elements in header") )
+                    elif len(header)==0:
+                        logging.info( _("Missing work element in header") )
+                    else:
+                        work = header[0]
+                        if work.tag == "work":
+                            self.XMLSystems[booksNamesSystemCode]["version"] = work.find("version").text
+                            self.XMLSystems[booksNamesSystemCode]["date"] = work.find("date").text
+                            self.XMLSystems[booksNamesSystemCode]["title"] = work.find("title").text
+                        else:
+                            logging.warning( _("Missing work element in header") )
+                else:
+                    logging.warning( _("Missing header element (looking for '{}' tag)").format( self.headerTag ) )
+            else:
+                logging.error( _("Expected to load '{}' but got '{}'").format( self.treeTag, self.XMLSystems[booksNamesSystemCode]["tree"].tag ) )
+            bookCount = 0 # There must be an easier way to do this
+            for subelement in self.XMLSystems[booksNamesSystemCode]["tree"]:
+                bookCount += 1
+            logging.info( _("    Loaded {} books").format( bookCount ) )
+
+            if Globals.strictCheckingFlag:
+                DeferredValidation.runOrDefer( __name__, self.__validateSystem, booksNamesSystemCode )
+        return self
+    # end of loadSystem
+
+    @StartupProfiler.profiledPhase( "validate" )
     def __validateSystem( self, systemName ):
         """
         Checks for basic formatting/content errors in a Bible book name system.
@@ -269,6 +303,7 @@ class _BibleBooksNamesSystemsConverter:
             self.__expandedInputSystems[systemName] = expandBibleNamesInputs( systemName, divisionsNamesList, booknameLeadersDict, bookNamesDict, bookList )
     # end of expandInputs
 
+    @StartupProfiler.profiledPhase( "import" )
     def importDataToPython( self ):
         """
         Loads (and pivots) the data (not including the header) into suitable Python containers to use in a Python program.
@@ -505,6 +540,19 @@ class _BibleBooksNamesSystemsConverter:
 # end of _BibleBooksNamesSystemsConverter class
 
 
+def _loadSystemInWorker( arguments ):
+    """
+    Loads (and validates) a single books names system in a worker process (used by loadSystems).
+
+    Returns the loaded XML data for the system.
+    """
+    XMLFolder, booksNamesSystemCode = arguments
+    bbnsc = _BibleBooksNamesSystemsConverter().indexSystems( XMLFolder )
+    return bbnsc.loadSystem( booksNamesSystemCode ).XMLSystems[booksNamesSystemCode]
+# end of _loadSystemInWorker
+
+
+@StartupProfiler.profiledPhase( "names expansion" )
 def expandBibleNamesInputs ( systemName, divisionsNamesList, booknameLeadersDict, bookNamesDict, bookList ):
     """
     This is a helper function to expand the inputAbbreviation fields to include all unambiguous shorter abbreviations.
@@ -670,12 +718,18 @@ class BibleBooksNamesSystems:
         self.__DataDicts = self.__ExpandedDicts = None # We'll import into this in loadData
     # end of __init__
 
+    @StartupProfiler.profiledPhase( "loadData" )
     def loadData( self, XMLFilepath=None ):
         """ Loads the XML data file and imports it to dictionary format (if not done already). """
         if not self.__DataDicts: # Don't do this unnecessarily
-            self.__bbnsc.loadSystems( XMLFilepath ) # Load the XML (if not done already)
-            #self.__bbnsc.expandInputs() # Expand the inputAbbreviations to find all shorter unambiguous possibilities
-            self.__DataDicts, self.__ExpandedDicts = self.__bbnsc.importDataToPython() # Get the various dictionaries organised for quick lookup
+            sourceFilepaths = DataCache.getFolderFilepaths( XMLFilepath if XMLFilepath is not None else "DataFiles/BookNames", "BibleBooksNames_" ) + [ __file__ ]
+            result = DataCache.loadSnapshot( "BibleBooksNames", sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+            if result is None:
+                self.__bbnsc.loadSystems( XMLFilepath ) # Load the XML (if not done already)
+                #self.__bbnsc.expandInputs() # Expand the inputAbbreviations to find all shorter unambiguous possibilities
+                result = self.__bbnsc.importDataToPython()
+                DataCache.saveSnapshot( "BibleBooksNames", sourceFilepaths, result )
+            self.__DataDicts, self.__ExpandedDicts = result # Get the various dictionaries organised for quick lookup
             del self.__bbnsc # Now the converter class (that handles the XML) is no longer needed
         return self
     # end of loadData
@@ -4,7 +4,7 @@
 # BibleOrganizationalSystems.py
 #
 # Module handling BibleOrganizationalSystems.xml to produce C and Python data tables
-#   Last modified: 2011-01-18 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,18 +28,15 @@ Module handling BibleOrganizationalSystems.xml to produce C and Python data tabl
 """
 
 progName = "Bible Organization Systems handler"
-versionString = "0.19"
+versionString = "0.28"
 
 
-import logging, os.path
+import logging, os.path, gc
 from gettext import gettext as _
 from collections import OrderedDict
-from xml.etree.cElementTree import ElementTree
 
-from singleton import singleton
-import Globals
-from ISO_639_3_Languages import ISO_639_3_Languages
-from BibleBooksCodes import BibleBooksCodes
+from singleton import singleton, getRegisteredSingletons
+import Globals, DataCache, StartupProfiler, DeferredValidation
 from BibleBookOrders import BibleBookOrderSystems, BibleBookOrderSystem
 from BiblePunctuationSystems import BiblePunctuationSystems, BiblePunctuationSystem
 from BibleVersificationSystems import BibleVersificationSystems, BibleVersificationSystem
@@ -82,6 +79,8 @@ class _BibleOrganizationalSystemsConverter:
         self.__dataDicts = None
 
         # Get the data tables that we need for proper checking
+        from ISO_639_3_Languages import ISO_639_3_Languages # Only needed for the conversion
+        from BibleBooksCodes import BibleBooksCodes
         self._ISOLanguages = ISO_639_3_Languages().loadData()
         self._BibleBooksCodes = BibleBooksCodes().loadData()
         self._BibleBookOrderSystems = BibleBookOrderSystems().loadData()
@@ -116,7 +115,7 @@ class _BibleOrganizationalSystemsConverter:
 
             self._load( XMLFilepath )
             if Globals.strictCheckingFlag:
-                self._validate()
+                DeferredValidation.runOrDefer( __name__, self._validate )
         return self
     # end of loadAndValidate
 
@@ -130,7 +129,9 @@ class _BibleOrganizationalSystemsConverter:
         assert( self._XMLtree is None or len(self._XMLtree)==0 ) # Make sure we're not doing this twice
 
         if Globals.verbosityLevel > 2: print( _("Loading BibleOrganisationalSystems XML file from '{}'...").format( self.XMLFilepath ) )
-        self._XMLtree = ElementTree().parse( self.XMLFilepath )
+        from xml.etree.cElementTree import ElementTree # Not imported until we actually have XML to parse
+        with StartupProfiler.profilePhase( __name__, "parse" ):
+            self._XMLtree = ElementTree().parse( self.XMLFilepath )
         assert( self._XMLtree ) # Fail here if we didn't load anything at all
 
         if self._XMLtree.tag  == self._treeTag:
@@ -156,6 +157,7 @@ class _BibleOrganizationalSystemsConverter:
             logging.error( _("Expected to load '{}' but got '{}'").format( self._treeTag, self._XMLtree.tag ) )
     # end of _load
 
+    @StartupProfiler.profiledPhase( "validate" )
     def _validate( self ):
         """
         Check/validate the loaded data.
@@ -229,6 +231,7 @@ class _BibleOrganizationalSystemsConverter:
                 logging.warning( _("Unexpected element: {} in record {}").format( element.tag, j ) )
     # end of _validate
 
+    @StartupProfiler.profiledPhase( "import" )
     def importDataToPython( self ):
         """
         Loads (and pivots) the data (not including the header) into suitable Python containers to use in a Python program.
@@ -447,12 +450,17 @@ class BibleOrganizationalSystems:
         self.__dataDict = self.__indexDict = self.__combinedIndexDict = None # We'll import into this in loadData
     # end of __init__
 
+    @StartupProfiler.profiledPhase( "loadData" )
     def loadData( self, XMLFilepath=None ):
         """ Loads the XML data file and imports it to dictionary format (if not done already). """
         if not self.__dataDict or not self.__indexDict: # Don't do this unnecessarily
             if XMLFilepath is not None: logging.warning( _("Bible books codes are already loaded -- your given filepath of '{}' was ignored").format( XMLFilepath ) )
-            self.__bosc.loadAndValidate( XMLFilepath ) # Load the XML (if not done already)
-            result = self.__bosc.importDataToPython() # Get the various dictionaries organised for quick lookup
+            sourceFilepaths = [ XMLFilepath if XMLFilepath is not None else os.path.join( "DataFiles", "BibleOrganizationalSystems.xml" ), __file__ ]
+            result = DataCache.loadSnapshot( "BibleOrganizationalSystems", sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+            if result is None:
+                self.__bosc.loadAndValidate( XMLFilepath ) # Load the XML (if not done already)
+                result = self.__bosc.importDataToPython() # Get the various dictionaries organised for quick lookup
+                DataCache.saveSnapshot( "BibleOrganizationalSystems", sourceFilepaths, result )
             if result is not None:
                 self.__dataDict, self.__indexDict, self.__combinedIndexDict = result
             del self.__bosc # Now the converter class (that handles the XML) is no longer needed
@@ -631,9 +639,105 @@ class BibleOrganizationalSystem( BibleBookOrderSystem, BibleVersificationSystem,
             return BibleVersificationSystem.isValidBCVRef( self, referenceTuple, referenceString, wantErrorMessages )
         elif wantErrorMessages: logging.error( _("{} {}:{} is invalid book for reference '{}' in {} versification system for {}").format(BBB,C,V,referenceString, self.getBookOrderSystemName(),self.getOrganizationalSystemName()) )
         return False
+    # end of isValidBCVRef
+
+    def validateMany( self, references ):
+        """
+        Validates a list (or array) of references or verse ordinals (using this system's book order) in one pass.
+
+        See BibleVersificationSystem.validateMany for the returned mask and list of failure reasons.
+        """
+        return BibleVersificationSystem.validateMany( self, references, self )
+    # end of validateMany
 # end of BibleOrganizationalSystem class
 
 
+# The values are (moduleName, className) so that the modules are only imported if they're warmed up
+warmUpSingletons = OrderedDict( [ ("languages",("ISO_639_3_Languages","ISO_639_3_Languages")), ("codes",("BibleBooksCodes","BibleBooksCodes")),
+                    ("orders",("BibleBookOrders","BibleBookOrderSystems")), ("versification",("BibleVersificationSystems","BibleVersificationSystems")),
+                    ("punctuation",("BiblePunctuationSystems","BiblePunctuationSystems")), ("names",("BibleBooksNames","BibleBooksNamesSystems")),
+                    ("orgs",("BibleOrganizationalSystems","BibleOrganizationalSystems")) ] )
+
+def _getWarmUpSingleton( name ):
+    """ Imports (if necessary) and returns the singleton class for the name in warmUpSingletons. """
+    import importlib
+    moduleName, className = warmUpSingletons[name]
+    return getattr( importlib.import_module( moduleName ), className )
+# end of _getWarmUpSingleton
+
+def warmUp( names=None, parallel=True ):
+    """
+    Loads the data for the named singletons (default is all of the names in warmUpSingletons)
+        so that it's ready before it's needed (e.g., before a server starts taking requests).
+
+    If parallel is True, independent singletons are loaded at the same time in separate threads.
+        (The singleton locks make sure that nothing is loaded twice, even if one singleton depends on another.)
+
+    Returns a dictionary of the loaded singleton objects by name.
+    """
+    if names is None: names = list( warmUpSingletons.keys() )
+    for name in names:
+        if name not in warmUpSingletons: raise KeyError( _("Unknown singleton name '{}' (expected one of {})").format( name, list(warmUpSingletons.keys()) ) )
+
+    results = OrderedDict()
+    if parallel and len(names) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor( max_workers=len(names) ) as executor:
+            futures = [ (name, executor.submit( lambda singletonClass: singletonClass().loadData(), _getWarmUpSingleton( name ) )) for name in names ]
+            for name, future in futures: results[name] = future.result() # This will raise any exception from the thread
+    else:
+        for name in names: results[name] = _getWarmUpSingleton( name )().loadData()
+    return results
+# end of warmUp
+
+
+def preloadAndFreeze( names=None ):
+    """
+    Loads the data for the named singletons (default is all of them) ready for forking worker processes
+        (e.g., with forkWorkers) which then don't each have to load it themselves.
+
+    The XML converter objects are discarded, the garbage is collected,
+        and then all of the remaining objects are frozen (see gc.freeze)
+        so that the garbage collector in the workers never writes to their pages.
+
+    Note that this doesn't keep the data shared between the workers:
+        each worker still updates the reference counts of the objects that it uses,
+        so the pages holding those objects are still copied into each worker that uses them.
+
+    Returns the same dictionary as warmUp.
+    """
+    wasEnabled = gc.isenabled()
+    gc.disable() # Collecting part way through the load would just scatter the surviving objects
+    try:
+        results = warmUp( names, parallel=False )
+        for singletonName, getinstance in getRegisteredSingletons().items():
+            if singletonName.endswith( "Converter" ): getinstance.discard() # We don't need the XML any more
+        gc.collect()
+    finally:
+        if wasEnabled: gc.enable()
+    gc.freeze() # Move everything into the permanent generation
+    return results
+# end of preloadAndFreeze
+
+
+def forkWorkers( numWorkers, target, args=() ):
+    """
+    Forks numWorkers processes which each call target( workerNumber, *args ).
+        Call preloadAndFreeze first so that they don't each have to load the reference data.
+
+    Returns a list of the started multiprocessing.Process objects (call their join methods to wait for them).
+    """
+    import multiprocessing
+    context = multiprocessing.get_context( "fork" ) # The workers must be forked (not spawned) to inherit the loaded data
+    processes = []
+    for workerNumber in range( numWorkers ):
+        process = context.Process( target=target, args=(workerNumber,) + tuple(args) )
+        process.start()
+        processes.append( process )
+    return processes
+# end of forkWorkers
+
+
 def main():
     """
     Main program to handle command line parameters and then run what they want.
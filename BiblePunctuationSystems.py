@@ -4,7 +4,7 @@
 # BiblePunctuationSystems.py
 #
 # Module handling BiblePunctuationSystem_*.xml to produce C and Python data tables
-#   Last modified: 2011-01-18 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,16 +28,15 @@ Module handling BiblePunctuation_*.xml to produce C and Python data tables.
 """
 
 progName = "Bible Punctuation Systems handler"
-versionString = "0.19"
+versionString = "0.24"
 
 
 import os, logging
 from gettext import gettext as _
 from collections import OrderedDict
-from xml.etree.cElementTree import ElementTree
 
 from singleton import singleton
-import Globals
+import Globals, DataCache, StartupProfiler, DeferredValidation
 
 
 @singleton # Can only ever have one instance
@@ -68,61 +67,90 @@ class _BiblePunctuationSystemsConverter:
 
 
         # These are fields that we will fill later
-        self._XMLSystems = {}
+        self._XMLSystems, self.__systemFilepaths = {}, OrderedDict()
         self._DataDict = {} # Used for import
     # end of __init__
 
-    def loadSystems( self, XMLFolder=None ):
+    def indexSystems( self, XMLFolder=None ):
         """
-        Load and pre-process the specified punctuation systems.
+        Find the available punctuation systems (without loading them).
         """
-        if not self._XMLSystems: # Only ever do this once
+        if not self.__systemFilepaths: # Only ever do this once
             if XMLFolder==None: XMLFolder = "DataFiles/PunctuationSystems"
             self.XMLFolder = XMLFolder
-            if Globals.verbosityLevel > 2: print( _("Loading punctuations systems from {}...").format( self.XMLFolder ) )
             filenamePrefix = "BIBLEPUNCTUATIONSYSTEM_"
-            for filename in os.listdir( XMLFolder ):
-                filepart, extension = os.path.splitext( filename )
-
-                if extension.upper() == '.XML' and filepart.upper().startswith(filenamePrefix):
-                    punctuationSystemCode = filepart[len(filenamePrefix):]
-                    if Globals.verbosityLevel > 3: print( _("Loading {} punctuation system from {}...").format( punctuationSystemCode, filename ) )
-                    self._XMLSystems[punctuationSystemCode] = {}
-                    self._XMLSystems[punctuationSystemCode]["tree"] = ElementTree().parse( os.path.join( XMLFolder, filename ) )
-                    assert( self._XMLSystems[punctuationSystemCode]["tree"] ) # Fail here if we didn't load anything at all
-
-                    # Check and remove the header element
-                    if self._XMLSystems[punctuationSystemCode]["tree"].tag  == self.treeTag:
-                        header = self._XMLSystems[punctuationSystemCode]["tree"][0]
-                        if header.tag == self.headerTag:
-                            self._XMLSystems[punctuationSystemCode]["header"] = header
-                            self._XMLSystems[punctuationSystemCode]["tree"].remove( header )
-                            if len(header)>1:
-                                logging.info( _("Unexpected elements in header") )
-                            elif len(header)==0:
-                                logging.info( _("Missing work element in header") )
-                            else:
-                                work = header[0]
-                                if work.tag == "work":
-                                    self._XMLSystems[punctuationSystemCode]["version"] = work.find("version").text
-                                    self._XMLSystems[punctuationSystemCode]["date"] = work.find("date").text
-                                    self._XMLSystems[punctuationSystemCode]["title"] = work.find("title").text
-                                else:
-                                    logging.warning( _("Missing work element in header") )
-                        else:
-                            logging.warning( _("Missing header element (looking for '{}' tag)").format( headerTag ) )
-                    else:
-                        logging.error( _("Expected to load '{}' but got '{}'").format( treeTag, self._XMLSystems[punctuationSystemCode]["tree"].tag ) )
-                    bookCount = 0 # There must be an easier way to do this
-                    for subelement in self._XMLSystems[punctuationSystemCode]["tree"]:
-                        bookCount += 1
-                    logging.info( _("    Loaded {} books").format( bookCount ) )
-
-                    if Globals.strictCheckingFlag:
-                        self._validateSystem( self._XMLSystems[punctuationSystemCode]["tree"], punctuationSystemCode )
+            for filepath in DataCache.getFolderFilepaths( XMLFolder, filenamePrefix ):
+                filepart, extension = os.path.splitext( os.path.basename( filepath ) )
+                self.__systemFilepaths[filepart[len(filenamePrefix):]] = filepath
+        else: # The folder must have been already indexed
+            if XMLFolder is not None and XMLFolder!=self.XMLFolder: logging.error( _("Bible punctuation systems are already loaded -- your different folder of '{}' was ignored").format( XMLFolder ) )
+        return self
+    # end of indexSystems
+
+    def loadSystems( self, XMLFolder=None ):
+        """
+        Load and pre-process the specified punctuation systems.
+        """
+        self.indexSystems( XMLFolder )
+        if len(self._XMLSystems) < len(self.__systemFilepaths): # Only ever do this once
+            if Globals.verbosityLevel > 2: print( _("Loading punctuation systems from {}...").format( self.XMLFolder ) )
+            if Globals.maxProcesses > 1: # Load and validate the files in parallel
+                codesToLoad = [code for code in self.__systemFilepaths if code not in self._XMLSystems]
+                results = Globals.runInParallel( _loadSystemInWorker, [(self.XMLFolder, code) for code in codesToLoad] )
+                for punctuationSystemCode, result in zip( codesToLoad, results ): # Merge them in the same order as a serial load
+                    self._XMLSystems[punctuationSystemCode] = result
+            for punctuationSystemCode in self.__systemFilepaths:
+                self.loadSystem( punctuationSystemCode )
         return self
     # end of loadSystems
 
+    def loadSystem( self, punctuationSystemCode ):
+        """
+        Load and pre-process the specified punctuation system
+            (which must have already been found by indexSystems).
+        """
+        if punctuationSystemCode not in self._XMLSystems: # Only ever do this once
+            filepath = self.__systemFilepaths[punctuationSystemCode]
+            if Globals.verbosityLevel > 3: print( _("Loading {} punctuation system from {}...").format( punctuationSystemCode, filepath ) )
+            self._XMLSystems[punctuationSystemCode] = {}
+            from xml.etree.cElementTree import ElementTree # Not imported until we actually have XML to parse
+            with StartupProfiler.profilePhase( __name__, "parse" ):
+                self._XMLSystems[punctuationSystemCode]["tree"] = ElementTree().parse( filepath )
+            assert( self._XMLSystems[punctuationSystemCode]["tree"] ) # Fail here if we didn't load anything at all
+
+            # Check and remove the header element
+            if self._XMLSystems[punctuationSystemCode]["tree"].tag  == self.treeTag:
+                header = self._XMLSystems[punctuationSystemCode]["tree"][0]
+                if header.tag == self.headerTag:
+                    self._XMLSystems[punctuationSystemCode]["header"] = header
+                    self._XMLSystems[punctuationSystemCode]["tree"].remove( header )
+                    if len(header)>1:
+                        logging.info( _("Unexpected elements in header") )
+                    elif len(header)==0:
+                        logging.info( _("Missing work element in header") )
+                    else:
+                        work = header[0]
+                        if work.tag == "work":
+                            self._XMLSystems[punctuationSystemCode]["version"] = work.find("version").text
+                            self._XMLSystems[punctuationSystemCode]["date"] = work.find("date").text
+                            self._XMLSystems[punctuationSystemCode]["title"] = work.find("title").text
+                        else:
+                            logging.warning( _("Missing work element in header") )
+                else:
+                    logging.warning( _("Missing header element (looking for '{}' tag)").format( self.headerTag ) )
+            else:
+                logging.error( _("Expected to load '{}' but got '{}'").format( self.treeTag, self._XMLSystems[punctuationSystemCode]["tree"].tag ) )
+            bookCount = 0 # There must be an easier way to do this
+            for subelement in self._XMLSystems[punctuationSystemCode]["tree"]:
+                bookCount += 1
+            logging.info( _("    Loaded {} books").format( bookCount ) )
+
+            if Globals.strictCheckingFlag:
+                DeferredValidation.runOrDefer( __name__, self._validateSystem, self._XMLSystems[punctuationSystemCode]["tree"], punctuationSystemCode )
+        return self
+    # end of loadSystem
+
+    @StartupProfiler.profiledPhase( "validate" )
     def _validateSystem( self, punctuationTree, systemName ):
         """
         """
@@ -215,6 +243,7 @@ class _BiblePunctuationSystemsConverter:
         return result
     # end of __str__
 
+    @StartupProfiler.profiledPhase( "import" )
     def importDataToPython( self ):
         """
         Loads (and pivots) the data (not including the header) into suitable Python containers to use in a Python program.
@@ -452,6 +481,18 @@ class _BiblePunctuationSystemsConverter:
 # end of _BiblePunctuationSystemsConverter class
 
 
+def _loadSystemInWorker( arguments ):
+    """
+    Loads (and validates) a single punctuation system in a worker process (used by loadSystems).
+
+    Returns the loaded XML data for the system.
+    """
+    XMLFolder, punctuationSystemCode = arguments
+    bpsc = _BiblePunctuationSystemsConverter().indexSystems( XMLFolder )
+    return bpsc.loadSystem( punctuationSystemCode )._XMLSystems[punctuationSystemCode]
+# end of _loadSystemInWorker
+
+
 @singleton # Can only ever have one instance
 class BiblePunctuationSystems:
     """
@@ -468,12 +509,17 @@ class BiblePunctuationSystems:
         self.__Dict = None # We'll import into this in loadData
     # end of __init__
 
+    @StartupProfiler.profiledPhase( "loadData" )
     def loadData( self, XMLFolder=None ):
         """ Loads the XML data file and imports it to dictionary format (if not done already). """
         if self.__Dict is None or not self.__Dict: # Don't do this unnecessarily
             if XMLFolder is not None: logging.warning( _("Bible punctuation systems are already loaded -- your given folder of '{}' was ignored").format(XMLFolder) )
-            self.__bpsc.loadSystems( XMLFolder ) # Load the XML (if not done already)
-            self.__Dict = self.__bpsc.importDataToPython() # Get the various dictionaries organised for quick lookup
+            sourceFilepaths = DataCache.getFolderFilepaths( XMLFolder if XMLFolder is not None else "DataFiles/PunctuationSystems", "BiblePunctuationSystem_" ) + [ __file__ ]
+            self.__Dict = DataCache.loadSnapshot( "BiblePunctuationSystems", sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+            if self.__Dict is None:
+                self.__bpsc.loadSystems( XMLFolder ) # Load the XML (if not done already)
+                self.__Dict = self.__bpsc.importDataToPython() # Get the various dictionaries organised for quick lookup
+                DataCache.saveSnapshot( "BiblePunctuationSystems", sourceFilepaths, self.__Dict )
             del self.__bpsc # Now the converter class (that handles the XML) is no longer needed
         return self
     # end of loadData
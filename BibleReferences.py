@@ -4,7 +4,7 @@
 # BibleReferences.py
 #
 # Module for handling Bible references including ranges
-#   Last modified: 2011-01-20 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -61,15 +61,13 @@ OXES is different again.
 """
 
 progName = "Bible References handler"
-versionString = "0.22"
+versionString = "0.24"
 
 
 import os, logging
 from gettext import gettext as _
 
 import Globals
-from BibleBooksCodes import BibleBooksCodes
-from BibleOrganizationalSystems import BibleOrganizationalSystem
 
 
 # This is a hack because it's language dependant :(
@@ -1069,12 +1067,12 @@ class BibleReferenceList:
             haveErrors = True
 
         # See if we can find this reference in our internal list
-        for refTuple in self.referenceList:
-            if len(refTuple) == 2: # it's a range
-                startRefTuple, endRefTuple = refTuple
-                expandedList = self.__BibleOrganizationalSystem.expandCVRange( startRefTuple, endRefTuple, bookOrderSystem=self.__BibleOrganizationalSystem, wantErrorMessages=wantErrorMessages )
-                if refTuple in expandedList: return True
-            elif refTuple == refTuple: return True
+        for someRefTuple in self.referenceList:
+            if len(someRefTuple) == 2: # it's a range
+                startRefTuple, endRefTuple = someRefTuple
+                expandedRange = self.__BibleOrganizationalSystem.expandCVRange( startRefTuple, endRefTuple, bookOrderSystem=self.__BibleOrganizationalSystem, wantErrorMessages=wantErrorMessages )
+                if expandedRange is not None and refTuple in expandedRange: return True
+            elif someRefTuple == refTuple: return True
         return False
     # end of containsReferenceTuple
 
@@ -1126,11 +1124,10 @@ class BibleReferenceList:
             for refTuple in self.referenceList:
                 if len(refTuple) == 2: # it's a range
                     startRefTuple, endRefTuple = refTuple
-                    expandedList = self.__BibleOrganizationalSystem.expandCVRange( startRefTuple, endRefTuple, bookOrderSystem=self.__BibleOrganizationalSystem, wantErrorMessages=wantErrorMessages )
-                    if myRefTuple in expandedList: return True
-                    elif S is None:
-                        for refTuple in expandedList:
-                            if myRefTuple[0]==refTuple[0] and myRefTuple[1]==refTuple[1] and myRefTuple[2]==refTuple[2]: return True # Just compare BBB,C,V (not S)
+                    expandedRange = self.__BibleOrganizationalSystem.expandCVRange( startRefTuple, endRefTuple, bookOrderSystem=self.__BibleOrganizationalSystem, wantErrorMessages=wantErrorMessages )
+                    if expandedRange is None: continue
+                    if myRefTuple in expandedRange: return True
+                    elif S is None and expandedRange.containsBCV( myRefTuple ): return True # Just compare BBB,C,V (not S)
                 elif myRefTuple == refTuple: return True
                 elif S is None and myRefTuple[0]==refTuple[0] and myRefTuple[1]==refTuple[1] and myRefTuple[2]==refTuple[2]: return True # Just compare BBB,C,V (not S)
         return False
@@ -1149,6 +1146,9 @@ def demo():
 
     if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
 
+    # The classes here are given their data objects so we only need these for the demo
+    from BibleBooksCodes import BibleBooksCodes
+    from BibleOrganizationalSystems import BibleOrganizationalSystem
     BBC = BibleBooksCodes().loadData()
     BOS = BibleOrganizationalSystem( "RSV" )
     printProcessingMessages = True
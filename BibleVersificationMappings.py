@@ -0,0 +1,502 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# BibleVersificationMappings.py
+#
+# Module handling BibleVersificationMapping_*.xml to map references between versification systems
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module handling BibleVersificationMapping_*.xml to map references between versification systems.
+
+Each mapping file lists the verses of one versification system which differ from the canonical system.
+These are compiled into dense arrays over the verse ordinals (see BibleVersificationSystems.VerseOrdinalIndex)
+    so that mapping a reference is just an array lookup,
+    and mapping between any two systems just goes via the canonical system.
+
+Mappings are supplied for the Original (Hebrew/Greek), Septuagint, Vulgate and Synodal systems.
+They cover the whole-verse differences in chapter divisions and psalm numbering (including the psalm titles)
+    as far as these are shown by the verse counts in the VersificationSystems folder.
+A system without a mapping file can't be mapped (a KeyError is raised)
+    rather than being treated as though it were the same as the canonical system.
+"""
+
+progName = "Bible Versification Mappings handler"
+versionString = "0.03"
+
+
+import os, logging
+from gettext import gettext as _
+from collections import OrderedDict
+from array import array
+
+from singleton import singleton
+import Globals, DataCache, StartupProfiler, DeferredValidation
+from BibleBooksCodes import BibleBooksCodes
+from BibleVersificationSystems import BibleVersificationSystem
+
+
+canonicalSystemName = "KJV" # All of the mapping files must map from this system
+noMapping = -1 # Used in the mapping arrays for verses that have no equivalent in the other system
+
+
+def _parseVerseRange( rangeString ):
+    """
+    Returns a (Cint, startVint, endVint) tuple for a "C:V" or "C:V-V" range string.
+
+    Raises ValueError if the string can't be parsed.
+    """
+    C, verses = rangeString.split( ':' )
+    startV, dash, endV = verses.partition( '-' )
+    Cint, startVint = int(C), int(startV)
+    endVint = int(endV) if dash else startVint
+    if endVint < startVint: raise ValueError( rangeString )
+    return Cint, startVint, endVint
+# end of _parseVerseRange
+
+
+@singleton # Can only ever have one instance
+class _BibleVersificationMappingsConverter:
+    """
+    A class to handle data for Bible versification mappings.
+    """
+
+    def __init__( self ):
+        """
+        Constructor.
+        """
+        self.filenameBase = "BibleVersificationMappings"
+
+        # These fields are used for parsing the XML
+        self.treeTag = "BibleVersificationMapping"
+        self.headerTag = "header"
+        self.canonicalTag = "canonicalSystem"
+        self.mainElementTag = "map"
+
+        # These fields are used for automatically checking/validating the XML
+        self.compulsoryAttributes = ( "book", "canonical", "system", )
+        self.optionalAttributes = ()
+
+        # These are fields that we will fill later
+        self.XMLSystems, self.__DataDict, self.__systemFilepaths = {}, {}, OrderedDict()
+
+        # Make sure we have the bible books codes data loaded and available
+        self.BibleBooksCodes = BibleBooksCodes().loadData()
+    # end of __init__
+
+    def indexSystems( self, XMLFolder=None ):
+        """
+        Find the available versification mappings (without loading them).
+        """
+        if not self.__systemFilepaths: # Only ever do this once
+            if XMLFolder==None: XMLFolder = "DataFiles/VersificationMappings"
+            self.__XMLFolder = XMLFolder
+            filenamePrefix = "BIBLEVERSIFICATIONMAPPING_"
+            for filepath in DataCache.getFolderFilepaths( XMLFolder, filenamePrefix ):
+                filepart, extension = os.path.splitext( os.path.basename( filepath ) )
+                self.__systemFilepaths[filepart[len(filenamePrefix):]] = filepath
+        else: # The folder must have been already indexed
+            if XMLFolder is not None and XMLFolder!=self.__XMLFolder: logging.error( _("Bible versification mappings are already loaded -- your different folder of '{}' was ignored").format( XMLFolder ) )
+        return self
+    # end of indexSystems
+
+    def loadSystems( self, XMLFolder=None ):
+        """
+        Load and pre-process the versification mappings.
+        """
+        self.indexSystems( XMLFolder )
+        if len(self.XMLSystems) < len(self.__systemFilepaths): # Only ever do this once
+            if Globals.verbosityLevel > 2: print( _("Loading versification mappings from {}...").format( self.__XMLFolder ) )
+            for versificationSystemCode in self.__systemFilepaths:
+                self.loadSystem( versificationSystemCode )
+        return self
+    # end of loadSystems
+
+    def loadSystem( self, versificationSystemCode ):
+        """
+        Load and pre-process the mapping for the specified versification system
+            (which must have already been found by indexSystems).
+        """
+        if versificationSystemCode not in self.XMLSystems: # Only ever do this once
+            filepath = self.__systemFilepaths[versificationSystemCode]
+            if Globals.verbosityLevel > 3: print( _("Loading {} versification mapping from {}...").format( versificationSystemCode, filepath ) )
+            self.XMLSystems[versificationSystemCode] = {}
+            from xml.etree.cElementTree import ElementTree # Not imported until we actually have XML to parse
+            with StartupProfiler.profilePhase( __name__, "parse" ):
+                self.XMLSystems[versificationSystemCode]["tree"] = ElementTree().parse( filepath )
+            assert( self.XMLSystems[versificationSystemCode]["tree"] ) # Fail here if we didn't load anything at all
+
+            # Check and remove the header and canonicalSystem elements
+            if self.XMLSystems[versificationSystemCode]["tree"].tag  == self.treeTag:
+                header = self.XMLSystems[versificationSystemCode]["tree"][0]
+                if header.tag == self.headerTag:
+                    self.XMLSystems[versificationSystemCode]["header"] = header
+                    self.XMLSystems[versificationSystemCode]["tree"].remove( header )
+                    if len(header)>1:
+                        logging.info( _("Unexpected elements in header") )
+                    elif len(header)==0:
+                        logging.info( _("Missing work element in header") )
+                    else:
+                        work = header[0]
+                        if work.tag == "work":
+                            self.XMLSystems[versificationSystemCode]["version"] = work.find("version").text
+                            self.XMLSystems[versificationSystemCode]["date"] = work.find("date").text
+                            self.XMLSystems[versificationSystemCode]["title"] = work.find("title").text
+                        else:
+                            logging.warning( _("Missing work element in header") )
+                else:
+                    logging.warning( _("Missing header element (looking for '{}' tag)").format( self.headerTag ) )
+                canonical = self.XMLSystems[versificationSystemCode]["tree"].find( self.canonicalTag )
+                if canonical is not None:
+                    self.XMLSystems[versificationSystemCode]["canonicalSystem"] = canonical.text
+                    self.XMLSystems[versificationSystemCode]["tree"].remove( canonical )
+                else:
+                    logging.error( _("Missing {} element in {} versification mapping").format( self.canonicalTag, versificationSystemCode ) )
+            else:
+                logging.error( _("Expected to load '{}' but got '{}'").format( self.treeTag, self.XMLSystems[versificationSystemCode]["tree"].tag ) )
+            logging.info( _("    Loaded {} mappings").format( len(self.XMLSystems[versificationSystemCode]["tree"]) ) )
+
+            if Globals.strictCheckingFlag:
+                DeferredValidation.runOrDefer( __name__, self.__validateSystem, self.XMLSystems[versificationSystemCode]["tree"], versificationSystemCode )
+        return self
+    # end of loadSystem
+
+    @StartupProfiler.profiledPhase( "validate" )
+    def __validateSystem( self, mappingTree, systemName ):
+        """ Do a semi-automatic check of the XML file validity. """
+        assert( mappingTree )
+
+        for k,element in enumerate(mappingTree):
+            if element.tag == self.mainElementTag:
+                # Check compulsory attributes on this main element
+                for attributeName in self.compulsoryAttributes:
+                    attributeValue = element.get( attributeName )
+                    if attributeValue is None:
+                        logging.error( _("Compulsory '{}' attribute is missing from {} element in record {} for {}").format( attributeName, element.tag, k, systemName ) )
+                    elif not attributeValue:
+                        logging.warning( _("Compulsory '{}' attribute is blank on {} element in record {} for {}").format( attributeName, element.tag, k, systemName ) )
+
+                # Check for unexpected additional attributes on this main element
+                for attributeName in element.keys():
+                    attributeValue = element.get( attributeName )
+                    if attributeName not in self.compulsoryAttributes and attributeName not in self.optionalAttributes:
+                        logging.warning( _("Additional '{}' attribute ('{}') found on {} element in record {} for {}").format( attributeName, attributeValue, element.tag, k, systemName ) )
+
+                # Check for unexpected subelements
+                if len(element):
+                    logging.warning( _("Unexpected subelements found on {} element in record {} for {}").format( element.tag, k, systemName ) )
+            else:
+                logging.warning( _("Unexpected element: {} in record {} for {}").format( element.tag, k, systemName ) )
+    # end of __validateSystem
+
+    def __str__( self ):
+        """
+        This method returns the string representation of a Bible versification mappings converter.
+
+        @return: the name of a Bible object formatted as a string
+        @rtype: string
+        """
+        result = "_BibleVersificationMappingsConverter object"
+        result += ('\n' if result else '') + "  Num versification mappings loaded = {}".format( len(self.XMLSystems) )
+        return result
+    # end of __str__
+
+    def __len__( self ):
+        """ Returns the number of mappings loaded. """
+        return len( self.XMLSystems )
+    # end of __len__
+
+    @StartupProfiler.profiledPhase( "import" )
+    def importDataToPython( self ):
+        """
+        Loads (and pivots) the data (not including the header) into suitable Python containers to use in a Python program.
+
+        Returns an OrderedDict (indexed by versification system name) of lists of
+            (BBB, (canonicalCint, startVint, endVint), (systemCint, startVint, endVint)) mappings.
+        """
+        assert( self.XMLSystems )
+        if self.__DataDict: # We've already done an import/restructuring -- no need to repeat it
+            return self.__DataDict
+
+        # We'll create a number of dictionaries
+        self.__DataDict = OrderedDict()
+        for versificationSystemCode in self.XMLSystems.keys():
+            if self.XMLSystems[versificationSystemCode].get( "canonicalSystem" ) != canonicalSystemName:
+                logging.error( _("Ignored {} versification mapping because it doesn't map from {}").format( versificationSystemCode, canonicalSystemName ) )
+                continue
+            mappings = []
+            for mapElement in self.XMLSystems[versificationSystemCode]["tree"]:
+                BBB = mapElement.get( "book" )
+                if not self.BibleBooksCodes.isValidReferenceAbbreviation( BBB ):
+                    logging.error( _("Unrecognized '{}' book abbreviation in '{}' versification mapping").format( BBB, versificationSystemCode ) )
+                    continue
+                try: canonicalRange, systemRange = _parseVerseRange( mapElement.get( "canonical" ) ), _parseVerseRange( mapElement.get( "system" ) )
+                except ValueError:
+                    logging.error( _("Unable to understand {} mapping from '{}' to '{}' in '{}' versification mapping").format( BBB, mapElement.get( "canonical" ), mapElement.get( "system" ), versificationSystemCode ) )
+                    continue
+                if canonicalRange[2]-canonicalRange[1] != systemRange[2]-systemRange[1]:
+                    logging.error( _("{} mapping from '{}' to '{}' has different numbers of verses in '{}' versification mapping").format( BBB, mapElement.get( "canonical" ), mapElement.get( "system" ), versificationSystemCode ) )
+                    continue
+                mappings.append( (BBB, canonicalRange, systemRange,) )
+            self.__DataDict[versificationSystemCode] = mappings
+        return self.__DataDict
+    # end of importDataToPython
+# end of _BibleVersificationMappingsConverter class
+
+
+@singleton # Can only ever have one instance
+class BibleVersificationMappings:
+    """
+    Class for handling Bible versification mappings.
+
+    This class doesn't deal at all with XML, only with Python dictionaries, etc.
+
+    Note: BBB is used in this class to represent the three-character referenceAbbreviation.
+    """
+
+    def __init__( self ): # We can't give this parameters because of the singleton
+        """
+        Constructor:
+        """
+        self._bvmc = _BibleVersificationMappingsConverter()
+        self.__DataDict = None # We'll import into this in loadData
+        self.__canonicalArrays = {} # Compiled as needed by getCanonicalArrays (keyed by system name)
+    # end of __init__
+
+    @StartupProfiler.profiledPhase( "loadData" )
+    def loadData( self, folder=None ):
+        """
+        Loads the XML data files and imports them to dictionary format (if not done already).
+        """
+        if self.__DataDict is None: # Don't do this unnecessarily
+            sourceFilepaths = DataCache.getFolderFilepaths( folder if folder is not None else "DataFiles/VersificationMappings", "BibleVersificationMapping_" ) + [ __file__ ]
+            self.__DataDict = DataCache.loadSnapshot( "BibleVersificationMappings", sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+            if self.__DataDict is None:
+                self._bvmc.loadSystems( folder ) # Load the XML (if not done already)
+                self.__DataDict = self._bvmc.importDataToPython() # Get the various dictionaries organised for quick lookup
+                DataCache.saveSnapshot( "BibleVersificationMappings", sourceFilepaths, self.__DataDict )
+            del self._bvmc # Now the converter class (that handles the XML) is no longer needed
+        return self
+    # end of loadData
+
+    def __str__( self ):
+        """
+        This method returns the string representation of the Bible versification mappings object.
+
+        @return: the name of a Bible object formatted as a string
+        @rtype: string
+        """
+        result = "BibleVersificationMappings object"
+        result += ('\n' if result else '') + "  " + _("Num mappings = {}").format( len(self.__DataDict) )
+        return result
+    # end of __str__
+
+    def __len__( self ):
+        """ Returns the number of mappings loaded. """
+        return len( self.__DataDict )
+    # end of __len__
+
+    def getAvailableMappingNames( self ):
+        """ Returns a list of the versification system names that have mappings to the canonical system. """
+        return [x for x in self.__DataDict]
+    # end of getAvailableMappingNames
+
+    def getMappingList( self, systemName ):
+        """
+        Returns the list of (BBB, (canonicalCint, startVint, endVint), (systemCint, startVint, endVint)) mappings
+            for the given versification system (or an empty list if there aren't any).
+        """
+        return self.__DataDict.get( systemName, [] )
+    # end of getMappingList
+
+    def getCanonicalArrays( self, systemName ):
+        """
+        Returns a pair of arrays for the given versification system (or None for the canonical system itself):
+            the first is indexed by the system's verse ordinals and gives the canonical ordinals,
+            the second is indexed by the canonical ordinals and gives the system's verse ordinals
+            (both contain noMapping for verses with no equivalent).
+
+        The ordinals use the book order of each versification system.
+        The arrays are only compiled once for each system. They're shared, so don't modify them.
+
+        Raises a KeyError if there's no mapping file for the system (see getAvailableMappingNames).
+        """
+        if systemName == canonicalSystemName: return None
+        if systemName not in self.__canonicalArrays:
+            if systemName not in self.__DataDict:
+                raise KeyError( _("No versification mapping between {} and {} (only {} can be mapped)").format( systemName, canonicalSystemName, [canonicalSystemName]+self.getAvailableMappingNames() ) )
+            self.__canonicalArrays[systemName] = self.__compileArrays( systemName )
+        return self.__canonicalArrays[systemName]
+    # end of getCanonicalArrays
+
+    def __compileArrays( self, systemName ):
+        """
+        Compiles the mapping arrays for getCanonicalArrays.
+
+        The listed mappings are done first, then all the other verses are mapped to the same reference
+            (if it exists and if neither verse has already been mapped).
+        """
+        canonicalIndex = BibleVersificationSystem( canonicalSystemName ).getVerseOrdinalIndex()
+        systemIndex = BibleVersificationSystem( systemName ).getVerseOrdinalIndex()
+        toCanonical = array( 'l', [noMapping] ) * len(systemIndex)
+        fromCanonical = array( 'l', [noMapping] ) * len(canonicalIndex)
+
+        for BBB, (canonicalCint, canonicalStartVint, canonicalEndVint), (systemCint, systemStartVint, systemEndVint) in self.getMappingList( systemName ):
+            try:
+                canonicalStart, systemStart = canonicalIndex.toOrdinalInt( BBB, canonicalCint, canonicalStartVint ), systemIndex.toOrdinalInt( BBB, systemCint, systemStartVint )
+                canonicalIndex.toOrdinalInt( BBB, canonicalCint, canonicalEndVint ); systemIndex.toOrdinalInt( BBB, systemCint, systemEndVint ) # Just check that they exist
+            except KeyError:
+                logging.error( _("{} {}:{}-{} to {}:{}-{} mapping isn't valid for the {} and {} versification systems").format( BBB, canonicalCint, canonicalStartVint, canonicalEndVint, systemCint, systemStartVint, systemEndVint, canonicalSystemName, systemName ) )
+                continue
+            for j in range( canonicalEndVint - canonicalStartVint + 1 ):
+                toCanonical[systemStart+j] = canonicalStart + j
+                fromCanonical[canonicalStart+j] = systemStart + j
+
+        mappedCanonicalOrdinals = frozenset( ordinal for ordinal in toCanonical if ordinal != noMapping )
+        for systemOrdinal, (BBB, Cint, Vint) in enumerate( systemIndex.iterateInt( 0, len(systemIndex)-1 ) ):
+            if toCanonical[systemOrdinal] != noMapping: continue # Already mapped
+            try: canonicalOrdinal = canonicalIndex.toOrdinalInt( BBB, Cint, Vint )
+            except KeyError: continue # No such verse in the canonical system
+            if canonicalOrdinal in mappedCanonicalOrdinals: continue # That reference belongs to a different verse
+            toCanonical[systemOrdinal] = canonicalOrdinal
+            fromCanonical[canonicalOrdinal] = systemOrdinal
+        return toCanonical, fromCanonical
+    # end of __compileArrays
+# end of BibleVersificationMappings class
+
+
+class BibleVersificationMapping:
+    """
+    Class for mapping references from one Bible versification system to another.
+
+    The whole mapping is compiled into a single array (indexed by the verse ordinals of the first system)
+        so mapping a batch of references is just a batch of array lookups.
+    """
+
+    def __init__( self, fromSystemName, toSystemName ):
+        """
+        Constructor: compiles the mapping between the two versification systems (via the canonical system).
+
+        Raises a KeyError if either system has no mapping to the canonical system (see BibleVersificationMappings.getCanonicalArrays).
+        """
+        self.__fromSystemName, self.__toSystemName = fromSystemName, toSystemName
+        self.__fromIndex = BibleVersificationSystem( fromSystemName ).getVerseOrdinalIndex()
+        self.__toIndex = BibleVersificationSystem( toSystemName ).getVerseOrdinalIndex()
+        if fromSystemName == toSystemName:
+            self.__mappingArray = array( 'l', range( len(self.__fromIndex) ) )
+        else:
+            bvms = BibleVersificationMappings().loadData() # Doesn't reload the XML unnecessarily :)
+            fromArrays, toArrays = bvms.getCanonicalArrays( fromSystemName ), bvms.getCanonicalArrays( toSystemName )
+            if toArrays is None: self.__mappingArray = array( 'l', fromArrays[0] ) # Mapping to the canonical system
+            elif fromArrays is None: self.__mappingArray = array( 'l', toArrays[1] ) # Mapping from the canonical system
+            else:
+                fromCanonical = toArrays[1]
+                self.__mappingArray = array( 'l', [noMapping if ordinal==noMapping else fromCanonical[ordinal] for ordinal in fromArrays[0]] )
+    # end of __init__
+
+    def __str__( self ):
+        """
+        This method returns the string representation of a Bible versification mapping.
+
+        @return: the name of a Bible object formatted as a string
+        @rtype: string
+        """
+        result = "BibleVersificationMapping object"
+        result += ('\n' if result else '') + " " + _("{} to {} Bible versification mapping").format( self.__fromSystemName, self.__toSystemName )
+        return result
+    # end of __str__
+
+    def __len__( self ):
+        """ Returns the number of verses in the first versification system. """
+        return len( self.__mappingArray )
+    # end of __len__
+
+    def getMappingArray( self ):
+        """
+        Returns the array (indexed by the verse ordinals of the first system) of verse ordinals in the second system
+            (or noMapping where there's no equivalent verse). It's shared, so don't modify it.
+        """
+        return self.__mappingArray
+    # end of getMappingArray
+
+    def mapOrdinal( self, ordinal ):
+        """ Returns the verse ordinal in the second system (or noMapping) for a verse ordinal in the first system. """
+        return self.__mappingArray[ordinal]
+    # end of mapOrdinal
+
+    def mapOrdinals( self, ordinals ):
+        """
+        Returns an array of the verse ordinals in the second system (or noMapping) for a sequence of verse ordinals in the first system.
+
+        Raises an IndexError if any of the ordinals are out of range.
+        """
+        return array( 'l', map( self.__mappingArray.__getitem__, ordinals ) )
+    # end of mapOrdinals
+
+    def mapReference( self, referenceTuple ):
+        """
+        Returns the (BBB, C, V, S) reference tuple in the second system for one in the first system
+            (or None if the reference isn't valid or has no equivalent). The S suffix is kept.
+        """
+        try: ordinal = self.__mappingArray[self.__fromIndex.toOrdinal( referenceTuple )]
+        except (KeyError, ValueError): return None
+        if ordinal == noMapping: return None
+        BBB, C, V, S = self.__toIndex.fromOrdinal( ordinal )
+        return BBB, C, V, referenceTuple[3]
+    # end of mapReference
+
+    def mapReferences( self, referenceTuples ):
+        """ Returns a list of the mapped reference tuples (see mapReference) for a sequence of reference tuples. """
+        return [self.mapReference( referenceTuple ) for referenceTuple in referenceTuples]
+    # end of mapReferences
+# end of BibleVersificationMapping class
+
+
+def main():
+    """
+    Main program to handle command line parameters and then run what they want.
+    """
+    # Handle command line parameters
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    # Demo the converter object
+    bvmc = _BibleVersificationMappingsConverter().loadSystems() # Load the XML
+    print( bvmc ) # Just print a summary
+
+    # Demo the BibleVersificationMappings object
+    bvms = BibleVersificationMappings().loadData() # Doesn't reload the XML unnecessarily :)
+    print( bvms ) # Just print a summary
+    print( _("Available mappings are: {}").format( bvms.getAvailableMappingNames() ) )
+
+    # Demo a BibleVersificationMapping object -- this is the one most likely to be wanted by a user
+    for fromSystemName, toSystemName in (("KJV","Original"), ("Original","KJV"),):
+        bvm = BibleVersificationMapping( fromSystemName, toSystemName )
+        print( bvm ) # Just print a summary
+        for referenceTuple in (('GEN','1','1',''), ('GEN','31','55',''), ('JOL','2','28','a'), ('MAL','4','6',''), ('MAL','3','24',''), ('PSA','51','1',''), ('NEH','7','68',''),):
+            print( "  {} -> {}".format( referenceTuple, bvm.mapReference( referenceTuple ) ) )
+# end of main
+
+if __name__ == '__main__':
+    main()
+# end of BibleVersificationMappings.py
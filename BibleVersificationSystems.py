@@ -4,7 +4,7 @@
 # BibleVersificationSystems.py
 #
 # Module handling BibleVersificationSystem_*.xml to produce C and Python data tables
-#   Last modified: 2011-01-26 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,16 +28,17 @@ Module handling BibleVersificationSystem_*.xml to produce C and Python data tabl
 """
 
 progName = "Bible Chapter/Verse Systems handler"
-versionString = "0.45"
+versionString = "0.65"
 
 
-import os, logging
+import os, sys, logging, hashlib, numbers, operator
 from gettext import gettext as _
 from collections import OrderedDict
-from xml.etree.cElementTree import ElementTree
+from array import array
+from bisect import bisect_right
 
 from singleton import singleton
-import Globals
+import Globals, DataCache, StartupProfiler, DeferredValidation
 from BibleBooksCodes import BibleBooksCodes
 
 
@@ -67,64 +68,97 @@ class _BibleVersificationSystemsConverter:
         self.uniqueElements = ( "nameEnglish", "referenceAbbreviation", ) + self.optionalElements
 
         # These are fields that we will fill later
-        self.XMLSystems, self.__DataDict = {}, {}
+        self.XMLSystems, self.__DataDict, self.__systemFilepaths = {}, {}, OrderedDict()
 
         # Make sure we have the bible books codes data loaded and available
         self.BibleBooksCodes = BibleBooksCodes().loadData()
     # end of __init__
 
-    def loadSystems( self, XMLFolder=None ):
+    def indexSystems( self, XMLFolder=None ):
         """
-        Load and pre-process the specified versification systems.
+        Find the available versification systems (without loading them).
         """
-        if not self.XMLSystems: # Only ever do this once
+        if not self.__systemFilepaths: # Only ever do this once
             if XMLFolder==None: XMLFolder = "DataFiles/VersificationSystems"
             self.__XMLFolder = XMLFolder
-            if Globals.verbosityLevel > 2: print( _("Loading versification systems from {}...").format( XMLFolder ) )
             filenamePrefix = "BIBLEVERSIFICATIONSYSTEM_"
-            for filename in os.listdir( XMLFolder ):
-                filepart, extension = os.path.splitext( filename )
-                if extension.upper() == '.XML' and filepart.upper().startswith(filenamePrefix):
-                    versificationSystemCode = filepart[len(filenamePrefix):]
-                    if Globals.verbosityLevel > 3: print( _("Loading{} versification system from {}...").format( versificationSystemCode, filename ) )
-                    self.XMLSystems[versificationSystemCode] = {}
-                    self.XMLSystems[versificationSystemCode]["tree"] = ElementTree().parse( os.path.join( XMLFolder, filename ) )
-                    assert( self.XMLSystems[versificationSystemCode]["tree"] ) # Fail here if we didn't load anything at all
-
-                    # Check and remove the header element
-                    if self.XMLSystems[versificationSystemCode]["tree"].tag  == self.treeTag:
-                        header = self.XMLSystems[versificationSystemCode]["tree"][0]
-                        if header.tag == self.headerTag:
-                            self.XMLSystems[versificationSystemCode]["header"] = header
-                            self.XMLSystems[versificationSystemCode]["tree"].remove( header )
-                            if len(header)>1:
-                                logging.info( _("Unexpected elements in header") )
-                            elif len(header)==0:
-                                logging.info( _("Missing work element in header") )
-                            else:
-                                work = header[0]
-                                if work.tag == "work":
-                                    self.XMLSystems[versificationSystemCode]["version"] = work.find("version").text
-                                    self.XMLSystems[versificationSystemCode]["date"] = work.find("date").text
-                                    self.XMLSystems[versificationSystemCode]["title"] = work.find("title").text
-                                else:
-                                    logging.warning( _("Missing work element in header") )
-                        else:
-                            logging.warning( _("Missing header element (looking for '{}' tag)").format( headerTag ) )
-                    else:
-                        logging.error( _("Expected to load '{}' but got '{}'").format( self.treeTag, self.XMLSystems[versificationSystemCode]["tree"].tag ) )
-                    bookCount = 0 # There must be an easier way to do this
-                    for subelement in self.XMLSystems[versificationSystemCode]["tree"]:
-                        bookCount += 1
-                    logging.info( _("    Loaded {} books").format( bookCount ) )
-
-                    if Globals.strictCheckingFlag:
-                        self._validateSystem( self.XMLSystems[versificationSystemCode]["tree"] )
-        else: # The data must have been already loaded
+            for filepath in DataCache.getFolderFilepaths( XMLFolder, filenamePrefix ):
+                filepart, extension = os.path.splitext( os.path.basename( filepath ) )
+                self.__systemFilepaths[filepart[len(filenamePrefix):]] = filepath
+        else: # The folder must have been already indexed
             if XMLFolder is not None and XMLFolder!=self.__XMLFolder: logging.error( _("Bible versification systems are already loaded -- your different folder of '{}' was ignored").format( XMLFolder ) )
         return self
+    # end of indexSystems
+
+    def getSystemFilepaths( self ):
+        """ Returns an OrderedDict of the XML filepaths indexed by versification system code. """
+        return self.__systemFilepaths
+    # end of getSystemFilepaths
+
+    def loadSystems( self, XMLFolder=None ):
+        """
+        Load and pre-process the specified versification systems.
+        """
+        self.indexSystems( XMLFolder )
+        if len(self.XMLSystems) < len(self.__systemFilepaths): # Only ever do this once
+            if Globals.verbosityLevel > 2: print( _("Loading versification systems from {}...").format( self.__XMLFolder ) )
+            if Globals.maxProcesses > 1: # Load and validate the files in parallel
+                codesToLoad = [code for code in self.__systemFilepaths if code not in self.XMLSystems]
+                results = Globals.runInParallel( _loadSystemInWorker, [(self.__XMLFolder, code) for code in codesToLoad] )
+                for versificationSystemCode, result in zip( codesToLoad, results ): # Merge them in the same order as a serial load
+                    self.XMLSystems[versificationSystemCode] = result
+            for versificationSystemCode in self.__systemFilepaths:
+                self.loadSystem( versificationSystemCode )
+        return self
     # end of loadSystems
 
+    def loadSystem( self, versificationSystemCode ):
+        """
+        Load and pre-process the specified versification system
+            (which must have already been found by indexSystems).
+        """
+        if versificationSystemCode not in self.XMLSystems: # Only ever do this once
+            filepath = self.__systemFilepaths[versificationSystemCode]
+            if Globals.verbosityLevel > 3: print( _("Loading {} versification system from {}...").format( versificationSystemCode, filepath ) )
+            self.XMLSystems[versificationSystemCode] = {}
+            from xml.etree.cElementTree import ElementTree # Not imported until we actually have XML to parse
+            with StartupProfiler.profilePhase( __name__, "parse" ):
+                self.XMLSystems[versificationSystemCode]["tree"] = ElementTree().parse( filepath )
+            assert( self.XMLSystems[versificationSystemCode]["tree"] ) # Fail here if we didn't load anything at all
+
+            # Check and remove the header element
+            if self.XMLSystems[versificationSystemCode]["tree"].tag  == self.treeTag:
+                header = self.XMLSystems[versificationSystemCode]["tree"][0]
+                if header.tag == self.headerTag:
+                    self.XMLSystems[versificationSystemCode]["header"] = header
+                    self.XMLSystems[versificationSystemCode]["tree"].remove( header )
+                    if len(header)>1:
+                        logging.info( _("Unexpected elements in header") )
+                    elif len(header)==0:
+                        logging.info( _("Missing work element in header") )
+                    else:
+                        work = header[0]
+                        if work.tag == "work":
+                            self.XMLSystems[versificationSystemCode]["version"] = work.find("version").text
+                            self.XMLSystems[versificationSystemCode]["date"] = work.find("date").text
+                            self.XMLSystems[versificationSystemCode]["title"] = work.find("title").text
+                        else:
+                            logging.warning( _("Missing work element in header") )
+                else:
+                    logging.warning( _("Missing header element (looking for '{}' tag)").format( self.headerTag ) )
+            else:
+                logging.error( _("Expected to load '{}' but got '{}'").format( self.treeTag, self.XMLSystems[versificationSystemCode]["tree"].tag ) )
+            bookCount = 0 # There must be an easier way to do this
+            for subelement in self.XMLSystems[versificationSystemCode]["tree"]:
+                bookCount += 1
+            logging.info( _("    Loaded {} books").format( bookCount ) )
+
+            if Globals.strictCheckingFlag:
+                DeferredValidation.runOrDefer( __name__, self._validateSystem, self.XMLSystems[versificationSystemCode]["tree"] )
+        return self
+    # end of loadSystem
+
+    @StartupProfiler.profiledPhase( "validate" )
     def _validateSystem( self, versificationTree ):
         """
         """
@@ -237,6 +271,69 @@ class _BibleVersificationSystemsConverter:
         return result
     # end of __str__
 
+    @StartupProfiler.profiledPhase( "import" )
+    def importSystemToPython( self, versificationSystemCode ):
+        """
+        Loads (and pivots) the data for one system (not including the header) into suitable Python containers.
+
+        Returns a 4-tuple of dictionaries: chapter data, omitted verses, combined verses, reordered verses.
+        """
+        assert( versificationSystemCode in self.XMLSystems )
+        #print( versificationSystemCode )
+        # Make the data dictionary for this versification system
+        chapterDataDict, omittedVersesDict, combinedVersesDict, reorderedVersesDict = OrderedDict(), OrderedDict(), {}, {}
+        for bookElement in self.XMLSystems[versificationSystemCode]["tree"]:
+            BBB = bookElement.find("referenceAbbreviation").text
+            #print( BBB )
+            if not self.BibleBooksCodes.isValidReferenceAbbreviation( BBB ):
+                logging.error( _("Unrecognized '{}' book abbreviation in '{}' versification system").format( BBB, versificationSystemCode ) )
+            numChapters = bookElement.find("numChapters").text # This is a string
+
+            # Check the chapter data against the expected chapters in the BibleBooksCodes data
+            if numChapters not in self.BibleBooksCodes.getExpectedChaptersList(BBB):
+                logging.info( _("Expected number of chapters for {} is {} but we got '{}' for {}").format(BBB, self.BibleBooksCodes.getExpectedChaptersList(BBB), numChapters, versificationSystemCode ) )
+
+            chapterData, omittedVersesData, combinedVersesData, reorderedVersesData = OrderedDict(), [], [], []
+            chapterData['numChapters'] = numChapters
+            for chapterElement in bookElement.findall("numVerses"):
+                chapter = chapterElement.get("chapter")
+                numVerses = chapterElement.text
+                assert( chapter not in chapterData )
+                chapterData[chapter] = numVerses
+                omittedVerses = chapterElement.get( "omittedVerses" )
+                if omittedVerses is not None:
+                    bits = omittedVerses.split(',')
+                    for bit in bits:
+                        omittedVersesData.append( (chapter, bit,) )
+                combinedVerses = chapterElement.get( "combinedVerses" )
+                if combinedVerses is not None:
+                    combinedVersesData.append( (chapter, combinedVerses,) )
+                reorderedVerses = chapterElement.get( "reorderedVerses" )
+                if reorderedVerses is not None:
+                    reorderedVersesData.append( (chapter, reorderedVerses,) )
+            # Save it by book reference abbreviation
+            #assert( BBB not in bookData )
+            #bookData[BBB] = (chapterData, omittedVersesData,)
+            if BBB in chapterDataDict:
+                logging.error( _("Duplicate {} in {}").format( BBB, versificationSystemCode ) )
+            chapterDataDict[BBB] = chapterData
+            if BBB in omittedVersesDict:
+                logging.error( _("Duplicate omitted verse data for {} in {}").format( BBB, versificationSystemCode ) )
+            omittedVersesDict[BBB] = omittedVersesData
+            combinedVersesDict[BBB] = combinedVersesData
+            reorderedVersesDict[BBB] = reorderedVersesData
+        return chapterDataDict, omittedVersesDict, combinedVersesDict, reorderedVersesDict
+    # end of importSystemToPython
+
+    def releaseSystem( self, versificationSystemCode ):
+        """
+        Forgets the loaded XML for the specified versification system
+            (used in lazy mode once the system has been imported, so that the tree can be garbage collected).
+        A later loadSystem call will load the file again.
+        """
+        self.XMLSystems.pop( versificationSystemCode, None )
+    # end of releaseSystem
+
     def importDataToPython( self ):
         """
         Loads (and pivots) the data (not including the header) into suitable Python containers to use in a Python program.
@@ -247,77 +344,22 @@ class _BibleVersificationSystemsConverter:
 
         # We'll create a number of dictionaries
         self.__DataDict = {}
+        fingerprintIndex = _VersificationFingerprintIndex() # Used for finding duplicate systems
         for versificationSystemCode in self.XMLSystems.keys():
-            #print( versificationSystemCode )
-            # Make the data dictionary for this versification system
-            chapterDataDict, omittedVersesDict, combinedVersesDict, reorderedVersesDict = OrderedDict(), OrderedDict(), {}, {}
-            for bookElement in self.XMLSystems[versificationSystemCode]["tree"]:
-                BBB = bookElement.find("referenceAbbreviation").text
-                #print( BBB )
-                if not self.BibleBooksCodes.isValidReferenceAbbreviation( BBB ):
-                    logging.error( _("Unrecognized '{}' book abbreviation in '{}' versification system").format( BBB, versificationSystemCode ) )
-                numChapters = bookElement.find("numChapters").text # This is a string
-
-                # Check the chapter data against the expected chapters in the BibleBooksCodes data
-                if numChapters not in self.BibleBooksCodes.getExpectedChaptersList(BBB):
-                    logging.info( _("Expected number of chapters for {} is {} but we got '{}' for {}").format(BBB, self.BibleBooksCodes.getExpectedChaptersList(BBB), numChapters, versificationSystemCode ) )
-
-                chapterData, omittedVersesData, combinedVersesData, reorderedVersesData = OrderedDict(), [], [], []
-                chapterData['numChapters'] = numChapters
-                for chapterElement in bookElement.findall("numVerses"):
-                    chapter = chapterElement.get("chapter")
-                    numVerses = chapterElement.text
-                    assert( chapter not in chapterData )
-                    chapterData[chapter] = numVerses
-                    omittedVerses = chapterElement.get( "omittedVerses" )
-                    if omittedVerses is not None:
-                        bits = omittedVerses.split(',')
-                        for bit in bits:
-                            omittedVersesData.append( (chapter, bit,) )
-                    combinedVerses = chapterElement.get( "combinedVerses" )
-                    if combinedVerses is not None:
-                        combinedVersesData.append( (chapter, combinedVerses,) )
-                    reorderedVerses = chapterElement.get( "reorderedVerses" )
-                    if reorderedVerses is not None:
-                        reorderedVersesData.append( (chapter, reorderedVerses,) )
-                # Save it by book reference abbreviation
-                #assert( BBB not in bookData )
-                #bookData[BBB] = (chapterData, omittedVersesData,)
-                if BBB in chapterDataDict:
-                    logging.error( _("Duplicate {} in {}").format( BBB, versificationSystemCode ) )
-                chapterDataDict[BBB] = chapterData
-                if BBB in omittedVersesDict:
-                    logging.error( _("Duplicate omitted verse data for {} in {}").format( BBB, versificationSystemCode ) )
-                omittedVersesDict[BBB] = omittedVersesData
-                combinedVersesDict[BBB] = combinedVersesData
-                reorderedVersesDict[BBB] = reorderedVersesData
+            chapterDataDict, omittedVersesDict, combinedVersesDict, reorderedVersesDict = self.importSystemToPython( versificationSystemCode )
 
             if Globals.strictCheckingFlag: # check for duplicates
-                for checkSystemCode in self.__DataDict:
-                    checkChapterDataDict, checkOmittedVersesDict, checkCombinedVersesDict, checkReorderedVersesDict = self.__DataDict[checkSystemCode]
-                    if checkChapterDataDict==chapterDataDict:
-                        if checkOmittedVersesDict==omittedVersesDict:
-                            logging.error( _("{} and {} versification systems are exactly identical").format( versificationSystemCode, checkSystemCode ) )
-                        else: # only the omitted verse lists differ
-                            logging.warning( _("{} and {} versification systems are mostly identical (omitted verse lists differ)").format( versificationSystemCode, checkSystemCode ) )
-                    else: # check if one is the subset of the other
-                        BBBcombinedSet = set( checkChapterDataDict.keys() ) or set( chapterDataDict.keys() )
-                        different, numCommon = False, 0
-                        for BBB in BBBcombinedSet:
-                            if BBB in checkChapterDataDict and BBB in chapterDataDict: # This book is in both
-                                numCommon += 1
-                                if checkChapterDataDict[BBB] != chapterDataDict[BBB]: different = True
-                        if not different:
-                            different2, numCommon2 = False, 0
-                            for BBB in BBBcombinedSet:
-                                if BBB in checkOmittedVersesDict and BBB in omittedVersesDict: # This book is in both
-                                    numCommon2 += 1
-                                    if checkOmittedVersesDict[BBB] != omittedVersesDict[BBB]: different2 = True
-                            if not different2:
-                                logging.warning( _("The {} common books in {} ({}) and {} ({}) versification systems are exactly identical").format( numCommon, versificationSystemCode, len(chapterDataDict), checkSystemCode, len(checkChapterDataDict) ) )
-                            else: # only the omitted verse lists differ
-                                logging.warning( _("The {} common books in {} ({}) and {} ({}) versification systems are mostly identical (omitted verse lists differ)").format( numCommon, versificationSystemCode, len(chapterDataDict), checkSystemCode, len(checkChapterDataDict) ) )
-
+                for checkSystemCode, matchType, numCommon in fingerprintIndex.findMatches( chapterDataDict, omittedVersesDict ):
+                    if matchType == "identical":
+                        logging.error( _("{} and {} versification systems are exactly identical").format( versificationSystemCode, checkSystemCode ) )
+                    elif matchType == "omittedDiffer": # only the omitted verse lists differ
+                        logging.warning( _("{} and {} versification systems are mostly identical (omitted verse lists differ)").format( versificationSystemCode, checkSystemCode ) )
+                    elif matchType == "commonIdentical":
+                        logging.warning( _("The {} common books in {} ({}) and {} ({}) versification systems are exactly identical").format( numCommon, versificationSystemCode, len(chapterDataDict), checkSystemCode, len(self.__DataDict[checkSystemCode][0]) ) )
+                    else: # only the omitted verse lists differ
+                        assert( matchType == "commonOmittedDiffer" )
+                        logging.warning( _("The {} common books in {} ({}) and {} ({}) versification systems are mostly identical (omitted verse lists differ)").format( numCommon, versificationSystemCode, len(chapterDataDict), checkSystemCode, len(self.__DataDict[checkSystemCode][0]) ) )
+                fingerprintIndex.add( versificationSystemCode, chapterDataDict, omittedVersesDict )
 
             # Now put it into my dictionaries for easy access
             self.__DataDict[versificationSystemCode] = chapterDataDict, omittedVersesDict, combinedVersesDict, reorderedVersesDict
@@ -661,6 +703,343 @@ class _BibleVersificationSystemsConverter:
 # end of _BibleVersificationSystemsConverter class
 
 
+def _getFingerprint( data ):
+    """
+    Returns a fingerprint of the given data (which must be nested tuples of strings).
+
+    This is a SHA-1 digest of the repr of the data (rather than the builtin hash)
+        so that matching fingerprints can be safely taken to mean matching data.
+    """
+    return hashlib.sha1( repr( data ).encode( 'utf-8' ) ).digest()
+# end of _getFingerprint
+
+
+class _VersificationFingerprintIndex:
+    """
+    Class for indexing versification systems by fingerprints (digests) of their tables,
+        so that identical and overlapping systems can be found without comparing all of the tables.
+
+    Each book has a fingerprint of its chapter data and another of its omitted verses list.
+    Each system has a fingerprint made from the (ordered) fingerprints of its books.
+    """
+
+    def __init__( self ):
+        """
+        Constructor: 
+        """
+        self.__systemCodes = [] # In the order that they were added
+        self.__bookFingerprints = {} # Key is systemCode, value is a dictionary of (chapterFingerprint, omittedFingerprint) by BBB
+        self.__systemIndex = {} # Key is (chapterFingerprint, omittedFingerprint) for the whole system, value is a list of systemCodes
+        self.__bookIndex = {} # Key is (BBB, chapterFingerprint), value is a list of systemCodes
+        self.__BBBIndex = {} # Key is BBB, value is a list of systemCodes
+    # end of __init__
+
+    def __len__( self ):
+        """ Returns the number of systems indexed. """
+        return len( self.__systemCodes )
+    # end of __len__
+
+    @staticmethod
+    def getBookFingerprint( chapterData ):
+        """
+        Returns the fingerprint for the chapter data of a single book.
+
+        The chapter data is an OrderedDict (or list of 2-tuples) of chapter number strings to number of verses strings,
+            optionally preceded by a 'numChapters' entry (which is calculated if it's missing).
+        """
+        items = tuple( tuple( item ) for item in ( chapterData.items() if isinstance( chapterData, dict ) else chapterData ) )
+        if not items or items[0][0] != 'numChapters': items = (('numChapters',str(len(items))),) + items
+        return _getFingerprint( items )
+    # end of getBookFingerprint
+
+    def __getFingerprints( self, chapterDataDict, omittedVersesDict ):
+        """
+        Returns a dictionary of book fingerprints and the system fingerprint.
+        """
+        bookFingerprints = OrderedDict()
+        for BBB,chapterData in chapterDataDict.items():
+            bookFingerprints[BBB] = ( self.getBookFingerprint( chapterData ), _getFingerprint( tuple( tuple( CV ) for CV in omittedVersesDict.get( BBB, () ) ) ) )
+        systemFingerprint = ( _getFingerprint( tuple( (BBB,fingerprints[0]) for BBB,fingerprints in bookFingerprints.items() ) ),
+                                _getFingerprint( tuple( (BBB,fingerprints[1]) for BBB,fingerprints in bookFingerprints.items() ) ) )
+        return bookFingerprints, systemFingerprint
+    # end of __getFingerprints
+
+    def add( self, systemCode, chapterDataDict, omittedVersesDict ):
+        """
+        Adds a versification system to the index.
+        """
+        assert( systemCode not in self.__bookFingerprints )
+        bookFingerprints, systemFingerprint = self.__getFingerprints( chapterDataDict, omittedVersesDict )
+        self.__systemCodes.append( systemCode )
+        self.__bookFingerprints[systemCode] = bookFingerprints
+        self.__systemIndex.setdefault( systemFingerprint, [] ).append( systemCode )
+        for BBB,fingerprints in bookFingerprints.items():
+            self.__bookIndex.setdefault( (BBB,fingerprints[0]), [] ).append( systemCode )
+            self.__BBBIndex.setdefault( BBB, [] ).append( systemCode )
+    # end of add
+
+    def findMatches( self, chapterDataDict, omittedVersesDict ):
+        """
+        Finds the indexed systems that are the same as, or agree on all their common books with, the given system.
+
+        Returns a list of (systemCode, matchType, numCommonBooks) 3-tuples in the order that the systems were added,
+            where matchType is one of "identical", "omittedDiffer", "commonIdentical", or "commonOmittedDiffer".
+        """
+        bookFingerprints, systemFingerprint = self.__getFingerprints( chapterDataDict, omittedVersesDict )
+
+        # Count the books in common and the books with identical chapter data for each indexed system
+        numCommon, numSame = {}, {}
+        for BBB,fingerprints in bookFingerprints.items():
+            for systemCode in self.__BBBIndex.get( BBB, () ): numCommon[systemCode] = numCommon.get( systemCode, 0 ) + 1
+            for systemCode in self.__bookIndex.get( (BBB,fingerprints[0]), () ): numSame[systemCode] = numSame.get( systemCode, 0 ) + 1
+
+        results = []
+        for systemCode in self.__systemCodes:
+            if systemCode not in numSame or numSame[systemCode] != numCommon[systemCode]: continue # Not a match
+            checkBookFingerprints = self.__bookFingerprints[systemCode]
+            if list( checkBookFingerprints.keys() ) == list( bookFingerprints.keys() ): # The whole system matches
+                omittedSame = systemCode in self.__systemIndex.get( systemFingerprint, () )
+                results.append( (systemCode, "identical" if omittedSame else "omittedDiffer", numCommon[systemCode],) )
+            else: # Only the common books match
+                omittedSame = True
+                for BBB,fingerprints in bookFingerprints.items():
+                    if BBB in checkBookFingerprints and checkBookFingerprints[BBB][1] != fingerprints[1]:
+                        omittedSame = False; break
+                results.append( (systemCode, "commonIdentical" if omittedSame else "commonOmittedDiffer", numCommon[systemCode],) )
+        return results
+    # end of findMatches
+
+    def findSystemsWithBook( self, BBB, chapterData ):
+        """
+        Returns a list of the indexed system codes that have exactly the given chapter data for the book.
+        """
+        return list( self.__bookIndex.get( (BBB,self.getBookFingerprint( chapterData )), () ) )
+    # end of findSystemsWithBook
+# end of _VersificationFingerprintIndex class
+
+
+maxMismatchRecords = 100 # checkVersificationSystem rejects a system (and stops comparing it) after more than this many mismatches
+
+_mismatchMessages = { # The text for each kind of mismatch record (the fields are systemCode, BBB, C, and V or numVerses)
+    "book": ( "    ", lambda systemCode, BBB, C, V: _("Can't find {} bookcode in {}").format( BBB, systemCode ) ),
+    "chapter": ( "    ", lambda systemCode, BBB, C, V: _("Doesn't match '{}' system at {} chapter {} ({} verses)").format( systemCode, BBB, C, V ) ),
+    "verse": ( "    ", lambda systemCode, BBB, C, V: _("Doesn't match '{}' system at {} {} verse {}").format( systemCode, BBB, C, V ) ),
+    "notOmitted": ( "   ", lambda systemCode, BBB, C, V: _("{}:{} not omitted in {} reference versification for {}").format( C, V, systemCode, BBB ) ),
+    "omitted": ( "   ", lambda systemCode, BBB, C, V: _("{}:{} is omitted in {} reference versification for {}").format( C, V, systemCode, BBB ) ),
+    "noOmitted": ( "    ", lambda systemCode, BBB, C, V: _("No omitted verses for {} in {}").format( BBB, systemCode ) ),
+    }
+
+
+def renderMismatch( mismatch ):
+    """
+    Returns the text for a (kind, systemCode, BBB, C, V) mismatch record as found by checkVersificationSystem.
+
+    The records are kept as tuples and only rendered when they're actually printed.
+    """
+    indent, makeMessage = _mismatchMessages[mismatch[0]]
+    return indent + makeMessage( *mismatch[1:] )
+# end of renderMismatch
+
+
+def _addMaskCounts( maskCounts, counts ):
+    """
+    Adds the counts for each system mask (a dictionary of {systemMask:count})
+        to the list of counts (indexed by the system bit number).
+    """
+    for mask,count in maskCounts.items():
+        while mask:
+            lowBit = mask & -mask
+            counts[lowBit.bit_length()-1] += count
+            mask ^= lowBit
+# end of _addMaskCounts
+
+
+class _VersificationMatrix:
+    """
+    Class for comparing a versification scheme against all of the known systems at once.
+
+    Each system is given a bit number and the tables are pivoted so that, for each (BBB, chapter) column,
+        we have a bit mask of the systems with each possible number of verses.
+    So each chapter of the scheme being checked only needs one dictionary lookup and a few bitwise operations
+        to find the mismatching systems (rather than looking at each system in turn).
+    The identical masks are counted first and only then shared out to the individual systems.
+    """
+
+    def __init__( self ):
+        """
+        Constructor: 
+        """
+        self.__systemCodes = [] # In bit number order
+        self.__allMask = 0 # A bit set for every system
+        self.__bookMasks = {} # Key is BBB, value is the mask of systems with that book
+        self.__chapterMasks = {} # Key is (BBB, C), value is the mask of systems with that chapter
+        self.__countMasks = {} # Key is (BBB, C), value is a dictionary of the masks of systems by numVerses
+        self.__omittedMasks = {} # Key is (BBB, C, V), value is the mask of systems where that verse is omitted
+        self.__omittedByBook = {} # Key is BBB, value is a list of the (C, V) tuples omitted in any system
+    # end of __init__
+
+    def __len__( self ):
+        """ Returns the number of systems in the matrix. """
+        return len( self.__systemCodes )
+    # end of __len__
+
+    def add( self, systemCode, chapterDataDict, omittedVersesDict ):
+        """
+        Adds a versification system to the matrix.
+        """
+        assert( systemCode not in self.__systemCodes )
+        bit = 1 << len( self.__systemCodes )
+        self.__systemCodes.append( systemCode )
+        self.__allMask |= bit
+        for BBB,chapterData in chapterDataDict.items():
+            self.__bookMasks[BBB] = self.__bookMasks.get( BBB, 0 ) | bit
+            for C,numVerses in chapterData.items(): # Includes the numChapters entry (just as checkVersificationSystem does)
+                self.__chapterMasks[(BBB,C)] = self.__chapterMasks.get( (BBB,C), 0 ) | bit
+                countMasks = self.__countMasks.setdefault( (BBB,C), {} )
+                countMasks[numVerses] = countMasks.get( numVerses, 0 ) | bit
+        for BBB,omittedVerses in omittedVersesDict.items():
+            for C,V in omittedVerses:
+                if (BBB,C,V) not in self.__omittedMasks: self.__omittedByBook.setdefault( BBB, [] ).append( (C,V) )
+                self.__omittedMasks[(BBB,C,V)] = self.__omittedMasks.get( (BBB,C,V), 0 ) | bit
+    # end of add
+
+    def compareSystems( self, versificationScheme, omittedVerses=None, maxMismatches=None ):
+        """
+        Compares the versification scheme (and the omitted verses if given) against every system in the matrix.
+
+        The versification scheme is a dictionary (indexed by BBB) of lists of (C, numVerses) tuples or dictionaries,
+            and the omitted verses is a dictionary (indexed by BBB) of lists of (C, V) tuples
+        (which are compared as sets so any duplicates in the lists are ignored).
+        If maxMismatches is given, the counts are totalled after each book
+            and any system with more mismatches than that is rejected and not compared any further.
+        Returns a list (in the order that the systems were added) of
+            (systemCode, (bookMismatchCount, chapterMismatchCount, verseMismatchCount, omittedVerseMismatchCount), rejectedFlag) 3-tuples
+            where the counts for a rejected system only go up to the book where it was rejected.
+        """
+        numSystems = len( self.__systemCodes )
+        allCounts = [ [0] * numSystems for j in range( 4 ) ]
+        allMaskCounts = bookMaskCounts, chapterMaskCounts, verseMaskCounts, omittedMaskCounts = {}, {}, {}, {}
+        liveMask = self.__allMask # The systems that haven't been rejected yet
+        def addMask( maskCounts, mask ):
+            """ Counts a mismatch for the systems in the mask that are still live. """
+            mask &= liveMask
+            if mask: maskCounts[mask] = maskCounts.get( mask, 0 ) + 1
+        def prune():
+            """ Shares out the mask counts so far and returns the mask of the systems that are still within maxMismatches. """
+            for maskCounts, counts in zip( allMaskCounts, allCounts ):
+                _addMaskCounts( maskCounts, counts )
+                maskCounts.clear()
+            newLiveMask, mask = liveMask, liveMask
+            while mask:
+                lowBit = mask & -mask
+                j = lowBit.bit_length() - 1
+                if allCounts[0][j] + allCounts[1][j] + allCounts[2][j] + allCounts[3][j] > maxMismatches: newLiveMask ^= lowBit
+                mask ^= lowBit
+            return newLiveMask
+
+        for BBB,chapterData in versificationScheme.items():
+            bookMask = self.__bookMasks.get( BBB, 0 )
+            addMask( bookMaskCounts, self.__allMask & ~bookMask )
+            if bookMask & liveMask:
+                for C,numVerses in (chapterData.items() if isinstance( chapterData, dict ) else chapterData):
+                    chapterMask = self.__chapterMasks.get( (BBB,C), 0 )
+                    addMask( chapterMaskCounts, bookMask & ~chapterMask )
+                    if chapterMask: addMask( verseMaskCounts, chapterMask & ~self.__countMasks[(BBB,C)].get( numVerses, 0 ) )
+            if maxMismatches is not None:
+                liveMask = prune()
+                if not liveMask: break # Every system has been rejected
+
+        if omittedVerses is not None and liveMask:
+            for BBB,omittedList in omittedVerses.items():
+                omittedSet = set( omittedList ) # Some of the lists have duplicates
+                for C,V in omittedSet: # Omitted in the scheme, but not in these systems
+                    addMask( omittedMaskCounts, self.__allMask & ~self.__omittedMasks.get( (BBB,C,V), 0 ) )
+                for C,V in self.__omittedByBook.get( BBB, () ): # Omitted in these systems, but not in the scheme
+                    if (C,V) not in omittedSet: addMask( omittedMaskCounts, self.__omittedMasks[(BBB,C,V)] )
+                if maxMismatches is not None:
+                    liveMask = prune()
+                    if not liveMask: break # Every system has been rejected
+
+        for maskCounts, counts in zip( allMaskCounts, allCounts ): _addMaskCounts( maskCounts, counts )
+        return [ (systemCode, tuple( counts[j] for counts in allCounts ), not liveMask & (1<<j)) for j,systemCode in enumerate( self.__systemCodes ) ]
+    # end of compareSystems
+
+    def rankSystems( self, versificationScheme, omittedVerses=None ):
+        """
+        Compares the versification scheme (and the omitted verses if given) against every system in the matrix (see compareSystems).
+
+        Returns a list of (systemCode, bookMismatchCount, chapterMismatchCount, verseMismatchCount, omittedVerseMismatchCount) 5-tuples
+            sorted by the mismatch counts (so the best matches come first).
+        """
+        results = [ (systemCode,)+counts for systemCode, counts, rejectedFlag in self.compareSystems( versificationScheme, omittedVerses ) ]
+        return sorted( results, key=lambda result: result[1:] )
+    # end of rankSystems
+# end of _VersificationMatrix class
+
+
+def _loadSystemInWorker( arguments ):
+    """
+    Loads (and validates) a single versification system in a worker process (used by loadSystems).
+
+    Returns the loaded XML data for the system.
+    """
+    XMLFolder, versificationSystemCode = arguments
+    bvsc = _BibleVersificationSystemsConverter().indexSystems( XMLFolder )
+    return bvsc.loadSystem( versificationSystemCode ).XMLSystems[versificationSystemCode]
+# end of _loadSystemInWorker
+
+
+class _VersificationDelta:
+    """
+    Class for storing the data for a versification system as the differences from a base system
+        (see BibleVersificationSystems.useDeltaStorage).
+
+    Each of the four dictionaries (as returned by getVersificationSystem) is kept as
+        (dictionaryType, tuple of keys in order, dictionary of the entries which differ from the base system).
+    """
+    __slots__ = ( "baseSystemName", "deltas", )
+
+    def __init__( self, baseSystemName, systemData, baseSystemData ):
+        """
+        Constructor: finds the differences between the two 4-tuples of dictionaries.
+        """
+        self.baseSystemName = baseSystemName
+        self.deltas = tuple( (type(theDict), tuple(theDict), dict( (key,value) for key,value in theDict.items() if key not in baseDict or baseDict[key]!=value ))
+                                for theDict,baseDict in zip( systemData, baseSystemData ) )
+    # end of __init__
+
+    def __len__( self ):
+        """ Returns the number of entries (e.g., books) which differ from the base system. """
+        return sum( len(changes) for dictType,keys,changes in self.deltas )
+    # end of __len__
+
+    def resolve( self, baseSystemData ):
+        """
+        Returns the full 4-tuple of dictionaries for the system.
+
+        The entries which are the same as in the base system are shared with it (not copied), so don't modify them.
+        """
+        return tuple( dictType( (key, changes[key] if key in changes else baseDict[key]) for key in keys )
+                        for (dictType,keys,changes),baseDict in zip( self.deltas, baseSystemData ) )
+    # end of resolve
+# end of _VersificationDelta class
+
+
+def _getDeepSize( obj, seen ):
+    """
+    Returns the approximate number of bytes used by the object and everything that it contains
+        (not counting any objects whose ids are already in the seen set, so shared objects are only counted once).
+    """
+    if id(obj) in seen or isinstance( obj, type ): return 0
+    seen.add( id(obj) )
+    size = sys.getsizeof( obj )
+    if isinstance( obj, dict ): size += sum( _getDeepSize( key, seen ) + _getDeepSize( value, seen ) for key,value in obj.items() )
+    elif isinstance( obj, (list, tuple, set, frozenset) ): size += sum( _getDeepSize( item, seen ) for item in obj )
+    elif isinstance( obj, _VersificationDelta ): size += _getDeepSize( obj.baseSystemName, seen ) + _getDeepSize( obj.deltas, seen )
+    return size
+# end of _getDeepSize
+
+
 @singleton # Can only ever have one instance
 class BibleVersificationSystems:
     """
@@ -677,18 +1056,58 @@ class BibleVersificationSystems:
         """
         self._bvsc = _BibleVersificationSystemsConverter()
         self.__DataDict = None # We'll import into this in loadData
+        self.__systemFilepaths = None # Only used in lazy mode
+        self.__fingerprintIndex = None # Only created if needed
+        self.__versificationMatrix = None # Only created if needed
+        self.__deltaSavings = None # Only set if useDeltaStorage is used
     # end of __init__
 
-    def loadData( self, folder=None ):
-        """ Loads the XML data file and imports it to dictionary format (if not done already). """
-        if not self.__DataDict: # Don't do this unnecessarily
-            if folder is not None: logging.warning( _("Bible versification systems are already loaded -- your given folder of '{}' was ignored").format( folder ) )
-            self._bvsc.loadSystems( folder ) # Load the XML (if not done already)
-            self.__DataDict = self._bvsc.importDataToPython() # Get the various dictionaries organised for quick lookup
+    @StartupProfiler.profiledPhase( "loadData" )
+    def loadData( self, folder=None, lazy=False ):
+        """
+        Loads the XML data files and imports them to dictionary format (if not done already).
+
+        If lazy is True, the folder is only indexed here
+            and each system is loaded and imported the first time that it's requested.
+        """
+        if self.__DataDict is None and lazy: # Don't do this unnecessarily
+            self.__systemFilepaths = self._bvsc.indexSystems( folder ).getSystemFilepaths()
+            self.__DataDict = OrderedDict.fromkeys( self.__systemFilepaths ) # The values are None until each system is loaded
+        elif self.__DataDict is None: # Don't do this unnecessarily
+            sourceFilepaths = DataCache.getFolderFilepaths( folder if folder is not None else "DataFiles/VersificationSystems", "BibleVersificationSystem_" ) + [ __file__ ]
+            self.__DataDict = DataCache.loadSnapshot( "BibleVersificationSystems", sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+            if self.__DataDict is None:
+                self._bvsc.loadSystems( folder ) # Load the XML (if not done already)
+                self.__DataDict = self._bvsc.importDataToPython() # Get the various dictionaries organised for quick lookup
+                DataCache.saveSnapshot( "BibleVersificationSystems", sourceFilepaths, self.__DataDict )
             del self._bvsc # Now the converter class (that handles the XML) is no longer needed
         return self
     # end of loadData
 
+    def __loadSystem( self, systemName ):
+        """ Loads and imports a single system (used in lazy mode). """
+        with self._singletonLock: # Another thread might be loading systems at the same time
+            if self.__DataDict[systemName] is None: self.__doLoadSystem( systemName )
+    # end of __loadSystem
+
+    def __doLoadSystem( self, systemName ):
+        """ Does the actual work for __loadSystem. """
+        sourceFilepaths = [ self.__systemFilepaths[systemName], __file__ ]
+        snapshotName = "BibleVersificationSystem_" + systemName
+        result = DataCache.loadSnapshot( snapshotName, sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+        if result is None:
+            result = self._bvsc.loadSystem( systemName ).importSystemToPython( systemName )
+            self._bvsc.releaseSystem( systemName ) # We don't need to keep the XML tree now
+            DataCache.saveSnapshot( snapshotName, sourceFilepaths, result )
+        self.__DataDict[systemName] = result
+    # end of __doLoadSystem
+
+    def __loadAllSystems( self ):
+        """ Makes sure that every system is loaded (even in lazy mode). """
+        for systemName in self.__DataDict:
+            if self.__DataDict[systemName] is None: self.__loadSystem( systemName )
+    # end of __loadAllSystems
+
     def __str__( self ):
         """
         This method returns the string representation of the Bible versification systems object.
@@ -698,6 +1117,8 @@ class BibleVersificationSystems:
         """
         result = "BibleVersificationSystems object"
         result += ('\n' if result else '') + "  " + _("Num systems = {}").format( len(self.__DataDict) )
+        if self.__deltaSavings is not None:
+            result += ('\n' if result else '') + "  " + _("Num systems stored as deltas = {} (saving {} bytes)").format( sum( 1 for systemData in self.__DataDict.values() if isinstance( systemData, _VersificationDelta ) ), self.__deltaSavings )
         return result
     # end of __str__
 
@@ -716,107 +1137,243 @@ class BibleVersificationSystems:
         return systemName in self.__DataDict
     # end of isValidVersificationSystemName
 
+    def __getSystem( self, systemName ):
+        """ Returns the 4-tuple of dictionaries for the system (loading it or resolving its delta if necessary). """
+        systemData = self.__DataDict[systemName]
+        if systemData is None: # Must be in lazy mode
+            self.__loadSystem( systemName )
+            systemData = self.__DataDict[systemName]
+        if isinstance( systemData, _VersificationDelta ):
+            return systemData.resolve( self.__DataDict[systemData.baseSystemName] )
+        return systemData
+    # end of __getSystem
+
     def getVersificationSystem( self, systemName ):
         """ Returns the dictionary for the requested system. """
         if systemName in self.__DataDict:
-            return self.__DataDict[systemName]
+            return self.__getSystem( systemName )
         # else
         logging.error( _("No '{}' system in Bible Versification Systems").format( systemName ) )
-        if Globals.verbosityLevel > 2: logging.error( _("Available systems are {}").format( self.getAvailableSystemNames() ) )
+        if Globals.verbosityLevel > 2: logging.error( _("Available systems are {}").format( self.getAvailableVersificationSystemNames() ) )
     # end of getVersificationSystem
 
-    def checkVersificationSystem( self, thisSystemName, versificationSchemeToCheck, extraVerseInfo=None ):
+    def getStorageSize( self ):
+        """ Returns the approximate number of bytes used to store the data for all of the loaded systems. """
+        return _getDeepSize( self.__DataDict, set() )
+    # end of getStorageSize
+
+    def __chooseDeltaBases( self ):
+        """
+        Returns a dictionary of {systemName: baseSystemName} for useDeltaStorage.
+
+        Each system is compared with the earlier systems that are being kept in full,
+            and is stored as a delta against the one with the most identical books (if that's more than half of its books).
+        """
+        bases, fullSystemNames = {}, []
+        for systemName in self.__DataDict:
+            chapterDataDict = self.__DataDict[systemName][0]
+            bestSystemName, bestCount = None, 0
+            for baseSystemName in fullSystemNames:
+                baseChapterDataDict = self.__DataDict[baseSystemName][0]
+                count = sum( 1 for BBB,chapterData in chapterDataDict.items() if baseChapterDataDict.get( BBB ) == chapterData )
+                if count > bestCount: bestSystemName, bestCount = baseSystemName, count
+            if bestCount*2 > len(chapterDataDict): bases[systemName] = bestSystemName
+            else: fullSystemNames.append( systemName )
+        return bases
+    # end of __chooseDeltaBases
+
+    def useDeltaStorage( self, bases=None ):
+        """
+        Stores each related system as a delta against a base system (so that the identical books are only stored once).
+
+        The bases can be given as a dictionary of {systemName: baseSystemName}, otherwise they're chosen automatically.
+        The base systems themselves are always stored in full.
+        getVersificationSystem (and hence the BibleVersificationSystem class) resolves the deltas transparently.
+        The number of bytes saved is logged (and shown by __str__). This is only ever done once.
+        """
+        if self.__deltaSavings is None: # Only ever do this once
+            self.__loadAllSystems() # In case we're in lazy mode
+            sizeBefore = self.getStorageSize()
+            if bases is None: bases = self.__chooseDeltaBases()
+            baseSystemNames = set( bases.values() )
+            for systemName,baseSystemName in bases.items():
+                if systemName not in self.__DataDict or baseSystemName not in self.__DataDict or systemName in baseSystemNames or baseSystemName in bases:
+                    logging.error( _("Unable to store {} versification system as a delta against {}").format( systemName, baseSystemName ) )
+                    continue
+                self.__DataDict[systemName] = _VersificationDelta( baseSystemName, self.__DataDict[systemName], self.__DataDict[baseSystemName] )
+            self.__deltaSavings = sizeBefore - self.getStorageSize()
+            logging.info( _("Storing {} versification systems as deltas saved {} of {} bytes").format( sum( 1 for systemData in self.__DataDict.values() if isinstance( systemData, _VersificationDelta ) ), self.__deltaSavings, sizeBefore ) )
+        return self
+    # end of useDeltaStorage
+
+    def findSystemsWithBook( self, BBB, chapterData ):
+        """
+        Returns a list of the names of the systems which have exactly the given chapter data for the book.
+
+        The chapter data can be a dictionary or a list of (chapterString, numVersesString) 2-tuples
+            (optionally starting with a 'numChapters' entry like the tables returned by getVersificationSystem).
+        """
+        if self.__fingerprintIndex is None:
+            self.__loadAllSystems() # In case we're in lazy mode
+            self.__fingerprintIndex = _VersificationFingerprintIndex()
+            for systemName in self.__DataDict:
+                chapterDataDict, omittedVersesDict, combinedVersesDict, reorderedVersesDict = self.__getSystem( systemName )
+                self.__fingerprintIndex.add( systemName, chapterDataDict, omittedVersesDict )
+        return self.__fingerprintIndex.findSystemsWithBook( BBB, chapterData )
+    # end of findSystemsWithBook
+
+    def rankVersificationSystems( self, versificationSchemeToCheck, extraVerseInfo=None ):
+        """
+        Compares the given versification scheme against all the loaded systems (without printing anything).
+
+        Returns a list of (systemName, bookMismatchCount, chapterMismatchCount, verseMismatchCount, omittedVerseMismatchCount) 5-tuples
+            with the best matching systems first. The omitted verses are only compared if extraVerseInfo is given.
+        """
+        assert( versificationSchemeToCheck )
+        return self.__getVersificationMatrix().rankSystems( versificationSchemeToCheck, None if extraVerseInfo is None else extraVerseInfo["omitted"] )
+    # end of rankVersificationSystems
+
+    def __getVersificationMatrix( self ):
+        """
+        Returns the matrix of all the loaded systems used for comparing schemes (creating it if necessary).
+        """
+        if self.__versificationMatrix is None:
+            self.__loadAllSystems() # In case we're in lazy mode
+            self.__versificationMatrix = _VersificationMatrix()
+            for systemName in self.__DataDict:
+                chapterDataDict, omittedVersesDict, combinedVersesDict, reorderedVersesDict = self.__getSystem( systemName )
+                self.__versificationMatrix.add( systemName, chapterDataDict, omittedVersesDict )
+        return self.__versificationMatrix
+    # end of __getVersificationMatrix
+
+    def __iterChapterMismatches( self, versificationSystemCode, versificationSchemeToCheck ):
+        """
+        Generates the book, chapter and verse mismatches between the given scheme and the named system
+            as (kind, systemCode, BBB, C, numVerses) records (see renderMismatch).
+        """
+        CVData = self.__getSystem( versificationSystemCode )[0]
+        for BBB in versificationSchemeToCheck.keys():
+            if BBB in CVData:
+                myContainer = versificationSchemeToCheck[BBB] if isinstance(versificationSchemeToCheck[BBB],list) else versificationSchemeToCheck[BBB].items() # Handles both lists and dictionaries
+                for chapterToCheck,numVersesToCheck in myContainer:
+                    if not isinstance(chapterToCheck,str): raise Exception( "Chapter programming error" )
+                    if not isinstance(numVersesToCheck,str): raise Exception( "Verse programming error" )
+                    if chapterToCheck in CVData[BBB]: # That chapter number is in our scheme
+                        if CVData[BBB][chapterToCheck] != numVersesToCheck:
+                            yield "verse", versificationSystemCode, BBB, chapterToCheck, numVersesToCheck
+                    else: # Our scheme doesn't have that chapter number
+                        yield "chapter", versificationSystemCode, BBB, chapterToCheck, numVersesToCheck
+            else:
+                yield "book", versificationSystemCode, BBB, None, None
+    # end of __iterChapterMismatches
+
+    def __iterOmittedMismatches( self, versificationSystemCode, omittedVersesToCheck ):
+        """
+        Generates the omitted verse mismatches between the given lists and the named system
+            as (kind, systemCode, BBB, C, V) records (see renderMismatch).
+        """
+        OVData = self.__getSystem( versificationSystemCode )[1]
+        for BBB in omittedVersesToCheck.keys():
+            if BBB in OVData:
+                if OVData[BBB] == omittedVersesToCheck[BBB]: continue # Perfect match for this book
+                systemOmitted, omittedToCheck = set( OVData[BBB] ), set( omittedVersesToCheck[BBB] )
+                for C,V in OrderedDict.fromkeys( omittedVersesToCheck[BBB] ): # Ignores any duplicates
+                    if (C,V) not in systemOmitted: yield "notOmitted", versificationSystemCode, BBB, C, V
+                for C,V in OrderedDict.fromkeys( OVData[BBB] ):
+                    if (C,V) not in omittedToCheck: yield "omitted", versificationSystemCode, BBB, C, V
+            else: # We don't match
+                yield "noOmitted", versificationSystemCode, BBB, None, None
+    # end of __iterOmittedMismatches
+
+    def checkVersificationSystem( self, thisSystemName, versificationSchemeToCheck, extraVerseInfo=None, maxMismatches=None ):
         """
         Check the given versification scheme against all the loaded systems.
         Create a new versification file if it doesn't match any.
         Returns the number of matched systems (which can also be used as a True/False "matched" flag).
+
+        All the systems are compared at once (see _VersificationMatrix.compareSystems)
+            and each system is rejected (and not compared any further) as soon as it has more than maxMismatches mismatches (default maxMismatchRecords).
+        The individual mismatches are only found for the systems that need them (and are then only rendered if printed).
         """
         assert( self.__DataDict )
         assert( versificationSchemeToCheck )
+        self.__loadAllSystems() # In case we're in lazy mode
         if extraVerseInfo is None: omittedVersesToCheck, combinedVersesToCheck, reorderedVersesToCheck = {}, {}, {}
         else: omittedVersesToCheck, combinedVersesToCheck, reorderedVersesToCheck = extraVerseInfo["omitted"], extraVerseInfo["combined"], extraVerseInfo["reordered"]
+        if maxMismatches is None: maxMismatches = maxMismatchRecords
+        debugFlag = Globals.commandLineOptions is not None and Globals.commandLineOptions.debug
 
         # Make sure we have the bible books codes data loaded and available
         self.BibleBooksCodes = BibleBooksCodes().loadData()
 
-        matchedVersificationSystemCodes = []
-        systemMatchCount, systemMismatchCount, allErrors, errorSummary = 0, 0, '', ''
-        for versificationSystemCode in self.__DataDict: # Step through the various reference schemes
-            #print( system )
-            bookMismatchCount, chapterMismatchCount, verseMismatchCount, omittedVerseMismatchCount, theseErrors = 0, 0, 0, 0, ''
-            CVData, OVData, CombVData, ReordVData = self.__DataDict[versificationSystemCode]
-
-            # Check verses per chapter
-            for BBB in versificationSchemeToCheck.keys():
-                #print( BBB )
-                if BBB in CVData:
-                    myContainer = versificationSchemeToCheck[BBB] if isinstance(versificationSchemeToCheck[BBB],list) else versificationSchemeToCheck[BBB].items() # Handles both lists and dictionaries
-                    for chapterToCheck,numVersesToCheck in myContainer:
-                        if not isinstance(chapterToCheck,str): raise Exception( "Chapter programming error" )
-                        if not isinstance(numVersesToCheck,str): raise Exception( "Verse programming error" )
-                        if chapterToCheck in CVData[BBB]: # That chapter number is in our scheme
-                            if CVData[BBB][chapterToCheck] != numVersesToCheck:
-                                theseErrors += ("\n" if theseErrors else "") + "    " + _("Doesn't match '{}' system at {} {} verse {}").format( versificationSystemCode, BBB, chapterToCheck, numVersesToCheck )
-                                if bookMismatchCount==0 and chapterMismatchCount==0 and verseMismatchCount==0: rememberedBBB, rememberedChapter, rememberedVerses1, rememberedVerses2 = BBB, chapterToCheck, CVData[BBB][chapterToCheck], numVersesToCheck
-                                verseMismatchCount += 1
-                        else: # Our scheme doesn't have that chapter number
-                            theseErrors += ("\n" if theseErrors else "") + "    " + _("Doesn't match '{}' system at {} chapter {} ({} verses)").format( versificationSystemCode, BBB, chapterToCheck, numVersesToCheck )
-                            chapterMismatchCount += 1
-                else:
-                    theseErrors += ("\n" if theseErrors else "") + "    " + _("Can't find {} bookcode in {}").format( BBB, versificationSystemCode )
-                    bookMismatchCount += 1
-
-            # Check omitted verses
-            if OVData and extraVerseInfo is None:
+        comparisons = self.__getVersificationMatrix().compareSystems( versificationSchemeToCheck, None if extraVerseInfo is None else omittedVersesToCheck, maxMismatches )
+        anyMatchFlag = not all( any( counts ) for versificationSystemCode, counts, rejectedFlag in comparisons )
+        matchedVersificationSystemCodes, mismatchReports = [], []
+        for versificationSystemCode, counts, rejectedFlag in comparisons: # Step through the various reference schemes
+            if self.__getSystem( versificationSystemCode )[1] and extraVerseInfo is None:
                 logging.error( _("No omitted verse list provided to check against {}").format( versificationSystemCode ) )
-            else:
-                for BBB in omittedVersesToCheck.keys():
-                    if BBB in OVData:
-                        if OVData[BBB] == omittedVersesToCheck[BBB]: continue # Perfect match for this book
-                        for cv in omittedVersesToCheck[BBB]:
-                            if cv not in OVData[BBB]:
-                                theseErrors += ("\n" if theseErrors else "") + "   " + _("{}:{} not omitted in {} reference versification for {}").format( cv[0], cv[1], versificationSystemCode, BBB )
-                                if omittedVerseMismatchCount==0: rememberedOmission = BBB, cv[0], cv[1], thisSystemName, versificationSystemCode
-                                omittedVerseMismatchCount += 1
-                        for cv in OVData[BBB]:
-                            if cv not in omittedVersesToCheck[BBB]:
-                                theseErrors += ("\n" if theseErrors else "") + "   " + _("{}:{} is omitted in {} reference versification for {}").format( cv[0], cv[1], versificationSystemCode, BBB )
-                                if omittedVerseMismatchCount==0: rememberedOmission = BBB, cv[0], cv[1], versificationSystemCode, thisSystemName
-                                omittedVerseMismatchCount += 1
-                    else: # We don't match
-                        theseErrors += ("\n" if theseErrors else "") + "    " + _("No omitted verses for {} in {}").format( BBB, versificationSystemCode )
-                        omittedVerseMismatchCount += len( omittedVersesToCheck[BBB] )
-
-            if bookMismatchCount or chapterMismatchCount or verseMismatchCount or omittedVerseMismatchCount:
-                if omittedVersesToCheck:
-                    thisError = "    " + _("Doesn't match '{}' system ({} book mismatches, {} chapter mismatches, {} verse mismatches, {} omitted-verse mismatches)").format( versificationSystemCode, bookMismatchCount, chapterMismatchCount, verseMismatchCount,omittedVerseMismatchCount )
-                    if omittedVerseMismatchCount==1: thisError += "\n      " + _("Omitted verse mismatch was {} {}:{} omitted in {} but present in {}").format(rememberedOmission[0],rememberedOmission[1],rememberedOmission[2],rememberedOmission[3],rememberedOmission[4])
-                    elif Globals.verbosityLevel>2 and bookMismatchCount==0 and chapterMismatchCount==0 and omittedVerseMismatchCount>0: thisError += "\n      " + _("First omitted verse mismatch was {} {}:{} omitted in {} but present in {}").format(rememberedOmission[0],rememberedOmission[1],rememberedOmission[2],rememberedOmission[3],rememberedOmission[4])
-                else:
-                    thisError = "    " + _("Doesn't match '{}' system ({} book mismatches, {} chapter mismatches, {} verse mismatches)").format( versificationSystemCode, bookMismatchCount, chapterMismatchCount, verseMismatchCount )
-                if bookMismatchCount==0 and chapterMismatchCount==0 and verseMismatchCount==1: thisError += "\n      " + _("{} {} chapter {} had {} verses but {} had {}").format(thisSystemName, rememberedBBB, rememberedChapter, rememberedVerses2, versificationSystemCode, rememberedVerses1)
-                theseErrors += ("\n" if theseErrors else "") + thisError
-                if bookMismatchCount==0 or Globals.verbosityLevel>2: errorSummary += ("\n" if errorSummary else "") + thisError
-                systemMismatchCount += 1
-            else:
-                #print( "  Matches '{}' system".format( versificationSystemCode ) )
-                systemMatchCount += 1
+            if not any( counts ): # It matches
                 matchedVersificationSystemCodes.append( versificationSystemCode )
-            if Globals.commandLineOptions.debug and chapterMismatchCount==0 and 0<verseMismatchCount<8 and omittedVerseMismatchCount<10: print( theseErrors )
-            allErrors += ("\n" if allErrors else "") + theseErrors
-
+                continue
+            if rejectedFlag: # Don't look any further at this one
+                mismatchReports.append( (versificationSystemCode, counts, None, None, [], True,) )
+                continue
+            bookMismatchCount, chapterMismatchCount, verseMismatchCount, omittedVerseMismatchCount = counts
+
+            # Only find the mismatches that we need (and stop as soon as we've got enough)
+            firstVerseMismatch = firstOmittedMismatch = None
+            if bookMismatchCount==0 and chapterMismatchCount==0 and verseMismatchCount==1:
+                firstVerseMismatch = next( self.__iterChapterMismatches( versificationSystemCode, versificationSchemeToCheck ) )
+            if omittedVersesToCheck and omittedVerseMismatchCount:
+                firstOmittedMismatch = next( (mismatch for mismatch in self.__iterOmittedMismatches( versificationSystemCode, omittedVersesToCheck ) if mismatch[0]!="noOmitted"), None )
+            mismatches = []
+            if debugFlag and (not anyMatchFlag or (chapterMismatchCount==0 and 0<verseMismatchCount<8 and omittedVerseMismatchCount<10)): # We'll need to print the details
+                mismatches.extend( self.__iterChapterMismatches( versificationSystemCode, versificationSchemeToCheck ) ) # There can't be more than maxMismatches
+                if extraVerseInfo is not None: mismatches.extend( self.__iterOmittedMismatches( versificationSystemCode, omittedVersesToCheck ) )
+            mismatchReports.append( (versificationSystemCode, counts, firstVerseMismatch, firstOmittedMismatch, mismatches, False,) )
+
+        systemMatchCount, systemMismatchCount = len(matchedVersificationSystemCodes), len(mismatchReports)
+        def renderSummary( report ):
+            """ Returns the summary text for a mismatched system report. """
+            versificationSystemCode, (bookMismatchCount, chapterMismatchCount, verseMismatchCount, omittedVerseMismatchCount), firstVerseMismatch, firstOmittedMismatch, mismatches, rejectedFlag = report
+            if rejectedFlag:
+                return "    " + _("Doesn't match '{}' system (rejected after more than {} mismatches)").format( versificationSystemCode, maxMismatches )
+            if omittedVersesToCheck:
+                result = "    " + _("Doesn't match '{}' system ({} book mismatches, {} chapter mismatches, {} verse mismatches, {} omitted-verse mismatches)").format( versificationSystemCode, bookMismatchCount, chapterMismatchCount, verseMismatchCount,omittedVerseMismatchCount )
+                if firstOmittedMismatch is not None and firstOmittedMismatch[0] != "noOmitted":
+                    kind, systemCode, BBB, C, V = firstOmittedMismatch
+                    omittedIn, presentIn = (thisSystemName, systemCode) if kind=="notOmitted" else (systemCode, thisSystemName)
+                    if omittedVerseMismatchCount==1: result += "\n      " + _("Omitted verse mismatch was {} {}:{} omitted in {} but present in {}").format( BBB, C, V, omittedIn, presentIn )
+                    elif Globals.verbosityLevel>2 and bookMismatchCount==0 and chapterMismatchCount==0: result += "\n      " + _("First omitted verse mismatch was {} {}:{} omitted in {} but present in {}").format( BBB, C, V, omittedIn, presentIn )
+            else:
+                result = "    " + _("Doesn't match '{}' system ({} book mismatches, {} chapter mismatches, {} verse mismatches)").format( versificationSystemCode, bookMismatchCount, chapterMismatchCount, verseMismatchCount )
+            if firstVerseMismatch is not None:
+                kind, systemCode, BBB, C, numVerses = firstVerseMismatch
+                result += "\n      " + _("{} {} chapter {} had {} verses but {} had {}").format( thisSystemName, BBB, C, numVerses, systemCode, self.__getSystem( systemCode )[0][BBB][C] )
+            return result
+        # end of renderSummary
+        def renderReport( report ):
+            """ Returns the detailed text for a mismatched system report. """
+            return "\n".join( [renderMismatch( mismatch ) for mismatch in report[4]] + [renderSummary( report )] )
+        # end of renderReport
+
+        if debugFlag:
+            for report in mismatchReports:
+                chapterMismatchCount, verseMismatchCount, omittedVerseMismatchCount = report[1][1:]
+                if not report[5] and chapterMismatchCount==0 and 0<verseMismatchCount<8 and omittedVerseMismatchCount<10: print( renderReport( report ) )
+        summaryReports = [report for report in mismatchReports if report[1][0]==0 or Globals.verbosityLevel>2]
         if systemMatchCount == 1: # What we hope for
             print( "  " + _("{} matched {} versification (with these {} books)").format( thisSystemName, matchedVersificationSystemCodes[0], len(versificationSchemeToCheck) ) )
-            if Globals.commandLineOptions.debug: print( errorSummary )
+            if debugFlag: print( "\n".join( renderSummary( report ) for report in summaryReports ) )
         elif systemMatchCount == 0: # No matches
             print( "  " + _("{} mismatched {} versification systems (with these {} books)").format( thisSystemName, systemMismatchCount, len(versificationSchemeToCheck) ) )
-            toPrint = allErrors if Globals.commandLineOptions.debug else errorSummary
+            toPrint = "\n".join( renderReport( report ) for report in mismatchReports ) if debugFlag else "\n".join( renderSummary( report ) for report in summaryReports )
             if toPrint: print( toPrint )
         else: # Multiple matches
             print( "  " + _("{} matched {} versification system(s): {} (with these {} books)").format( thisSystemName, systemMatchCount, matchedVersificationSystemCodes, len(versificationSchemeToCheck) ) )
-            if Globals.commandLineOptions.debug: print( errorSummary )
+            if debugFlag: print( "\n".join( renderSummary( report ) for report in summaryReports ) )
 
-        if Globals.commandLineOptions.export and not systemMatchCount: # Write a new file
+        if Globals.commandLineOptions is not None and Globals.commandLineOptions.export and not systemMatchCount: # Write a new file
             outputFilepath = os.path.join( "ScrapedFiles", "BibleVersificationSystem_"+thisSystemName + ".xml" )
             if Globals.verbosityLevel > 1: print( _("Writing {} books to {}...").format( len(versificationSchemeToCheck), outputFilepath ) )
             if omittedVersesToCheck:
@@ -849,6 +1406,233 @@ class BibleVersificationSystems:
 # end of BibleVersificationSystems class
 
 
+class VerseOrdinalIndex:
+    """
+    Class for converting between (BBB, C, V) references and dense integer ordinals (0..n-1)
+        for one versification system and book order.
+
+    The ordinals count every verse 1..numVerses in every chapter of every book (in the book order),
+        so comparing or sorting references only needs integer comparisons.
+    Omitted verses still have ordinals (so that the ordinals don't depend on the omitted verse lists).
+    """
+
+    def __init__( self, versificationSystem, BBBList ):
+        """
+        Constructor: builds the cumulative chapter offsets for the books in BBBList
+            (ignoring any that aren't in the versification system).
+        """
+        self.__chapterStartsDict = {} # Arrays (indexed by chapter number) of the ordinal of verse 1 of each chapter
+        self.__chapterStarts, self.__chapterRefs = array( 'L' ), [] # For the reverse lookup (only contains chapters with verses)
+        ordinal = 0
+        for BBB in BBBList:
+            try: verseCounts = versificationSystem.getVerseCounts( BBB )
+            except KeyError: continue # The book isn't in this versification system
+            chapterStarts = array( 'L', [0] ) * len(verseCounts)
+            for Cint,numVerses in enumerate( verseCounts ):
+                chapterStarts[Cint] = ordinal
+                if numVerses:
+                    self.__chapterStarts.append( ordinal )
+                    self.__chapterRefs.append( (BBB, Cint,) )
+                    ordinal += numVerses
+            self.__chapterStartsDict[BBB] = chapterStarts, verseCounts
+        self.__numVerses = ordinal
+    # end of __init__
+
+    def __len__( self ):
+        """ Returns the number of verses (i.e., one more than the largest ordinal). """
+        return self.__numVerses
+    # end of __len__
+
+    def toOrdinalInt( self, BBB, Cint, Vint ):
+        """ Returns the ordinal for the given integer chapter and verse numbers. Raises a KeyError if the verse doesn't exist. """
+        chapterStarts, verseCounts = self.__chapterStartsDict[BBB]
+        if 0 <= Cint < len(verseCounts) and 1 <= Vint <= verseCounts[Cint]: return chapterStarts[Cint] + Vint - 1
+        raise KeyError( (BBB, Cint, Vint,) )
+    # end of toOrdinalInt
+
+    def fromOrdinalInt( self, ordinal ):
+        """ Returns a (BBB, Cint, Vint) tuple for the given ordinal. Raises an IndexError if it's out of range. """
+        if not 0 <= ordinal < self.__numVerses: raise IndexError( ordinal )
+        ix = bisect_right( self.__chapterStarts, ordinal ) - 1
+        BBB, Cint = self.__chapterRefs[ix]
+        return BBB, Cint, ordinal - self.__chapterStarts[ix] + 1
+    # end of fromOrdinalInt
+
+    def iterateInt( self, startOrdinal, endOrdinal ):
+        """ Yields (BBB, Cint, Vint) tuples for the ordinals from startOrdinal to endOrdinal (inclusive). """
+        ordinal = startOrdinal
+        ix = bisect_right( self.__chapterStarts, ordinal ) - 1
+        while ordinal <= endOrdinal:
+            BBB, Cint = self.__chapterRefs[ix]
+            chapterStart = self.__chapterStarts[ix]
+            nextChapterStart = self.__chapterStarts[ix+1] if ix+1 < len(self.__chapterStarts) else self.__numVerses
+            lastOrdinal = min( nextChapterStart-1, endOrdinal )
+            for Vint in range( ordinal-chapterStart+1, lastOrdinal-chapterStart+2 ):
+                yield BBB, Cint, Vint
+            ordinal, ix = lastOrdinal+1, ix+1
+    # end of iterateInt
+
+    def toOrdinal( self, referenceTuple ):
+        """ Returns the ordinal for the given (BBB, C, V, S) reference tuple (with string chapter and verse numbers). """
+        BBB, C, V, S = referenceTuple
+        return self.toOrdinalInt( BBB, int(C), int(V) )
+    # end of toOrdinal
+
+    def fromOrdinal( self, ordinal ):
+        """ Returns a (BBB, C, V, S) reference tuple (with string chapter and verse numbers and an empty suffix) for the given ordinal. """
+        BBB, Cint, Vint = self.fromOrdinalInt( ordinal )
+        return BBB, str(Cint), str(Vint), ''
+    # end of fromOrdinal
+# end of VerseOrdinalIndex class
+
+
+class VerseRange:
+    """
+    Class for a lazy range of verses (as returned by BibleVersificationSystem.expandCVRange).
+
+    It acts like a read-only list of (BBB, C, V, S) reference tuples (with string chapter and verse numbers)
+        but it only stores the start and end verse ordinals (see VerseOrdinalIndex)
+        so the length, membership tests and (step one) slices don't depend on the size of the range
+        and the tuples are only made as they're iterated.
+    Just like the references that the range was made from,
+        only the first and last tuples have the S suffixes.
+    """
+
+    def __init__( self, ordinalIndex, startOrdinal, endOrdinal, startSuffix='', endSuffix='' ):
+        """
+        Constructor: the range includes both the start and end ordinals (and is empty if the end is before the start).
+        """
+        self.__index = ordinalIndex
+        self.__startOrdinal, self.__endOrdinal = startOrdinal, max( endOrdinal, startOrdinal-1 )
+        self.__startSuffix, self.__endSuffix = startSuffix, endSuffix
+    # end of __init__
+
+    def __repr__( self ):
+        """ Returns a representation showing the first and last verses. """
+        if not len(self): return "VerseRange()"
+        return "VerseRange({!r} to {!r}, {} verses)".format( self[0], self[-1], len(self) )
+    # end of __repr__
+
+    def __len__( self ):
+        """ Returns the number of verses in the range. """
+        return self.__endOrdinal - self.__startOrdinal + 1
+    # end of __len__
+
+    def __getSuffix( self, ordinal ):
+        """ Returns the S suffix to go with the verse at the given ordinal. """
+        if ordinal == self.__startOrdinal: return self.__startSuffix
+        if ordinal == self.__endOrdinal: return self.__endSuffix
+        return ''
+    # end of __getSuffix
+
+    def __iter__( self ):
+        """ Yields the (BBB, C, V, S) reference tuples in order. """
+        ordinal = self.__startOrdinal
+        for BBB, Cint, Vint in self.__index.iterateInt( self.__startOrdinal, self.__endOrdinal ):
+            yield BBB, str(Cint), str(Vint), self.__getSuffix( ordinal )
+            ordinal += 1
+    # end of __iter__
+
+    def __getitem__( self, index ):
+        """
+        Returns the reference tuple at the given index
+            or a new VerseRange (or a list if the step isn't one) for a slice.
+        """
+        numVerses = len( self )
+        if isinstance( index, slice ):
+            start, stop, step = index.indices( numVerses )
+            if step != 1: return [self[j] for j in range( start, stop, step )]
+            stop = max( start, stop )
+            return VerseRange( self.__index, self.__startOrdinal+start, self.__startOrdinal+stop-1,
+                                self.__startSuffix if start==0 else '', self.__endSuffix if stop==numVerses else '' )
+        if index < 0: index += numVerses
+        if not 0 <= index < numVerses: raise IndexError( index )
+        ordinal = self.__startOrdinal + index
+        BBB, Cint, Vint = self.__index.fromOrdinalInt( ordinal )
+        return BBB, str(Cint), str(Vint), self.__getSuffix( ordinal )
+    # end of __getitem__
+
+    def __getOrdinal( self, referenceTuple ):
+        """ Returns the ordinal for the reference tuple if it's in the range, else None. """
+        try:
+            BBB, C, V, S = referenceTuple
+            ordinal = self.__index.toOrdinalInt( BBB, int(C), int(V) )
+        except (KeyError, ValueError, TypeError): return None
+        if self.__startOrdinal <= ordinal <= self.__endOrdinal: return ordinal
+    # end of __getOrdinal
+
+    def __contains__( self, referenceTuple ):
+        """ Returns True/False if the (BBB, C, V, S) reference tuple is in the range (including the S suffix). """
+        ordinal = self.__getOrdinal( referenceTuple )
+        return ordinal is not None and referenceTuple[3] == self.__getSuffix( ordinal )
+    # end of __contains__
+
+    def containsBCV( self, referenceTuple ):
+        """ Returns True/False if the (BBB, C, V, S) reference tuple is in the range (ignoring the S suffix). """
+        return self.__getOrdinal( referenceTuple ) is not None
+    # end of containsBCV
+
+    def __eq__( self, other ):
+        """ Compares the reference tuples with another VerseRange or list. """
+        if isinstance( other, (VerseRange, list, tuple,) ): return len(self)==len(other) and list(self)==list(other)
+        return NotImplemented
+    # end of __eq__
+
+    __hash__ = None # Not hashable (just like a list)
+
+    def toList( self ):
+        """ Returns a list of all of the reference tuples. """
+        return list( self )
+    # end of toList
+# end of VerseRange class
+
+
+def _parseVerseNumbers( verseString ):
+    """
+    Returns a list of the integer verse numbers in a combinedVerses/reorderedVerses string like "7-9" or "7,8" or "3-4,12".
+
+    Raises ValueError if the string can't be parsed.
+    """
+    verseNumbers = []
+    for bit in verseString.replace('–','-').split( ',' ):
+        if '-' in bit:
+            startV, endV = bit.split( '-' )
+            startVint, endVint = int(startV), int(endV)
+            if startVint > endVint: raise ValueError( verseString )
+            verseNumbers.extend( range( startVint, endVint+1 ) )
+        else: verseNumbers.append( int(bit) )
+    return verseNumbers
+# end of _parseVerseNumbers
+
+
+def _makeVerseIntervals( verseString ):
+    """
+    Returns a tuple of (startVint, endVint) intervals for a combinedVerses/reorderedVerses string like "7-9" or "7,8" or "3-4,12".
+
+    Consecutive verse numbers are joined into one interval (so "7,8" is the same as "7-8").
+    Raises ValueError if the string can't be parsed.
+    """
+    intervals = []
+    for Vint in _parseVerseNumbers( verseString ):
+        if intervals and Vint == intervals[-1][1] + 1: intervals[-1] = (intervals[-1][0], Vint,)
+        else: intervals.append( (Vint, Vint,) )
+    return tuple( intervals )
+# end of _makeVerseIntervals
+
+
+def _makeVerseBitmaps( CVList ):
+    """
+    Returns a dictionary of verse bitmaps (ints with bit V set for each verse) indexed by the integer chapter number
+        for the given list of (Cint, Vint) tuples (or None if the list is empty).
+    """
+    if not CVList: return None
+    bitmaps = {}
+    for Cint, Vint in CVList:
+        bitmaps[Cint] = bitmaps.get( Cint, 0 ) | (1 << Vint)
+    return bitmaps
+# end of _makeVerseBitmaps
+
+
 class BibleVersificationSystem:
     """
     Class for handling a particular Bible versification system.
@@ -865,8 +1649,51 @@ class BibleVersificationSystem:
         result = self._bvss.getVersificationSystem( self._systemName )
         if result is not None:
             self.__chapterDataDict, self.__omittedVersesDict, self.__combinedVersesDict, self.__reorderedVersesDict = result
+
+            # Make compact integer tables so that lookups don't have to keep converting the strings in the above dictionaries
+            #   The verse counts are indexed by the chapter number (with zero for any chapters that aren't in the system)
+            self.__numChaptersDict, self.__numVersesDict = {}, {}
+            for BBB,chapterData in self.__chapterDataDict.items():
+                self.__numChaptersDict[BBB] = int( chapterData['numChapters'] )
+                chapterNumbers = [int(C) for C in chapterData if C!='numChapters']
+                numVerses = array( 'H', [0] ) * (max(chapterNumbers)+1 if chapterNumbers else 0)
+                for Cint in chapterNumbers: numVerses[Cint] = int( chapterData[str(Cint)] )
+                self.__numVersesDict[BBB] = numVerses
+
+            # Make hashed sets and per-chapter bitmaps so that checking for omitted verses
+            #   (and per-verse interval indexes for combined and reordered verses) doesn't have to scan the lists in the above dictionaries
+            self.__omittedVersesSets, self.__omittedVerseBitmaps = {}, {}
+            for BBB,omittedVerses in self.__omittedVersesDict.items():
+                self.__omittedVersesSets[BBB] = frozenset( omittedVerses )
+                self.__omittedVerseBitmaps[BBB] = _makeVerseBitmaps( [(int(C),int(V)) for C,V in omittedVerses] )
+            self.__combinedVerseIndex = self.__makeExtraVerseIndex( self.__combinedVersesDict, "combinedVerses" )
+            self.__reorderedVerseIndex = self.__makeExtraVerseIndex( self.__reorderedVersesDict, "reorderedVerses" )
+            self.__ordinalIndexes = {} # Built as needed by getVerseOrdinalIndex (keyed by book order system name)
+            self.__omittedOrdinals = {} # Built as needed by getOmittedOrdinals (keyed by book order system name)
+            self.__ordinalValidities = {} # Built as needed by getOrdinalValidity (keyed by book order system name)
     # end of __init__
 
+    def __makeExtraVerseIndex( self, extraVersesDict, fieldName ):
+        """
+        Returns a dictionary (indexed by BBB) of dictionaries (indexed by Cint) of dictionaries (indexed by Vint)
+            giving the (startVint, endVint) interval (see _makeVerseIntervals) which contains each verse
+            for the combined or reordered verses dictionary which contains lists of (C, verseString) tuples.
+
+        Books without any combined or reordered verses are left out.
+        """
+        indexDict = {}
+        for BBB,extraVerses in extraVersesDict.items():
+            for C,verseString in extraVerses:
+                try: intervals = _makeVerseIntervals( verseString )
+                except ValueError:
+                    logging.error( _("Unable to understand {} '{}' for {} {} in {} versification system").format( fieldName, verseString, BBB, C, self._systemName ) )
+                    continue
+                chapterIndex = indexDict.setdefault( BBB, {} ).setdefault( int(C), {} )
+                for interval in intervals:
+                    for Vint in range( interval[0], interval[1]+1 ): chapterIndex[Vint] = interval
+        return indexDict
+    # end of __makeExtraVerseIndex
+
     def __str__( self ):
         """
         This method returns the string representation of a Bible versification system.
@@ -897,10 +1724,67 @@ class BibleVersificationSystem:
         return self._systemName
     # end of getVersificationSystemName
 
+    def getVerseOrdinalIndex( self, bookOrderSystem=None ):
+        """
+        Returns a VerseOrdinalIndex for this versification system using the given book order
+            (or the order of the books in the versification system if no book order system is given).
+
+        The index is only built once for each book order.
+        """
+        key = None if bookOrderSystem is None else bookOrderSystem.getBookOrderSystemName()
+        if key not in self.__ordinalIndexes:
+            BBBList = list( self.__chapterDataDict.keys() ) if bookOrderSystem is None else bookOrderSystem.getBookList()
+            self.__ordinalIndexes[key] = VerseOrdinalIndex( self, BBBList )
+        return self.__ordinalIndexes[key]
+    # end of getVerseOrdinalIndex
+
+    def getOmittedOrdinals( self, bookOrderSystem=None ):
+        """
+        Returns a frozenset of the verse ordinals (see getVerseOrdinalIndex) of the omitted verses in this system.
+
+        The set is only built once for each book order.
+        """
+        key = None if bookOrderSystem is None else bookOrderSystem.getBookOrderSystemName()
+        if key not in self.__omittedOrdinals:
+            ordinalIndex = self.getVerseOrdinalIndex( bookOrderSystem )
+            omittedOrdinals = set()
+            for BBB,omittedVerses in self.__omittedVersesDict.items():
+                for C,V in omittedVerses:
+                    try: omittedOrdinals.add( ordinalIndex.toOrdinalInt( BBB, int(C), int(V) ) )
+                    except KeyError: pass # The book isn't in the book order
+            self.__omittedOrdinals[key] = frozenset( omittedOrdinals )
+        return self.__omittedOrdinals[key]
+    # end of getOmittedOrdinals
+
+    def getOrdinalValidity( self, bookOrderSystem=None ):
+        """
+        Returns a bytearray indexed by the verse ordinals (see getVerseOrdinalIndex)
+            with 1 for each verse in this system and 0 for each omitted verse.
+
+        The bytearray is only built once for each book order. It's shared, so don't modify it.
+        """
+        key = None if bookOrderSystem is None else bookOrderSystem.getBookOrderSystemName()
+        if key not in self.__ordinalValidities:
+            validity = bytearray( b'\x01' ) * len( self.getVerseOrdinalIndex( bookOrderSystem ) )
+            for ordinal in self.getOmittedOrdinals( bookOrderSystem ): validity[ordinal] = 0
+            self.__ordinalValidities[key] = validity
+        return self.__ordinalValidities[key]
+    # end of getOrdinalValidity
+
+    def toOrdinal( self, referenceTuple, bookOrderSystem=None ):
+        """ Returns the verse ordinal (see VerseOrdinalIndex) for the given (BBB, C, V, S) reference tuple. """
+        return self.getVerseOrdinalIndex( bookOrderSystem ).toOrdinal( referenceTuple )
+    # end of toOrdinal
+
+    def fromOrdinal( self, ordinal, bookOrderSystem=None ):
+        """ Returns the (BBB, C, V, S) reference tuple for the given verse ordinal (see VerseOrdinalIndex). """
+        return self.getVerseOrdinalIndex( bookOrderSystem ).fromOrdinal( ordinal )
+    # end of fromOrdinal
+
     def getNumChapters( self, BBB ):
         """ Returns the number of chapters (int) in the given book. """
         assert( len(BBB) == 3 )
-        return int( self.__chapterDataDict[BBB]['numChapters'] )
+        return self.__numChaptersDict[BBB]
     # end of getNumChapters
 
     def getNumVerses( self, BBB, C ):
@@ -908,23 +1792,39 @@ class BibleVersificationSystem:
         assert( len(BBB) == 3 )
         if isinstance(C, int): # Just double-check the parameter
             logging.debug( _("BibleVersificationSystem.getNumVerses was passed an integer chapter instead of a string with {} {}").format(BBB,C) )
-            C = str( C )
-        return int( self.__chapterDataDict[BBB][C] )
+            return self.getNumVersesInt( BBB, C )
+        if C=='numChapters' or C not in self.__chapterDataDict[BBB]: raise KeyError( C )
+        return self.__numVersesDict[BBB][int(C)]
     # end of getNumVerses
 
+    def getNumVersesInt( self, BBB, Cint ):
+        """ Returns the number of verses (int) in the given book and (integer) chapter number. """
+        numVerses = self.__numVersesDict[BBB]
+        if 0 <= Cint < len(numVerses) and numVerses[Cint]: return numVerses[Cint]
+        raise KeyError( Cint )
+    # end of getNumVersesInt
+
+    def getVerseCounts( self, BBB ):
+        """
+        Returns an array of the number of verses in each chapter of the given book.
+
+        The array is indexed by the chapter number (so there's usually nothing in the first entry)
+            and contains zero for any chapters that aren't in this system.
+        It's shared, so don't modify it.
+        """
+        return self.__numVersesDict[BBB]
+    # end of getVerseCounts
+
     def isSingleChapterBook( self, BBB ):
         """ Returns True/False to indicate if this book only contains a single chapter. """
         assert( len(BBB) == 3 )
-        return self.__chapterDataDict[BBB]['numChapters'] == '1'
+        return self.__numChaptersDict[BBB] == 1
     # end of isSingleChapterBook
 
     def getNumVersesList( self, BBB ):
         """ Returns a list containing an integer for each chapter indicating the number of verses. """
         assert( len(BBB) == 3 )
-        myList = []
-        for x in self.__chapterDataDict[BBB].keys():
-            if x!='numChapters': myList.append( int( self.__chapterDataDict[BBB][x] ) )
-        return myList
+        return [numVerses for numVerses in self.__numVersesDict[BBB] if numVerses]
     # end of getNumVersesList
 
     def getOmittedVerseList( self, BBB, fullRefs=False ):
@@ -946,29 +1846,199 @@ class BibleVersificationSystem:
         if isinstance(V, int): # Just double-check the parameter
             logging.debug( _("BibleVersificationSystem.isOmittedVerse was passed an integer verse instead of a string with {} {}:{}").format(BBB,C,V) )
             V = str( V )
-        return (C,V) in self.__omittedVersesDict[BBB]
+        return (C,V) in self.__omittedVersesSets[BBB]
     # end of isOmittedVerse
 
+    def isOmittedVerseInt( self, BBB, Cint, Vint ):
+        """ Returns True/False indicating if the given reference (with integer chapter and verse numbers) is omitted in this system. """
+        bitmaps = self.__omittedVerseBitmaps.get( BBB )
+        return bitmaps is not None and Vint >= 0 and bool( bitmaps.get( Cint, 0 ) >> Vint & 1 )
+    # end of isOmittedVerseInt
+
+    @staticmethod
+    def __getVerseInterval( indexDict, BBB, Cint, Vint ):
+        """ Returns the (startVint, endVint) interval from the index (see __makeExtraVerseIndex) which contains the verse (or None). """
+        chapterIndexes = indexDict.get( BBB )
+        if chapterIndexes is None: return None
+        chapterIndex = chapterIndexes.get( Cint )
+        return None if chapterIndex is None else chapterIndex.get( Vint )
+    # end of __getVerseInterval
+
+    def __getVerseRange( self, indexDict, referenceTuple ):
+        """ Returns the (startReferenceTuple, endReferenceTuple) from the index which contains the (BBB, C, V, S) reference (or None). """
+        BBB, C, V, S = referenceTuple
+        if not V: return None
+        interval = self.__getVerseInterval( indexDict, BBB, int(C), int(V) )
+        if interval is None: return None
+        return (BBB, C, str(interval[0]), '',), (BBB, C, str(interval[1]), '',)
+    # end of __getVerseRange
+
+    def getCombinedVerseRangeInt( self, BBB, Cint, Vint ):
+        """
+        Returns the (startVint, endVint) of the combined verse which contains the given verse in this system
+            (or None if it's not part of a combined verse).
+        """
+        return self.__getVerseInterval( self.__combinedVerseIndex, BBB, Cint, Vint )
+    # end of getCombinedVerseRangeInt
+
+    def getCombinedVerseRange( self, referenceTuple ):
+        """
+        Returns (startReferenceTuple, endReferenceTuple) for the combined verse which contains the given reference in this system
+            (or None if it's not part of a combined verse), e.g., for the start and end milestones of a verse bridge.
+        """
+        return self.__getVerseRange( self.__combinedVerseIndex, referenceTuple )
+    # end of getCombinedVerseRange
+
+    def getReorderedVerseRangeInt( self, BBB, Cint, Vint ):
+        """
+        Returns the (startVint, endVint) of the reordered verses which contain the given verse in this system
+            (or None if it's not a reordered verse).
+        """
+        return self.__getVerseInterval( self.__reorderedVerseIndex, BBB, Cint, Vint )
+    # end of getReorderedVerseRangeInt
+
+    def getReorderedVerseRange( self, referenceTuple ):
+        """
+        Returns (startReferenceTuple, endReferenceTuple) for the reordered verses which contain the given reference in this system
+            (or None if it's not a reordered verse).
+        """
+        return self.__getVerseRange( self.__reorderedVerseIndex, referenceTuple )
+    # end of getReorderedVerseRange
+
+    def isCombinedVerse( self, referenceTuple ):
+        """ Returns True/False indicating if the given reference is part of a combined verse in this system. """
+        return self.getCombinedVerseRange( referenceTuple ) is not None
+    # end of isCombinedVerse
+
+    def isReorderedVerse( self, referenceTuple ):
+        """ Returns True/False indicating if the given reference is a reordered verse in this system. """
+        return self.getReorderedVerseRange( referenceTuple ) is not None
+    # end of isReorderedVerse
+
+    def __checkChapter( self, BBB, C ):
+        """
+        Checks the book and chapter of a reference (the rules shared by isValidBCVRef and validateMany).
+
+        The chapter must be one of the chapter number strings in the data (so '01' isn't a valid chapter).
+        Returns a (reason, numVerses, omittedBitmap) tuple where the reason is None for a valid chapter, else "book" or "chapter".
+        """
+        chapterData = self.__chapterDataDict.get( BBB )
+        if chapterData is None: return "book", 0, 0
+        if C == 'numChapters' or C not in chapterData: return "chapter", 0, 0
+        Cint = int( C )
+        return None, self.__numVersesDict[BBB][Cint], (self.__omittedVerseBitmaps.get( BBB ) or {}).get( Cint, 0 )
+    # end of __checkChapter
+
+    @staticmethod
+    def __checkVerse( V, numVerses, omittedBitmap ):
+        """
+        Checks the verse of a reference in a valid chapter (see __checkChapter) (the rules shared by isValidBCVRef and validateMany).
+
+        The verse can be blank (as a reference can refer to an entire chapter), an integer,
+            or a verse number string (without leading zeroes so it matches the chapter rule).
+        Returns None for a valid verse, else "verse" or "omitted".
+        """
+        if isinstance( V, numbers.Integral ): Vint = operator.index( V )
+        elif not V: return None # NOTE: This allows blank verse numbers (as a reference can refer to an entire chapter)
+        elif isinstance( V, str ) and V.isdecimal() and V[0]!='0': Vint = int( V )
+        else: return "verse"
+        if not 1 <= Vint <= numVerses: return "verse"
+        if omittedBitmap >> Vint & 1: return "omitted"
+        return None
+    # end of __checkVerse
+
     def isValidBCVRef( self, referenceTuple, referenceString=None, wantErrorMessages=False ):
         """ Returns True/False indicating if the given reference is valid in this system. """
         BBB, C, V, S = referenceTuple
-        myReferenceString = " (from '{}')".format(referenceString) if referenceString is not None else ''
-
-        if BBB in self.__chapterDataDict:
-            if C in self.__chapterDataDict[BBB]:
-                if not V: return True # NOTE: This allows blank verse numbers (as a reference can refer to an entire chapter)
-                if int(V) <= int(self.__chapterDataDict[BBB][C]):
-                    if not self.isOmittedVerse( referenceTuple ):
-                        return True
-                    elif wantErrorMessages: logging.error( _("{} {}:{} is omitted in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
-                elif wantErrorMessages: logging.error( _("{} {}:{} is invalid verse in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
-            elif wantErrorMessages: logging.error( _("{} {}:{} is invalid chapter in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
-        elif wantErrorMessages: logging.error( _("{} {}:{} is invalid book in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
+        reason, numVerses, omittedBitmap = self.__checkChapter( BBB, C )
+        if reason is None: reason = self.__checkVerse( V, numVerses, omittedBitmap )
+        if reason is None: return True
+        if wantErrorMessages:
+            myReferenceString = " (from '{}')".format(referenceString) if referenceString is not None else ''
+            if reason == "omitted": logging.error( _("{} {}:{} is omitted in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
+            elif reason == "verse": logging.error( _("{} {}:{} is invalid verse in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
+            elif reason == "chapter": logging.error( _("{} {}:{} is invalid chapter in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
+            else: logging.error( _("{} {}:{} is invalid book in {} versification system {}").format(BBB,C,V,self.getVersificationSystemName(),myReferenceString) )
         return False
     # end of isValidBCVRef
 
-    def expandCVRange( self, startRef, endRef, referenceString=None, bookOrderSystem=None, wantErrorMessages=False ):
-        """ Returns a list containing all valid references (inclusive) between the given values. """
+    def isValidBCVRefInt( self, BBB, Cint, Vint ):
+        """
+        Returns True/False indicating if the given reference (with integer chapter and verse numbers) is valid in this system.
+
+        This is a quicker version of isValidBCVRef (without any error messages)
+            for when the chapter and verse numbers are already integers.
+        """
+        numVerses = self.__numVersesDict.get( BBB )
+        if numVerses is None or not 0 <= Cint < len(numVerses) or not 1 <= Vint <= numVerses[Cint]: return False
+        return not self.isOmittedVerseInt( BBB, Cint, Vint )
+    # end of isValidBCVRefInt
+
+    def validateMany( self, references, bookOrderSystem=None ):
+        """
+        Validates a list (or array) of references in one pass (without any error messages).
+
+        Each reference can be a (BBB, C, V, S) reference tuple (checked by the same rules as isValidBCVRef)
+            or an integer verse ordinal (see getVerseOrdinalIndex) using the given book order.
+        If a book order system is given, references to books which aren't in it are also invalid.
+        Each book and chapter is only checked once however the references are ordered,
+            and an array (or range) of ordinals is checked in bulk against getOrdinalValidity.
+
+        Returns a bytearray mask (with 1 for each valid reference and 0 for each invalid one)
+            and a list of (index, reason) tuples for the invalid references,
+            where the reason is "book", "chapter", "verse", "omitted", or "ordinal" (for an ordinal out of range).
+        """
+        if isinstance( references, range ) or ( isinstance( references, array ) and references.typecode not in 'uwfd' ):
+            return self.__validateOrdinals( references, bookOrderSystem )
+
+        mask, failures = bytearray( len(references) ), []
+        bookSet = None if bookOrderSystem is None else frozenset( bookOrderSystem.getBookList() )
+        chapterChecks = {} # Key is (BBB, C), value is the tuple from __checkChapter
+        checkVerse = self.__checkVerse
+        validity = None
+        for ix,reference in enumerate( references ):
+            if not isinstance( reference, (tuple, list) ): # It must be a verse ordinal
+                if validity is None: validity = self.getOrdinalValidity( bookOrderSystem ) # Only get this if we need it
+                ordinal = operator.index( reference )
+                if not 0 <= ordinal < len(validity): failures.append( (ix, "ordinal",) )
+                elif validity[ordinal]: mask[ix] = 1
+                else: failures.append( (ix, "omitted",) )
+                continue
+
+            BBB, C, V, S = reference
+            chapterCheck = chapterChecks.get( (BBB,C) )
+            if chapterCheck is None:
+                chapterCheck = chapterChecks[(BBB,C)] = ("book", 0, 0) if bookSet is not None and BBB not in bookSet else self.__checkChapter( BBB, C )
+            reason = chapterCheck[0]
+            if reason is None: reason = checkVerse( V, chapterCheck[1], chapterCheck[2] )
+            if reason is None: mask[ix] = 1
+            else: failures.append( (ix, reason,) )
+        return mask, failures
+    # end of validateMany
+
+    def __validateOrdinals( self, ordinals, bookOrderSystem ):
+        """
+        Validates an array (or range) of verse ordinals for validateMany
+            by looking them all up in the validity bytearray at once.
+        """
+        validity = self.getOrdinalValidity( bookOrderSystem )
+        if not ordinals: return bytearray(), []
+        if min( ordinals ) >= 0 and max( ordinals ) < len(validity): # They're all in range
+            mask = bytearray( map( validity.__getitem__, ordinals ) )
+        else: mask = bytearray( validity[ordinal] if 0 <= ordinal < len(validity) else 0 for ordinal in ordinals )
+        failures, ix = [], mask.find( 0 )
+        while ix != -1: # There's usually only a few of these
+            failures.append( (ix, "omitted" if 0 <= ordinals[ix] < len(validity) else "ordinal",) )
+            ix = mask.find( 0, ix+1 )
+        return mask, failures
+    # end of __validateOrdinals
+
+    def expandCVRange( self, startRef, endRef, referenceString=None, bookOrderSystem=None, wantErrorMessages=False, wantList=False ):
+        """
+        Returns a VerseRange (or a list if wantList is set) containing all valid references (inclusive) between the given values.
+
+        Returns None if the range isn't valid.
+        """
         assert( startRef and len(startRef)==4 )
         assert( endRef and len(endRef)==4 )
 
@@ -1010,57 +2080,11 @@ class BibleVersificationSystem:
             haveErrors = True
         if haveErrors: return None
 
-        resultList = []
-        if BBB1 == BBB2: # It's a chapter or verse range within the same book
-            for Cint in range( C1int, C2int+1 ):
-                if Cint==C1int and Cint==C2int: # We're on the only chapter
-                    startVint = V1int
-                    endVint = V2int
-                elif Cint==C1int: # We're on the first chapter
-                    startVint = V1int
-                    endVint = self.getNumVerses( BBB1, str(Cint) )
-                elif Cint==C2int: # We're on the final chapter
-                    startVint = 1
-                    endVint = V2int
-                else: # Must be an inbetween chapter
-                    startVint = 1
-                    endVint = self.getNumVerses( BBB1, str(Cint) )
-                for Vint in range( startVint, endVint+1 ):
-                    if Cint==C1int and Vint==V1int: S = S1
-                    elif Cint==C2int and Vint==V2int: S = S2
-                    else: S = ''
-                    resultList.append( (BBB1, str(Cint), str(Vint), S,) )
-        else: # it's a range that spans multiple books
-            BBB, Cfirst, Vfirst = BBB1, C1int, V1int
-            while BBB != BBB2: # Go to the end of this book
-                Clast = self.getNumChapters( BBB )
-                for Cint in range( Cfirst, Clast+1 ):
-                    Vlast = self.getNumVerses( BBB, str(Cint) )
-                    if Cint==Cfirst: # We're on the first chapter
-                        startVint = V1int
-                        endVint = Vlast
-                    else: # It's not the first chapter
-                        startVint = 1
-                        endVint = Vlast
-                    for Vint in range( startVint, endVint+1 ):
-                        if Cint==C1int and Vint==V1int: S = S1
-                        else: S = ''
-                        resultList.append( (BBB, str(Cint), str(Vint), S,) )
-                BBB, Cfirst, Vfirst = bookOrderSystem.getNextBook( BBB ), 1, 1
-            for Cint in range( 1, C2int+1 ): # Now finish the last book
-                if Cint==C2int: # We're on the final chapter
-                    startVint = 1
-                    endVint = V2int
-                else: # Must be an inbetween chapter
-                    startVint = 1
-                    endVint = self.getNumVerses( BBB1, str(Cint) )
-                for Vint in range( startVint, endVint+1 ):
-                    if Cint==C2int and Vint==V2int: S = S2
-                    else: S = ''
-                    resultList.append( (BBB2, str(Cint), str(Vint), S,) )
-
-        #print( startRef, endRef, resultList, haveErrors, haveWarnings )
-        return resultList #, haveErrors, haveWarnings
+        # Use the verse ordinals (for the given book order if the range spans multiple books)
+        ordinalIndex = self.getVerseOrdinalIndex( None if BBB1==BBB2 else bookOrderSystem )
+        result = VerseRange( ordinalIndex, ordinalIndex.toOrdinalInt( BBB1, C1int, max(V1int,1) ), ordinalIndex.toOrdinalInt( BBB2, C2int, max(V2int,1) ), S1, S2 )
+        #print( startRef, endRef, result, haveErrors, haveWarnings )
+        return result.toList() if wantList else result
     # end of expandCVRange
 # end of BibleVersificationSystem class
 
@@ -1095,7 +2119,11 @@ def main():
         for systemName in ('RSV52','NLT96','KJV'):
             testSystem = bvss.getVersificationSystem( systemName )
             bvss.checkVersificationSystem( "testSystem", testSystem[0] )
-            bvss.checkVersificationSystem( "testSystem", testSystem[0], testSystem[1] ) # include omitted verses check this time
+            extraVerseInfo = { "omitted":testSystem[1], "combined":testSystem[2], "reordered":testSystem[3] }
+            bvss.checkVersificationSystem( "testSystem", testSystem[0], extraVerseInfo ) # include omitted verses check this time
+            print( "  " + _("Best matches for {} are {}").format( systemName, bvss.rankVersificationSystems( testSystem[0], extraVerseInfo )[:3] ) )
+        bvss.useDeltaStorage() # Share the data for the related systems
+        print( bvss ) # Shows the memory saved
 
         # Demo a BibleVersificationSystem object -- this is the one most likely to be wanted by a user
         bvs = BibleVersificationSystem( "NLT96" )
@@ -0,0 +1,204 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# DataCache.py
+#
+# Module handling binary snapshots of our imported reference data
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module handling binary snapshots of our imported reference data.
+
+The XML data files hardly ever change, so once a converter has imported (pivoted) them
+    into Python dictionaries we save the result as a pickle file in the cache folder.
+On the next run, loadData() can reload that snapshot instead of parsing all the XML again.
+
+Each snapshot remembers the size, modification time and content hash of every source file
+    (including the Python module that did the import) and is ignored if any of them have changed.
+"""
+
+progName = "Data cache handler"
+versionString = "0.06"
+
+
+import os, logging
+from gettext import gettext as _
+
+import Globals, StartupProfiler
+
+
+cacheFolder = "CachedFiles" # Relative to the current folder just like DataFiles and DerivedFiles
+useCache = True # Set this to False to always load from the XML
+snapshotFormatVersion = 1 # Increment this if the layout of the snapshot files changes
+
+
+def getFolderFilepaths( folder, filenamePrefix ):
+    """
+    Returns a sorted list of the XML filepaths in the folder that start with the given prefix.
+
+    This uses the same matching rules as the loadSystems functions of our converter classes.
+    """
+    results = []
+    for filename in os.listdir( folder ):
+        filepart, extension = os.path.splitext( filename )
+        if extension.upper() == '.XML' and filepart.upper().startswith( filenamePrefix.upper() ):
+            results.append( os.path.join( folder, filename ) )
+    return sorted( results )
+# end of getFolderFilepaths
+
+
+def getContentHash( filepath ):
+    """ Returns the SHA-1 hex digest of the contents of the file. """
+    import hashlib # Not imported until we need to check the file contents
+    hasher = hashlib.sha1()
+    with open( filepath, 'rb' ) as myFile:
+        for block in iter( lambda: myFile.read( 65536 ), b'' ):
+            hasher.update( block )
+    return hasher.hexdigest()
+# end of getContentHash
+
+
+def getSourceStamps( filepaths ):
+    """
+    Returns a list of (filepath, size, mtime, contentHash) tuples for the given source files.
+    """
+    stamps = []
+    for filepath in filepaths:
+        fileStat = os.stat( filepath )
+        stamps.append( (filepath, fileStat.st_size, fileStat.st_mtime, getContentHash( filepath ),) )
+    return stamps
+# end of getSourceStamps
+
+
+def stampsMatch( savedStamps, filepaths ):
+    """
+    Returns True if the saved stamps (see getSourceStamps) still describe the given source files.
+
+    This is also used for derived files that store their own source stamps (e.g., binary tables).
+
+    The size and modification time are checked first as they're cheap.
+    If only the modification time differs (e.g., the file was touched by a checkout),
+        the content hash decides.
+    """
+    if [stamp[0] for stamp in savedStamps] != list( filepaths ): return False
+    for filepath, size, mtime, contentHash in savedStamps:
+        try: fileStat = os.stat( filepath )
+        except OSError: return False
+        if fileStat.st_size != size: return False
+        if fileStat.st_mtime != mtime and getContentHash( filepath ) != contentHash: return False
+    return True
+# end of stampsMatch
+
+
+def _getSnapshotFilepath( snapshotName ):
+    """ Returns the filepath for the named snapshot. """
+    return os.path.join( cacheFolder, snapshotName + ".pickle" )
+# end of _getSnapshotFilepath
+
+
+@StartupProfiler.profiledPhase( "snapshot load" )
+def loadSnapshot( snapshotName, sourceFilepaths ):
+    """
+    Loads the named snapshot if it exists and is still valid for the given source files.
+
+    Returns the saved data or None if the XML needs to be loaded.
+    """
+    if not useCache: return None
+    snapshotFilepath = _getSnapshotFilepath( snapshotName )
+    if not os.access( snapshotFilepath, os.R_OK ): return None
+
+    import pickle # Not imported until we actually have some data to load
+    try:
+        with open( snapshotFilepath, 'rb' ) as snapshotFile:
+            formatVersion, strictCheckingFlag, savedStamps = pickle.load( snapshotFile )
+            if formatVersion != snapshotFormatVersion \
+            or strictCheckingFlag != Globals.strictCheckingFlag \
+            or not stampsMatch( savedStamps, sourceFilepaths ):
+                if Globals.verbosityLevel > 3: print( _("Ignoring out-of-date {} snapshot").format( snapshotName ) )
+                return None
+            data = pickle.load( snapshotFile )
+    except Exception as err: # Could be a truncated file, or one written by a different Python version
+        logging.warning( _("Unable to load {} snapshot from {}: {}").format( snapshotName, snapshotFilepath, err ) )
+        return None
+
+    if Globals.verbosityLevel > 2: print( _("Loaded {} snapshot from {}").format( snapshotName, snapshotFilepath ) )
+    return data
+# end of loadSnapshot
+
+
+@StartupProfiler.profiledPhase( "snapshot save" )
+def saveSnapshot( snapshotName, sourceFilepaths, data ):
+    """
+    Saves the data (as returned from a converter's importDataToPython function) to the named snapshot.
+
+    Failures are logged but otherwise ignored since the cache is only an optimisation.
+    """
+    if not useCache: return
+    snapshotFilepath = _getSnapshotFilepath( snapshotName )
+    tempFilepath = snapshotFilepath + ".tmp{}".format( os.getpid() )
+    import pickle
+    try:
+        if not os.access( cacheFolder, os.W_OK ):
+            os.makedirs( cacheFolder )
+        with open( tempFilepath, 'wb' ) as snapshotFile:
+            # The header is pickled separately so that it can be checked without unpickling all the data
+            pickle.dump( (snapshotFormatVersion, Globals.strictCheckingFlag, getSourceStamps( sourceFilepaths ),), snapshotFile, pickle.HIGHEST_PROTOCOL )
+            pickle.dump( data, snapshotFile, pickle.HIGHEST_PROTOCOL )
+        os.replace( tempFilepath, snapshotFilepath ) # Atomic so other processes never see a partial file
+    except Exception as err:
+        logging.warning( _("Unable to save {} snapshot to {}: {}").format( snapshotName, snapshotFilepath, err ) )
+        if os.access( tempFilepath, os.F_OK ): os.remove( tempFilepath )
+        return
+    if Globals.verbosityLevel > 2: print( _("Saved {} snapshot to {}").format( snapshotName, snapshotFilepath ) )
+# end of saveSnapshot
+
+
+def clearSnapshots():
+    """ Deletes all of the snapshot (and other derived) files from the cache folder. """
+    if not os.access( cacheFolder, os.F_OK ): return
+    for filename in os.listdir( cacheFolder ):
+        if filename.endswith( ".pickle" ) or filename.endswith( ".table" ):
+            os.remove( os.path.join( cacheFolder, filename ) )
+# end of clearSnapshots
+
+
+def demo():
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    # Handle command line parameters
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    parser.add_option("-c", "--clear", action="store_true", dest="clear", default=False, help="delete all of the saved snapshots")
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 0: print( "{} V{}".format( progName, versionString ) )
+
+    if Globals.commandLineOptions.clear:
+        clearSnapshots()
+    elif os.access( cacheFolder, os.F_OK ):
+        for filename in sorted( os.listdir( cacheFolder ) ):
+            if filename.endswith( ".pickle" ) or filename.endswith( ".table" ):
+                print( "  {} ({} bytes)".format( filename, os.stat( os.path.join( cacheFolder, filename ) ).st_size ) )
+# end of demo
+
+if __name__ == '__main__':
+    demo()
+# end of DataCache.py
@@ -0,0 +1,206 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# DeferredValidation.py
+#
+# Module for checking our reference data in a background thread
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for checking our reference data in a background thread.
+
+Normally (with Globals.strictCheckingFlag set) each converter validates its XML before loadData() returns.
+If Globals.backgroundCheckingFlag is also set (e.g., by the --background-checking command line option),
+    the converters pass their validation functions to runOrDefer instead,
+    so the imported data can be used straight away while the checking is done in a background thread.
+
+The warnings and errors logged by the background checks are collected in a ValidationReport
+    (see getReport) as well as being logged as usual.
+"""
+
+progName = "Deferred validation handler"
+versionString = "0.01"
+
+
+import logging, threading, queue
+from gettext import gettext as _
+
+import Globals
+
+
+class ValidationReport:
+    """
+    Class for collecting the findings of the background validation.
+    """
+
+    def __init__( self ):
+        """
+        Constructor:
+        """
+        self.findings = [] # A list of (component, levelName, message) 3-tuples
+        self.__numPending = 0
+        self.__condition = threading.Condition()
+    # end of __init__
+
+    def __str__( self ):
+        """
+        This method returns the string representation of the report.
+
+        @return: a summary of the findings formatted as a string
+        @rtype: string
+        """
+        result = "ValidationReport object"
+        result += ('\n' if result else '') + "  " + _("{} findings ({})").format( len(self.findings), _("complete") if self.isComplete() else _("{} checks still pending").format( self.__numPending ) )
+        for component, levelName, message in self.getFindings():
+            result += ('\n' if result else '') + "    {} {}: {}".format( component, levelName, message )
+        return result
+    # end of __str__
+
+    def _addPending( self ):
+        """ Notes that another check has been queued. """
+        with self.__condition: self.__numPending += 1
+    # end of _addPending
+
+    def _donePending( self ):
+        """ Notes that a check has finished. """
+        with self.__condition:
+            self.__numPending -= 1
+            if not self.__numPending: self.__condition.notify_all()
+    # end of _donePending
+
+    def _addFinding( self, component, levelName, message ):
+        """ Adds a finding to the report. """
+        with self.__condition: self.findings.append( (component, levelName, message,) )
+    # end of _addFinding
+
+    def isComplete( self ):
+        """ Returns True if all of the queued checks have finished. """
+        with self.__condition: return self.__numPending == 0
+    # end of isComplete
+
+    def wait( self, timeout=None ):
+        """
+        Waits for all of the queued checks to finish (or for the timeout in seconds).
+
+        Returns True if they've all finished.
+        """
+        with self.__condition:
+            return self.__condition.wait_for( lambda: self.__numPending == 0, timeout )
+    # end of wait
+
+    def getFindings( self ):
+        """ Returns a copy of the list of findings so far. """
+        with self.__condition: return list( self.findings )
+    # end of getFindings
+# end of ValidationReport class
+
+
+class _FindingsHandler( logging.Handler ):
+    """
+    Logging handler which adds the warnings and errors logged by the background thread to the report.
+    """
+
+    def __init__( self ):
+        logging.Handler.__init__( self, logging.WARNING )
+        self.threadIdent = threading.get_ident() # Created by the background thread itself
+        self.component = None # Set for each check
+    # end of __init__
+
+    def emit( self, record ):
+        if record.thread == self.threadIdent: # Only collect the messages from our own thread
+            _report._addFinding( self.component, record.levelname, record.getMessage() )
+    # end of emit
+# end of _FindingsHandler class
+
+
+_report = ValidationReport()
+_queue = queue.Queue()
+_thread = None
+_threadLock = threading.Lock()
+
+
+def _runChecks():
+    """
+    The main function for the background thread -- runs the queued checks one at a time.
+    """
+    rootLogger = logging.getLogger()
+    if not rootLogger.handlers: logging.basicConfig() # Otherwise adding our handler would stop the findings being displayed as usual
+    handler = _FindingsHandler()
+    rootLogger.addHandler( handler )
+    while True:
+        component, function, args = _queue.get()
+        handler.component = component
+        try: function( *args )
+        except Exception as err: # A bug in a check mustn't stop the other checks
+            logging.error( _("Background validation for {} failed: {}").format( component, err ) )
+        finally: _report._donePending()
+# end of _runChecks
+
+
+def runOrDefer( component, function, *args ):
+    """
+    Runs the validation function now, or if Globals.backgroundCheckingFlag is set,
+        queues it to be run in the background thread.
+    """
+    global _thread
+    if not Globals.backgroundCheckingFlag:
+        function( *args )
+        return
+    _report._addPending()
+    _queue.put( (component, function, args,) )
+    with _threadLock:
+        if _thread is None:
+            _thread = threading.Thread( target=_runChecks, name="DeferredValidation", daemon=True )
+            _thread.start()
+# end of runOrDefer
+
+
+def getReport():
+    """
+    Returns the ValidationReport (which can be polled with isComplete or waited on with wait).
+    """
+    return _report
+# end of getReport
+
+
+def demo():
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    # Handle command line parameters
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 0: print( "{} V{}".format( progName, versionString ) )
+
+    import DeferredValidation # Not this __main__ module, because that's not the one that the other modules use
+    Globals.backgroundCheckingFlag = True
+    from BibleOrganizationalSystems import BibleOrganizationalSystems
+    BibleOrganizationalSystems().loadData() # Loads all of the other data too
+    report = DeferredValidation.getReport()
+    print( _("Loaded data ({})").format( _("checking complete") if report.isComplete() else _("still checking") ) )
+    report.wait()
+    print( report )
+# end of demo
+
+if __name__ == '__main__':
+    demo()
+# end of DeferredValidation.py
@@ -0,0 +1,256 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# ExportAll.py
+#
+# Module for regenerating the exported tables in the DerivedFiles folder
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for regenerating the exported tables in the DerivedFiles folder
+    (i.e., the output of each converter's exportDataToPython, exportDataToJSON and exportDataToC functions).
+
+A hash of the source files (the XML datafiles and the converter module, plus those of any components that it uses)
+    is saved in a manifest file for each output, so only the outputs whose sources have changed
+    (or which are missing) are regenerated.
+The converters that are needed are all loaded once (in this process)
+    and then, if Globals.maxProcesses is more than one, the outputs are written in parallel.
+"""
+
+progName = "Derived files exporter"
+versionString = "0.03"
+
+
+import sys, logging, os, json, importlib
+from gettext import gettext as _
+from collections import OrderedDict
+
+import Globals, DataCache
+
+
+manifestFilepath = os.path.join( "DerivedFiles", "ExportManifest.json" )
+
+exportFormats = OrderedDict( [ ("Python","exportDataToPython"), ("JSON","exportDataToJSON"), ("C","exportDataToC") ] )
+exportFormatSources = { "C":[ "PerfectHash.py" ] } # Extra source files used by all of the exporters for that format
+
+# The sources are filepaths, or (folder, filenamePrefix) for a folder of XML files
+# The outputs are the default filepaths written by each export function
+#   (formats without outputs aren't supported by that converter yet so are skipped)
+exportComponents = OrderedDict( [
+    ("ISO_639_3_Languages", { "converter":"_ISO_639_3_Languages_Converter", "load":"loadAndValidate",
+            "sources":[ "DataFiles/iso_639_3.xml" ], "uses":[],
+            "outputs":{ "Python":["DerivedFiles/iso_639_3_Languages_Tables.py"], "JSON":["DerivedFiles/iso_639_3__Languages_Tables.json"],
+                        "C":["DerivedFiles/iso_639_3_Languages_Tables.h","DerivedFiles/iso_639_3_Languages_Tables.c"] } }),
+    ("BibleBooksCodes", { "converter":"_BibleBooksCodesConverter", "load":"loadAndValidate",
+            "sources":[ "DataFiles/BibleBooksCodes.xml" ], "uses":[],
+            "outputs":{ "Python":["DerivedFiles/BibleBooksCodes_Tables.py"], "JSON":["DerivedFiles/BibleBooksCodes_Tables.json"],
+                        "C":["DerivedFiles/BibleBooksCodes_Tables.h","DerivedFiles/BibleBooksCodes_Tables.c"] } }),
+    ("BibleVersificationSystems", { "converter":"_BibleVersificationSystemsConverter", "load":"loadSystems",
+            "sources":[ ("DataFiles/VersificationSystems","BibleVersificationSystem_") ], "uses":["BibleBooksCodes"],
+            "outputs":{ "Python":["DerivedFiles/BibleVersificationSystems_Tables.py"], "JSON":["DerivedFiles/BibleVersificationSystems_Tables.json"] } }),
+    ("BibleBookOrders", { "converter":"_BibleBookOrdersConverter", "load":"loadSystems",
+            "sources":[ ("DataFiles/BookOrders","BibleBookOrder_") ], "uses":["BibleBooksCodes"],
+            "outputs":{ "Python":["DerivedFiles/BibleBookOrders_Tables.py"], "JSON":["DerivedFiles/BibleBookOrders_Tables.json"],
+                        "C":["DerivedFiles/BibleBookOrders_Tables.h","DerivedFiles/BibleBookOrders_Tables.c"] } }),
+    ("BibleBooksNames", { "converter":"_BibleBooksNamesSystemsConverter", "load":"loadSystems",
+            "sources":[ ("DataFiles/BookNames","BibleBooksNames_") ], "uses":["BibleBooksCodes","ISO_639_3_Languages"],
+            "outputs":{ "Python":["DerivedFiles/BibleBooksNames_Tables.py"], "JSON":["DerivedFiles/BibleBooksNames_Tables.json"] } }),
+    ("BiblePunctuationSystems", { "converter":"_BiblePunctuationSystemsConverter", "load":"loadSystems",
+            "sources":[ ("DataFiles/PunctuationSystems","BiblePunctuationSystem_") ], "uses":[],
+            "outputs":{ "Python":["DerivedFiles/BiblePunctuationSystems_Tables.py"], "JSON":["DerivedFiles/BiblePunctuationSystems_Tables.json"],
+                        "C":["DerivedFiles/BiblePunctuationSystems_Tables.h","DerivedFiles/BiblePunctuationSystems_Tables.c"] } }),
+    ("BibleOrganizationalSystems", { "converter":"_BibleOrganizationalSystemsConverter", "load":"loadAndValidate",
+            "sources":[ "DataFiles/BibleOrganizationalSystems.xml" ],
+            "uses":["ISO_639_3_Languages","BibleBooksCodes","BibleVersificationSystems","BibleBookOrders","BibleBooksNames","BiblePunctuationSystems"],
+            "outputs":{ "Python":["DerivedFiles/BibleOrganizationalSystems_Tables.py"], "JSON":["DerivedFiles/BibleOrganizationalSystems_Tables.json"] } }),
+    ] )
+
+
+def getSourceFilepaths( componentName ):
+    """
+    Returns a sorted list of the source filepaths for the component
+        (including the sources of the components that it uses).
+    """
+    component = exportComponents[componentName]
+    results = set( [componentName + ".py"] )
+    for source in component["sources"]:
+        if isinstance( source, tuple ): results.update( DataCache.getFolderFilepaths( *source ) )
+        else: results.add( source )
+    for usedComponentName in component["uses"]: results.update( getSourceFilepaths( usedComponentName ) )
+    return sorted( results )
+# end of getSourceFilepaths
+
+
+def getSourcesHash( componentName, formatName ):
+    """
+    Returns a hash of the names and contents of the source files for this output of the component.
+    """
+    import hashlib
+    hasher = hashlib.sha1( "{} {} {}".format( componentName, formatName, exportFormats[formatName] ).encode( 'utf-8' ) )
+    for sourceFilepath in getSourceFilepaths( componentName ) + exportFormatSources.get( formatName, [] ):
+        hasher.update( "\n{} {}".format( sourceFilepath, DataCache.getContentHash( sourceFilepath ) ).encode( 'utf-8' ) )
+    return hasher.hexdigest()
+# end of getSourcesHash
+
+
+def loadManifest():
+    """
+    Returns the saved manifest dictionary (with "componentName.formatName" keys and source hash values).
+    """
+    try:
+        with open( manifestFilepath, 'rt' ) as manifestFile: return json.load( manifestFile )
+    except (OSError, ValueError): return {} # Missing or damaged so everything will be regenerated
+# end of loadManifest
+
+
+def saveManifest( manifest ):
+    """
+    Saves the manifest dictionary (atomically).
+    """
+    tempFilepath = manifestFilepath + ".tmp"
+    with open( tempFilepath, 'wt' ) as manifestFile: json.dump( manifest, manifestFile, indent=2, sort_keys=True )
+    os.replace( tempFilepath, manifestFilepath )
+# end of saveManifest
+
+
+def findStaleExports( componentNames=None, formatNames=None, force=False ):
+    """
+    Works out which outputs need to be regenerated.
+
+    Returns an OrderedDict with (componentName, formatName) keys and the new source hashes as the values.
+    """
+    if componentNames is None: componentNames = list( exportComponents.keys() )
+    if formatNames is None: formatNames = list( exportFormats.keys() )
+    for name in componentNames:
+        if name not in exportComponents: raise KeyError( _("Unknown component '{}' (expected one of {})").format( name, list(exportComponents.keys()) ) )
+    for name in formatNames:
+        if name not in exportFormats: raise KeyError( _("Unknown export format '{}' (expected one of {})").format( name, list(exportFormats.keys()) ) )
+
+    manifest = loadManifest()
+    results = OrderedDict()
+    for componentName in componentNames:
+        for formatName in formatNames:
+            if formatName not in exportComponents[componentName]["outputs"]: continue # Not supported for this component
+            sourcesHash = getSourcesHash( componentName, formatName )
+            if force or manifest.get( componentName+'.'+formatName ) != sourcesHash \
+            or not all( os.access( outputFilepath, os.F_OK ) for outputFilepath in exportComponents[componentName]["outputs"][formatName] ):
+                results[(componentName, formatName,)] = sourcesHash
+    return results
+# end of findStaleExports
+
+
+_loadedComponentNames = set() # The components whose converters have loaded their data (in this process)
+
+def _getLoadedConverter( componentName ):
+    """
+    Returns the (singleton) converter object for the component,
+        loading its data first if that hasn't already been done in this process.
+    """
+    module = importlib.import_module( componentName )
+    converter = getattr( module, exportComponents[componentName]["converter"] )()
+    if componentName not in _loadedComponentNames:
+        getattr( converter, exportComponents[componentName]["load"] )() # Load the XML
+        converter.importDataToPython() # So that forked workers don't each have to do it
+        _loadedComponentNames.add( componentName )
+    return converter
+# end of _getLoadedConverter
+
+
+def _exportInWorker( arguments ):
+    """
+    Writes one output (in a worker process -- see Globals.runInParallel).
+
+    The converter will usually have been loaded before the worker was forked,
+        but if not (e.g., on systems that can only spawn processes), the worker loads it itself.
+    Returns the list of output filepaths.
+    """
+    componentName, formatName = arguments
+    getattr( _getLoadedConverter( componentName ), exportFormats[formatName] )()
+    return exportComponents[componentName]["outputs"][formatName]
+# end of _exportInWorker
+
+
+def exportAll( componentNames=None, formatNames=None, force=False ):
+    """
+    Regenerates the outputs whose sources have changed (or all of them if force is set).
+
+    Returns an OrderedDict with (componentName, formatName) keys for the regenerated outputs
+        and lists of the filepaths that were written as the values.
+    If any export raises an exception, it's passed on and the manifest isn't updated (so the outputs all stay stale).
+    """
+    staleExports = findStaleExports( componentNames, formatNames, force )
+    if not staleExports:
+        if Globals.verbosityLevel > 1: print( _("All exports are up-to-date") )
+        return OrderedDict()
+
+    # Load the data for each converter that we need (just once)
+    for componentName in OrderedDict.fromkeys( componentName for componentName, formatName in staleExports ):
+        _getLoadedConverter( componentName )
+
+    tasks = list( staleExports.keys() )
+    if Globals.maxProcesses > 1 and len(tasks) > 1:
+        outputLists = Globals.runInParallel( _exportInWorker, tasks )
+    else: outputLists = [_exportInWorker( task ) for task in tasks]
+
+    manifest = loadManifest()
+    results = OrderedDict()
+    for task, outputList in zip( tasks, outputLists ):
+        manifest[task[0]+'.'+task[1]] = staleExports[task]
+        results[task] = outputList
+    saveManifest( manifest )
+    return results
+# end of exportAll
+
+
+def main():
+    """
+    Main program to handle command line parameters and then regenerate the stale exports.
+
+    Returns the exit status (non-zero if the exports failed).
+    """
+    # Handle command line parameters
+    from optparse import OptionParser
+    parser = OptionParser( usage="usage: %prog [options] [componentName ...]", version="v{}".format( versionString ) )
+    parser.add_option("-a", "--all", action="store_true", dest="force", default=False, help="regenerate all of the exports even if they're up-to-date")
+    parser.add_option("-n", "--dry-run", action="store_true", dest="dryRun", default=False, help="just list the exports that need regenerating")
+    parser.add_option("--format", action="append", dest="formats", metavar="FORMAT", help="only regenerate this format ({}) -- can be repeated".format( '/'.join( exportFormats.keys() ) ))
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    componentNames = Globals.commandLineArguments if Globals.commandLineArguments else None
+    if Globals.commandLineOptions.dryRun:
+        for componentName, formatName in findStaleExports( componentNames, Globals.commandLineOptions.formats, Globals.commandLineOptions.force ):
+            print( "{} {}".format( componentName, formatName ) )
+        return 0
+    try: results = exportAll( componentNames, Globals.commandLineOptions.formats, Globals.commandLineOptions.force )
+    except Exception:
+        logging.exception( _("Export failed (so nothing has been marked as regenerated)") )
+        return 1
+    if Globals.verbosityLevel > 0:
+        for (componentName, formatName), outputList in results.items():
+            print( _("  Regenerated {} {}: {}").format( componentName, formatName, ', '.join( outputList ) ) )
+        print( _("{} exports regenerated").format( len(results) ) )
+    return 0
+# end of main
+
+if __name__ == '__main__':
+    sys.exit( main() )
+# end of ExportAll.py
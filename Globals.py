@@ -4,7 +4,7 @@
 # Globals.py
 #
 # Module handling Global variables for our Bible Organisational System
-#   Last modified: 2011-01-13 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,7 +28,7 @@ Module handling global variables.
 """
 
 progName = "Globals"
-versionString = "0.06"
+versionString = "0.10"
 
 import logging, os.path
 
@@ -179,13 +179,17 @@ def setDebugFlag( newValue=True ):
 def addStandardOptionsAndProcess( parserObject ):
     """ Adds our standardOptions to the command line parser. """
     global commandLineOptions, commandLineArguments
-    global strictCheckingFlag
+    global strictCheckingFlag, backgroundCheckingFlag, maxProcesses
     parserObject.add_option("-f", "--fast", action="store_true", dest="fast", default=False, help="disable strict datafile checking")
+    parserObject.add_option("--background-checking", action="store_true", dest="backgroundChecking", default=False, help="do the strict datafile checking in a background thread so that the data can be used sooner")
     parserObject.add_option("-s", "--silent", action="store_const", dest="verbose", const=0, help="output no information to the console")
     parserObject.add_option("-q", "--quiet", action="store_const", dest="verbose", const=1, help="output less information to the console")
     parserObject.add_option("-i", "--informative", action="store_const", dest="verbose", const=3, help="output more information to the console")
     parserObject.add_option("-v", "--verbose", action="store_const", dest="verbose", const=4, help="output lots of information for the user")
     parserObject.add_option("-d", "--debug", action="store_true", dest="debug", default=False, help="output even more information for the programmer/debugger")
+    parserObject.add_option("-p", "--processes", action="store", type="int", dest="processes", default=1, help="number of worker processes to use when loading the datafiles [default: %default]")
+    parserObject.add_option("--profile-startup", action="store_true", dest="profileStartup", default=False, help="print the time and memory used by each phase of loading the datafiles when the program exits")
+    parserObject.add_option("--profile-json", action="store", dest="profileJSON", metavar="FILEPATH", help="write the startup profile to a JSON file instead (implies --profile-startup)")
     commandLineOptions, commandLineArguments = parserObject.parse_args()
     if commandLineOptions.debug: setDebugFlag()
     setVerbosity( commandLineOptions.verbose if commandLineOptions.verbose is not None else 2)
@@ -193,9 +197,46 @@ def addStandardOptionsAndProcess( parserObject ):
         print( "  commandLineOptions: {}".format( commandLineOptions ) )
         print( "  commandLineArguments: {}".format( commandLineArguments ) )
     if commandLineOptions.fast: strictCheckingFlag = False
+    if commandLineOptions.backgroundChecking: backgroundCheckingFlag = True
+    maxProcesses = max( 1, commandLineOptions.processes )
+    if commandLineOptions.profileStartup or commandLineOptions.profileJSON:
+        import StartupProfiler
+        StartupProfiler.startProfiling( commandLineOptions.profileJSON )
 # end of addStandardOptionsAndProcess
 
 
+workerFlagNames = ( 'debugFlag', 'verbosityString', 'verbosityLevel', 'strictCheckingFlag', 'backgroundCheckingFlag', )
+
+def _initialiseWorker( flags ):
+    """
+    Sets the global flags in a worker process to the values given by the parent process.
+
+    This matters if the worker wasn't forked, because then it starts with a freshly imported (default) copy of this module.
+    """
+    globals().update( flags )
+    # Workers mustn't start pools of their own
+    global maxProcesses
+    maxProcesses = 1
+# end of _initialiseWorker
+
+
+def runInParallel( function, argumentsList ):
+    """
+    Runs the (module-level) function on each item in the argumentsList using a pool of up to maxProcesses worker processes.
+
+    The workers are forked where possible, so that they inherit everything that's already loaded,
+        and the workerFlagNames flags are passed to them in any case.
+
+    Returns a list of the results in the same order as the arguments.
+    """
+    import multiprocessing
+    context = multiprocessing.get_context( 'fork' if 'fork' in multiprocessing.get_all_start_methods() else None )
+    flags = { flagName:globals()[flagName] for flagName in workerFlagNames }
+    with context.Pool( min( maxProcesses, len(argumentsList) ), _initialiseWorker, (flags,) ) as pool:
+        return pool.map( function, argumentsList )
+# end of runInParallel
+
+
 def printAllGlobals( indent=None ):
     """ Print all global variables. """
     if indent is None: indent = 2
@@ -205,6 +246,8 @@ def printAllGlobals( indent=None ):
     print( "{}verbosityString: {}".format( ( ' '*indent, verbosityString) ) )
     print( "{}verbosityLevel: {}".format( ( ' '*indent, verbosityLevel) ) )
     print( "{}strictCheckingFlag: {}".format( ( ' '*indent, strictCheckingFlag) ) )
+    print( "{}backgroundCheckingFlag: {}".format( ' '*indent, backgroundCheckingFlag ) )
+    print( "{}maxProcesses: {}".format( ' '*indent, maxProcesses ) )
 # end of printAllGlobals()
 
 
@@ -218,6 +261,9 @@ verbosityString = 'Normal'
 setVerbosityLevel( verbosityString )
 
 strictCheckingFlag = True
+backgroundCheckingFlag = False # If set (with strictCheckingFlag), the checking is done in a background thread (see DeferredValidation.py)
+
+maxProcesses = 1 # Values greater than one allow some datafiles to be loaded in parallel
 
 
 def demo():
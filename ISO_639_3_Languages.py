@@ -4,7 +4,7 @@
 # ISO_639_3_Languages.py
 #
 # Module handling ISO_639_3.xml to produce C and Python data tables
-#   Last modified: 2011-01-17 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,14 +28,13 @@ Module handling ISO_639_3_Languages.xml to produce C and Python data tables.
 """
 
 progName = "ISO 639_3_Languages handler"
-versionString = "0.92"
+versionString = "0.100"
 
-import logging, os.path
+import logging, os.path, struct, mmap
 from collections import OrderedDict
-from xml.etree.cElementTree import ElementTree
 
 from singleton import singleton
-import Globals
+import Globals, DataCache, StartupProfiler, DeferredValidation
 
 
 @singleton # Can only ever have one instance
@@ -80,7 +79,7 @@ class _ISO_639_3_Languages_Converter:
 
             self._load( XMLFilepath )
             if Globals.strictCheckingFlag:
-                self._validate()
+                DeferredValidation.runOrDefer( __name__, self._validate )
         return self
     # end of loadAndValidate
 
@@ -94,13 +93,16 @@ class _ISO_639_3_Languages_Converter:
         assert( self._XMLtree is None or len(self._XMLtree)==0 ) # Make sure we're not doing this twice
 
         if Globals.verbosityLevel > 2: print( "Loading ISO 639-3 languages XML file from '{}'...".format( XMLFilepath ) )
-        self._XMLtree = ElementTree().parse( XMLFilepath )
+        from xml.etree.cElementTree import ElementTree # Not imported until we actually have XML to parse
+        with StartupProfiler.profilePhase( __name__, "parse" ):
+            self._XMLtree = ElementTree().parse( XMLFilepath )
         assert( self._XMLtree ) # Fail here if we didn't load anything at all
 
         if self._XMLtree.tag  != self._treeTag:
             logging.error( "Expected to load '{}' but got '{}'".format( self._treeTag, self._XMLtree.tag ) )
     # end of _load
 
+    @StartupProfiler.profiledPhase( "validate" )
     def _validate( self ):
         """
         Check/validate the loaded data.
@@ -108,43 +110,115 @@ class _ISO_639_3_Languages_Converter:
         assert( self._XMLtree )
 
         uniqueDict = {}
-        #for elementName in self._uniqueElements: uniqueDict["Element_"+elementName] = []
-        for attributeName in self._uniqueAttributes: uniqueDict["Attribute_"+attributeName] = []
+        #for elementName in self._uniqueElements: uniqueDict["Element_"+elementName] = set()
+        for attributeName in self._uniqueAttributes: uniqueDict["Attribute_"+attributeName] = set()
 
         for j,element in enumerate(self._XMLtree):
-            if element.tag == self._mainElementTag:
-                # Check compulsory attributes on this main element
-                for attributeName in self._compulsoryAttributes:
-                    attributeValue = element.get( attributeName )
-                    if attributeValue is None:
-                        logging.error( "Compulsory '{}' attribute is missing from {} element in record {}".format( attributeName, element.tag, j ) )
-                    if not attributeValue:
-                        logging.warning( "Compulsory '{}' attribute is blank on {} element in record {}".format( attributeName, element.tag, j ) )
-
-                # Check optional attributes on this main element
-                for attributeName in self._optionalAttributes:
-                    attributeValue = element.get( attributeName )
-                    if attributeValue is not None:
-                        if not attributeValue:
-                            logging.warning( "Optional '{}' attribute is blank on {} element in record {}".format( attributeName, element.tag, j ) )
-
-                # Check for unexpected additional attributes on this main element
-                for attributeName in element.keys():
-                    attributeValue = element.get( attributeName )
-                    if attributeName not in self._compulsoryAttributes and attributeName not in self._optionalAttributes:
-                        logging.warning( "Additional '{}' attribute ('{}') found on {} element in record {}".format( attributeName, attributeValue, element.tag, j ) )
-
-                # Check the attributes that must contain unique information (in that particular field -- doesn't check across different attributes)
-                for attributeName in self._uniqueAttributes:
-                    attributeValue = element.get( attributeName )
-                    if attributeValue is not None:
-                        if attributeValue in uniqueDict["Attribute_"+attributeName]:
-                            logging.error( "Found '{}' data repeated in '{}' field on {} element in record {}".format( attributeValue, attributeName, element.tag, j ) )
-                        uniqueDict["Attribute_"+attributeName].append( attributeValue )
-            else:
-                logging.warning( "Unexpected element: {} in record {}".format( element.tag, j ) )
+            self._validateElement( element, j, uniqueDict )
     # end of _validate
 
+    def _validateElement( self, element, j, uniqueDict ):
+        """
+        Check/validate a single entry (element j).
+
+        uniqueDict contains a set of the values already seen for each unique attribute.
+        """
+        if element.tag == self._mainElementTag:
+            # Check compulsory attributes on this main element
+            for attributeName in self._compulsoryAttributes:
+                attributeValue = element.get( attributeName )
+                if attributeValue is None:
+                    logging.error( "Compulsory '{}' attribute is missing from {} element in record {}".format( attributeName, element.tag, j ) )
+                if not attributeValue:
+                    logging.warning( "Compulsory '{}' attribute is blank on {} element in record {}".format( attributeName, element.tag, j ) )
+
+            # Check optional attributes on this main element
+            for attributeName in self._optionalAttributes:
+                attributeValue = element.get( attributeName )
+                if attributeValue is not None:
+                    if not attributeValue:
+                        logging.warning( "Optional '{}' attribute is blank on {} element in record {}".format( attributeName, element.tag, j ) )
+
+            # Check for unexpected additional attributes on this main element
+            for attributeName in element.keys():
+                attributeValue = element.get( attributeName )
+                if attributeName not in self._compulsoryAttributes and attributeName not in self._optionalAttributes:
+                    logging.warning( "Additional '{}' attribute ('{}') found on {} element in record {}".format( attributeName, attributeValue, element.tag, j ) )
+
+            # Check the attributes that must contain unique information (in that particular field -- doesn't check across different attributes)
+            for attributeName in self._uniqueAttributes:
+                attributeValue = element.get( attributeName )
+                if attributeValue is not None:
+                    if attributeValue in uniqueDict["Attribute_"+attributeName]:
+                        logging.error( "Found '{}' data repeated in '{}' field on {} element in record {}".format( attributeValue, attributeName, element.tag, j ) )
+                    uniqueDict["Attribute_"+attributeName].add( attributeValue )
+        else:
+            logging.warning( "Unexpected element: {} in record {}".format( element.tag, j ) )
+    # end of _validateElement
+
+    @StartupProfiler.profiledPhase( "stream load" )
+    def loadAndImport( self, XMLFilepath=None ):
+        """
+        Loads the XML file and imports it straight into the Python dictionaries in a single streaming pass
+            (also validating each entry as it goes if we're doing strict checking).
+        Each element is discarded as soon as it's been processed so the full element tree is never built.
+
+        Returns the same dictionaries as importDataToPython.
+        """
+        if self._DataDicts: # We've already done an import/restructuring -- no need to repeat it
+            return self._DataDicts
+        if self._XMLtree is not None: # Someone has already loaded the full tree
+            return self.importDataToPython()
+
+        if XMLFilepath is None:
+            XMLFilepath = os.path.join( "DataFiles", self._filenameBase + ".xml" )
+        self.XMLFilepath = XMLFilepath
+        if Globals.verbosityLevel > 2: print( "Loading ISO 639-3 languages XML file from '{}'...".format( XMLFilepath ) )
+
+        validateInline = Globals.strictCheckingFlag and not Globals.backgroundCheckingFlag
+        uniqueDict = {}
+        for attributeName in self._uniqueAttributes: uniqueDict["Attribute_"+attributeName] = set()
+        myIDDict, myNameDict = OrderedDict(), OrderedDict()
+        for j, element in self.__iterEntries( XMLFilepath ):
+            if validateInline: self._validateElement( element, j, uniqueDict )
+            self._importElement( element, myIDDict, myNameDict )
+        self._DataDicts = myIDDict, myNameDict
+        if Globals.strictCheckingFlag and not validateInline: # Check the file again in the background
+            DeferredValidation.runOrDefer( __name__, self._validateFile, XMLFilepath )
+        return self._DataDicts
+    # end of loadAndImport
+
+    def __iterEntries( self, XMLFilepath ):
+        """
+        Generator which streams the XML file and yields (j, element) for each complete entry.
+        Each element is discarded after it's been yielded.
+        """
+        from xml.etree.cElementTree import iterparse # Not imported until we actually have XML to parse
+        XMLParser = iterparse( XMLFilepath, events=("start","end",) )
+        event, root = next( XMLParser ) # Get the start of the main element
+        if root.tag != self._treeTag:
+            logging.error( "Expected to load '{}' but got '{}'".format( self._treeTag, root.tag ) )
+        depth, j = 1, 0
+        for event, element in XMLParser:
+            if event == "start": depth += 1; continue
+            depth -= 1
+            if depth == 1: # We've got a complete entry
+                yield j, element
+                root.clear() # Throw away the entries that we've already processed
+                j += 1
+    # end of __iterEntries
+
+    @StartupProfiler.profiledPhase( "validate" )
+    def _validateFile( self, XMLFilepath ):
+        """
+        Streams the XML file again just to check each entry (used for background checking).
+        """
+        uniqueDict = {}
+        for attributeName in self._uniqueAttributes: uniqueDict["Attribute_"+attributeName] = set()
+        for j, element in self.__iterEntries( XMLFilepath ):
+            self._validateElement( element, j, uniqueDict )
+    # end of _validateFile
+
     def __str__( self ):
         """
         This method returns the string representation of a Bible book code.
@@ -154,10 +228,11 @@ class _ISO_639_3_Languages_Converter:
         """
         result = "_ISO_639_3_Languages_Converter object"
         if self.title: result += ('\n' if result else '') + self.title
-        result += ('\n' if result else '') + "  Num entries = " + str(len(self._XMLtree))
+        result += ('\n' if result else '') + "  Num entries = " + str(len(self._XMLtree) if self._XMLtree is not None else len(self._DataDicts[0]))
         return result
     # end of __str__
 
+    @StartupProfiler.profiledPhase( "import" )
     def importDataToPython( self ):
         """
         Loads (and pivots) the data into suitable Python containers to use in a Python program.
@@ -170,29 +245,36 @@ class _ISO_639_3_Languages_Converter:
         # We'll create a number of dictionaries with different Attributes as the key
         myIDDict, myNameDict = OrderedDict(), OrderedDict()
         for element in self._XMLtree:
-            # Get the required information out of the tree for this element
-            # Start with the compulsory attributes
-            ID = element.get("id")
-            Name = element.get("name")
-            Type = element.get("type")
-            Scope = element.get("scope")
-            # The optional attributes are set to None if they don't exist
-            Part1Code = element.get("part1_code")
-            Part2Code = element.get("part2_code")
-
-            # Now put it into my dictionaries for easy access
-            # This part should be customized or added to for however you need to process the data
-            #   Add .upper() if you require the abbreviations to be uppercase (or .lower() for lower case)
-            if "id" in self._compulsoryAttributes or ID:
-                if "id" in self._uniqueElements: assert( ID not in myIDDict ) # Shouldn't be any duplicates
-                myIDDict[ID] = ( Name, Type, Scope, Part1Code, Part2Code, )
-            if "name" in self._compulsoryAttributes or Name:
-                if "name" in self._uniqueElements: assert( Name not in myNameDict ) # Shouldn't be any duplicates
-                myNameDict[Name] = ( ID, Type, Scope, Part1Code, Part2Code, )
-            self._DataDicts = myIDDict, myNameDict
+            self._importElement( element, myIDDict, myNameDict )
+        self._DataDicts = myIDDict, myNameDict
         return self._DataDicts # Just throw away any of the dictionaries that you don't need
     # end of importDataToPython
 
+    def _importElement( self, element, myIDDict, myNameDict ):
+        """
+        Puts the information from a single entry into the given dictionaries.
+        """
+        # Get the required information out of the tree for this element
+        # Start with the compulsory attributes
+        ID = element.get("id")
+        Name = element.get("name")
+        Type = element.get("type")
+        Scope = element.get("scope")
+        # The optional attributes are set to None if they don't exist
+        Part1Code = element.get("part1_code")
+        Part2Code = element.get("part2_code")
+
+        # Now put it into my dictionaries for easy access
+        # This part should be customized or added to for however you need to process the data
+        #   Add .upper() if you require the abbreviations to be uppercase (or .lower() for lower case)
+        if "id" in self._compulsoryAttributes or ID:
+            if "id" in self._uniqueElements: assert( ID not in myIDDict ) # Shouldn't be any duplicates
+            myIDDict[ID] = ( Name, Type, Scope, Part1Code, Part2Code, )
+        if "name" in self._compulsoryAttributes or Name:
+            if "name" in self._uniqueElements: assert( Name not in myNameDict ) # Shouldn't be any duplicates
+            myNameDict[Name] = ( ID, Type, Scope, Part1Code, Part2Code, )
+    # end of _importElement
+
     def exportDataToPython( self, filepath=None ):
         """
         Writes the information tables to a .py file that can be cut and pasted into a Python program.
@@ -256,6 +338,8 @@ class _ISO_639_3_Languages_Converter:
     def exportDataToC( self, filepath=None ):
         """
         Writes the information tables to a .h and .c files that can be included in c and c++ programs.
+        The ID and name tables also get perfect-hash lookup functions (IDDictLookup and NameDictLookup)
+            which return the index of the key in the table (or -1).
 
         NOTE: The (optional) filepath should not have the file extension specified -- this is added automatically.
         """
@@ -324,6 +408,7 @@ class _ISO_639_3_Languages_Converter:
         # end of XXXexportPythonDict
 
         from datetime import datetime
+        import PerfectHash
 
         assert( self._XMLtree )
         self.importDataToPython()
@@ -344,6 +429,7 @@ class _ISO_639_3_Languages_Converter:
             myCFile.write( "//   {} {} loaded from the original XML file.\n//\n\n".format( len(self._XMLtree), self._treeTag ) )
             myHFile.write( "\n#ifndef {}\n#define {}\n\n".format( ifdefName, ifdefName ) )
             myCFile.write( '#include "{}"\n\n'.format( os.path.basename(hFilepath) ) )
+            PerfectHash.writeCHashFunction( myCFile )
 
             CHAR = "const unsigned char"
             BYTE = "const int"
@@ -368,6 +454,8 @@ class _ISO_639_3_Languages_Converter:
             #    exportPythonDict( myHFile, myCFile, dictData, dictName, dictInfo[dictName][0], dictInfo[dictName][1] )
             exportPythonDict( myHFile, myCFile, IDDict, "IDDict", "3-character lower-case ID field", "{}* ID; {}* Name; {} Type; {} Scope; {}* Part1Code; {}* Part2Code;".format(CHAR,CHAR,CHAR,CHAR,CHAR,CHAR) )
             exportPythonDict( myHFile, myCFile, NameDict, "NameDict", "language name (alphabetical)", "{}* Name; {}* ID; {} Type; {} Scope; {}* Part1Code; {}* Part2Code;".format(CHAR,CHAR,CHAR,CHAR,CHAR,CHAR)  )
+            PerfectHash.writeCLookupFunction( myHFile, myCFile, sorted(IDDict.keys()), "IDDict", "ID" )
+            PerfectHash.writeCLookupFunction( myHFile, myCFile, sorted(NameDict.keys()), "NameDict", "Name" )
 
             myHFile.write( "#endif // {}\n\n".format( ifdefName ) )
             myHFile.write( "// end of {}".format( os.path.basename(hFilepath) ) )
@@ -388,9 +476,131 @@ class _ISO_639_3_Languages_Converter:
             exportPythonDict( myFile, NameDict, "ISO639_3_Languages_NameDict", "{char* Name; char* ID; char* Type; char* Scope; char* Part1Code; char* Part2Code;}", "Name (sorted), ID, Type, Scope, Part1Code, Part2Code" )
             myFile.write( "#endif // {}\n".format( ifdefName ) )
     # end of exportDataToC
+
+    def exportDataToBinary( self, filepath=None, sourceFilepaths=None ):
+        """
+        Writes the ID table to a binary file that can be memory-mapped by _ISO_639_3_LanguagesTable.
+
+        The file contains a header, then the source stamps (see DataCache.getSourceStamps) of the given source files as JSON,
+            then fixed-width records sorted by ID, then the UTF-8 language names.
+        """
+        import json # Not imported until we need it
+        assert( self._DataDicts )
+        if not filepath: filepath = os.path.join( "DerivedFiles", self._filenameBase + "_Languages_Table.bin" )
+        if Globals.verbosityLevel > 1: print( "Exporting to {}...".format( filepath ) )
+
+        IDDict, NameDict = self._DataDicts
+        records, names, nameOffset = [], [], 0
+        for ID in sorted( IDDict.keys() ):
+            Name, Type, Scope, Part1Code, Part2Code = IDDict[ID]
+            encodedName = Name.encode( 'utf-8' )
+            records.append( _ISO_639_3_LanguagesTable.recordStruct.pack( ID.encode('ascii'), (Part1Code or '').encode('ascii'), (Part2Code or '').encode('ascii'),
+                                    Type.encode('ascii'), Scope.encode('ascii'), nameOffset, len(encodedName) ) )
+            names.append( encodedName )
+            nameOffset += len( encodedName )
+
+        stamps = json.dumps( DataCache.getSourceStamps( sourceFilepaths or [] ) ).encode( 'utf-8' )
+        tempFilepath = filepath + ".tmp{}".format( os.getpid() )
+        with open( tempFilepath, 'wb' ) as myFile:
+            myFile.write( _ISO_639_3_LanguagesTable.headerStruct.pack( _ISO_639_3_LanguagesTable.magic, _ISO_639_3_LanguagesTable.formatVersion, len(records), len(stamps) ) )
+            myFile.write( stamps )
+            myFile.write( b''.join( records ) )
+            myFile.write( b''.join( names ) )
+        os.replace( tempFilepath, filepath ) # So that other processes never map a partly written file
+    # end of exportDataToBinary
 # end of _ISO_639_3_Languages_Converter class
 
 
+class _ISO_639_3_LanguagesTable:
+    """
+    Class for looking up language codes in a memory-mapped binary table (as written by exportDataToBinary).
+
+    Lookups are done by binary search on the sorted fixed-width records
+        and the names are only decoded when they're asked for,
+        so many processes can share the one copy of the table in the operating system's page cache.
+    """
+    magic = b"ISO639-3"
+    formatVersion = 2
+    headerStruct = struct.Struct( "<8sIII" ) # magic, formatVersion, numEntries, stampsLength
+    recordStruct = struct.Struct( "<3s2s3s1s1sIH" ) # ID, Part1Code, Part2Code, Type, Scope, nameOffset, nameLength
+
+    def __init__( self, filepath ):
+        """
+        Constructor: maps the given binary file.
+        """
+        self.filepath = filepath
+        with open( filepath, 'rb' ) as myFile:
+            self._map = mmap.mmap( myFile.fileno(), 0, access=mmap.ACCESS_READ )
+        if len(self._map) < self.headerStruct.size: raise ValueError( "{} is not a version {} ISO 639-3 table".format( filepath, self.formatVersion ) )
+        magic, formatVersion, self._numEntries, stampsLength = self.headerStruct.unpack_from( self._map, 0 )
+        if magic != self.magic or formatVersion != self.formatVersion:
+            raise ValueError( "{} is not a version {} ISO 639-3 table".format( filepath, self.formatVersion ) )
+        self._stampsStart = self.headerStruct.size
+        self._recordsStart = self._stampsStart + stampsLength
+        self._namesStart = self._recordsStart + self._numEntries * self.recordStruct.size
+    # end of __init__
+
+    def __len__( self ):
+        """ Returns the number of language codes in the table. """
+        return self._numEntries
+    # end of __len__
+
+    def getSourceStamps( self ):
+        """ Returns the list of (filepath, size, mtime, contentHash) stamps of the files that the table was made from. """
+        import json
+        return [tuple(stamp) for stamp in json.loads( self._map[self._stampsStart:self._recordsStart].decode( 'utf-8' ) )]
+    # end of getSourceStamps
+
+    def close( self ):
+        """ Unmaps the file. """
+        self._map.close()
+    # end of close
+
+    def _findRecord( self, ccc ):
+        """ Returns the file offset of the record for the given language code, or None if it's not there. """
+        try: key = ccc.encode( 'ascii' )
+        except (AttributeError, UnicodeEncodeError): return None
+        if len(key) != 3: return None
+        recordSize, low, high = self.recordStruct.size, 0, self._numEntries
+        while low < high:
+            middle = (low + high) // 2
+            offset = self._recordsStart + middle * recordSize
+            ID = self._map[offset:offset+3]
+            if ID < key: low = middle + 1
+            elif ID > key: high = middle
+            else: return offset
+        return None
+    # end of _findRecord
+
+    def __contains__( self, ccc ):
+        """ Returns True or False. """
+        return self._findRecord( ccc ) is not None
+    # end of __contains__
+
+    def getName( self, ccc ):
+        """ Returns the language name for the given language code, or None if it's not there. """
+        offset = self._findRecord( ccc )
+        if offset is not None:
+            nameOffset, nameLength = struct.unpack_from( "<IH", self._map, offset+10 )
+            nameStart = self._namesStart + nameOffset
+            return self._map[nameStart:nameStart+nameLength].decode( 'utf-8' )
+    # end of getName
+
+    def getEntry( self, ccc ):
+        """
+        Returns the same (Name, Type, Scope, Part1Code, Part2Code) tuple as the IDDict,
+            or None if the language code isn't there.
+        """
+        offset = self._findRecord( ccc )
+        if offset is not None:
+            ID, Part1Code, Part2Code, Type, Scope, nameOffset, nameLength = self.recordStruct.unpack_from( self._map, offset )
+            nameStart = self._namesStart + nameOffset
+            return ( self._map[nameStart:nameStart+nameLength].decode( 'utf-8' ), Type.decode('ascii'), Scope.decode('ascii'),
+                        Part1Code.rstrip(b'\0').decode('ascii') or None, Part2Code.rstrip(b'\0').decode('ascii') or None, )
+    # end of getEntry
+# end of _ISO_639_3_LanguagesTable class
+
+
 @singleton # Can only ever have one instance
 class ISO_639_3_Languages:
     """
@@ -407,6 +617,7 @@ class ISO_639_3_Languages:
         """
         self.lgC = _ISO_639_3_Languages_Converter()
         self._IDDict = self._NameDict = None # We'll import into this in loadData
+        self._table = None # Or we use this memory-mapped table instead
     # end of __init__
 
     def __str__( self ):
@@ -417,18 +628,49 @@ class ISO_639_3_Languages:
         @rtype: string
         """
         result = "ISO_639_3_Languages object"
+        if self._table is not None:
+            result += ('\n' if result else '') + "  Num entries = {} (mapped from {})".format( len(self._table), self._table.filepath )
+            return result
         assert( len(self._IDDict) == len(self._NameDict) )
         result += ('\n' if result else '') + "  Num entries = {}".format( len(self._IDDict) )
         return result
     # end of __str__
 
-    def loadData( self, XMLFilepath=None ):
-        """ Loads the XML data file and imports it to dictionary format (if not done already). """
-        if not self._IDDict and not self._NameDict: # Don't do this unnecessarily
-            if XMLFilepath is not None: logging.warning( "ISO 639-3 language codes are already loaded -- your given filepath of '{}' was ignored".format( XMLFilepath ) )
-            self.lgC.loadAndValidate( XMLFilepath ) # Load the XML (if not done already)
-            self._IDDict, self._NameDict = self.lgC.importDataToPython() # Get the various dictionaries organised for quick lookup
+    @StartupProfiler.profiledPhase( "loadData" )
+    def loadData( self, XMLFilepath=None, mapped=False ):
+        """
+        Loads the XML data file and imports it to dictionary format (if not done already).
+
+        If mapped is True, the data is instead exported (if necessary) to a sorted binary table in the cache folder
+            which is then memory-mapped, so that all processes share the one copy.
+            The table records the stamps of the files that it was made from (see DataCache.getSourceStamps)
+            and is rebuilt if they don't match the given XML file.
+        """
+        if mapped and self._table is None and not self._IDDict: # Don't do this unnecessarily
+            sourceFilepaths = [ os.path.abspath( filepath ) for filepath in ( XMLFilepath if XMLFilepath is not None else os.path.join( "DataFiles", "iso_639_3.xml" ), __file__ ) ]
+            tableFilepath = os.path.join( DataCache.cacheFolder, "ISO_639_3_Languages.table" )
+            try: table = _ISO_639_3_LanguagesTable( tableFilepath )
+            except (OSError, ValueError): table = None # It doesn't exist yet or it's an old format
+            if table is not None and not DataCache.stampsMatch( table.getSourceStamps(), sourceFilepaths ):
+                table.close(); table = None
+            if table is None:
+                if Globals.verbosityLevel > 2: print( "Building {} from {}...".format( tableFilepath, sourceFilepaths[0] ) )
+                if not os.access( DataCache.cacheFolder, os.F_OK ): os.makedirs( DataCache.cacheFolder )
+                self.lgC.loadAndImport( XMLFilepath )
+                self.lgC.exportDataToBinary( tableFilepath, sourceFilepaths )
+                self.lgC._XMLtree = self.lgC._DataDicts = None # We don't want to keep these in this process
+                table = _ISO_639_3_LanguagesTable( tableFilepath )
+            self._table = table
+            del self.lgC # Now the converter class (that handles the XML) is no longer needed
+        elif self._table is None and not self._IDDict and not self._NameDict: # Don't do this unnecessarily
+            sourceFilepaths = [ XMLFilepath if XMLFilepath is not None else os.path.join( "DataFiles", "iso_639_3.xml" ), __file__ ]
+            result = DataCache.loadSnapshot( "ISO_639_3_Languages", sourceFilepaths ) # Use the saved snapshot if the XML hasn't changed
+            if result is None:
+                result = self.lgC.loadAndImport( XMLFilepath ) # Stream the XML straight into the dictionaries
+                DataCache.saveSnapshot( "ISO_639_3_Languages", sourceFilepaths, result )
+            self._IDDict, self._NameDict = result # Get the various dictionaries organised for quick lookup
             del self.lgC # Now the converter class (that handles the XML) is no longer needed
+        elif XMLFilepath is not None: logging.warning( "ISO 639-3 language codes are already loaded -- your given filepath of '{}' was ignored".format( XMLFilepath ) )
         return self
     # end of loadData
 
@@ -436,10 +678,12 @@ class ISO_639_3_Languages:
 
     def isValidLanguageCode( self, ccc ):
         """ Returns True or False. """
+        if self._table is not None: return ccc in self._table
         return ccc in self._IDDict
 
     def getLanguageName( self, ccc ):
         """ Return the language name for the given language code. """
+        if self._table is not None: return self._table.getName( ccc )
         if ccc in self._IDDict: # Look in the ID dict
             return self._IDDict[ccc][0] # The first field is the name
 # end of ISO_639_3_Languages class
@@ -0,0 +1,208 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# PerfectHash.py
+#
+# Module for making minimal perfect-hash lookup tables for our exported C tables
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for making minimal perfect-hash lookup tables for our exported C tables.
+
+The exportDataToC functions write sorted arrays of structures.
+For each string key, this module also writes a (hash and displace) perfect-hash table
+    and a lookup function which returns the index of the key in the sorted array (or -1)
+    with just two hashes and one string compare, and without any allocation.
+
+The keys are hashed (as UTF-8) with a seeded 32-bit FNV-1a hash (plus a final bit mix).
+Each key first goes into one of N buckets using seed 0.
+    The biggest buckets are placed first, searching for a seed which puts all of their keys into free slots.
+    Buckets with only one key are just placed directly into one of the remaining slots
+        (stored as a negative displacement so that the lookup doesn't need to hash again).
+"""
+
+progName = "Perfect hash table maker"
+versionString = "0.01"
+
+
+import logging
+from gettext import gettext as _
+
+
+maxSeed = 0x7FFFFFFF # So that the displacements fit in an int32_t
+
+
+def getHash( key, seed=0 ):
+    """
+    Returns the seeded 32-bit FNV-1a hash of the key (a string or UTF-8 bytes).
+
+    This must give exactly the same results as the C function written by writeCHashFunction.
+    """
+    if isinstance( key, str ): key = key.encode( 'utf-8' )
+    result = 0x811C9DC5 ^ seed
+    for byte in key:
+        result = ((result ^ byte) * 0x01000193) & 0xFFFFFFFF
+    # Mix the high bits down into the low ones (as the table sizes might be powers of two)
+    result ^= result >> 16
+    result = (result * 0x85EBCA6B) & 0xFFFFFFFF
+    result ^= result >> 13
+    result = (result * 0xC2B2AE35) & 0xFFFFFFFF
+    return result ^ (result >> 16)
+# end of getHash
+
+
+def makePerfectHash( keys ):
+    """
+    Makes a minimal perfect hash for the list of (unique) keys.
+
+    Returns a list of displacements (one for each bucket)
+        and a list of indexes (giving the position in keys of the key in each slot).
+    """
+    numKeys = len( keys )
+    assert( numKeys )
+    if len( set( keys ) ) != numKeys: raise ValueError( _("Cannot make a perfect hash with duplicate keys") )
+
+    buckets = [[] for j in range(numKeys)]
+    for index, key in enumerate( keys ):
+        buckets[getHash( key ) % numKeys].append( index )
+
+    displacements = [0] * numKeys
+    indexes = [None] * numKeys
+    bucketNumbers = sorted( range(numKeys), key=lambda b: len(buckets[b]), reverse=True )
+    for position, bucketNumber in enumerate( bucketNumbers ):
+        bucket = buckets[bucketNumber]
+        if len(bucket) <= 1: break # The rest can be placed directly
+        seed = 1
+        while True:
+            slots = [getHash( keys[index], seed ) % numKeys for index in bucket]
+            if len(set(slots)) == len(slots) and all( indexes[slot] is None for slot in slots ): break
+            seed += 1
+            if seed > maxSeed: raise ValueError( _("Unable to find a perfect hash seed for {} keys").format( len(bucket) ) )
+        displacements[bucketNumber] = seed
+        for index, slot in zip( bucket, slots ):
+            indexes[slot] = index
+    else: position = numKeys
+
+    freeSlots = [slot for slot in range(numKeys) if indexes[slot] is None]
+    for bucketNumber in bucketNumbers[position:]:
+        bucket = buckets[bucketNumber]
+        if not bucket: break # The rest are all empty
+        slot = freeSlots.pop()
+        displacements[bucketNumber] = -slot - 1
+        indexes[slot] = bucket[0]
+    assert( not freeSlots )
+    return displacements, indexes
+# end of makePerfectHash
+
+
+def lookup( key, keys, displacements, indexes ):
+    """
+    Returns the position of the key in keys (or -1 if it's not there)
+        using the tables returned by makePerfectHash.
+
+    This is the Python equivalent of the C lookup functions written by writeCLookupFunction.
+    """
+    numKeys = len( keys )
+    displacement = displacements[getHash( key ) % numKeys]
+    slot = -displacement - 1 if displacement < 0 else getHash( key, displacement ) % numKeys
+    index = indexes[slot]
+    return index if keys[index] == key else -1
+# end of lookup
+
+
+def writeCHashFunction( cFile ):
+    """
+    Writes the static hash function (and the includes that it and the lookup functions need) to the .c file.
+
+    This must be written (once) before any of the lookup functions.
+    """
+    cFile.write( "#include <stdint.h>\n#include <string.h>\n\n" )
+    cFile.write( "// Seeded 32-bit FNV-1a hash with a final mix (see PerfectHash.py V{})\n".format( versionString ) )
+    cFile.write( "static uint32_t perfectHash( uint32_t seed, const unsigned char* key )\n{\n" )
+    cFile.write( "    uint32_t result = 0x811C9DC5u ^ seed;\n" )
+    cFile.write( "    while ( *key ) result = (result ^ *key++) * 0x01000193u;\n" )
+    cFile.write( "    result ^= result >> 16; result *= 0x85EBCA6Bu;\n" )
+    cFile.write( "    result ^= result >> 13; result *= 0xC2B2AE35u;\n" )
+    cFile.write( "    return result ^ (result >> 16);\n}\n\n" )
+# end of writeCHashFunction
+
+
+def writeCLookupFunction( hFile, cFile, keys, tableName, keyField ):
+    """
+    Writes the perfect-hash tables and a lookup function for the named C array to the .c file
+        and the function prototype to the .h file.
+
+    keys must be in the same order as the entries in the C array,
+        and keyField is the name of the structure field that holds the key.
+    The function is called tableName+"Lookup" and returns the array index of the key or -1.
+    """
+    numKeys = len( keys )
+    if not numKeys:
+        logging.warning( _("No keys to write a lookup function for {}").format( tableName ) )
+        return
+    displacements, indexes = makePerfectHash( keys )
+
+    functionName = tableName + "Lookup"
+    prototype = "int {}( const unsigned char* key )".format( functionName )
+    hFile.write( "{}; // Returns the {} index or -1\n\n".format( prototype, tableName ) )
+
+    def writeArray( typeName, arrayName, values ):
+        """ Writes the list of integers as a C array (ten to a line). """
+        cFile.write( "static const {} {}[{}] = {{\n".format( typeName, arrayName, len(values) ) )
+        for j in range( 0, len(values), 10 ):
+            cFile.write( "  {},\n".format( ", ".join( str(value) for value in values[j:j+10] ) ) )
+        cFile.write( "}}; // {}\n\n".format( arrayName ) )
+    # end of writeArray
+
+    cFile.write( "// Minimal perfect hash for {} keys ({} entries)\n".format( tableName, numKeys ) )
+    writeArray( "int32_t", tableName+"Displacements", displacements )
+    writeArray( "uint16_t" if numKeys <= 0xFFFF else "uint32_t", tableName+"Indexes", indexes )
+    cFile.write( "{}\n{{\n".format( prototype ) )
+    cFile.write( "    int32_t displacement = {}Displacements[perfectHash( 0, key ) % {}];\n".format( tableName, numKeys ) )
+    cFile.write( "    uint32_t slot = displacement < 0 ? (uint32_t)(-displacement - 1) : perfectHash( (uint32_t)displacement, key ) % {};\n".format( numKeys ) )
+    cFile.write( "    int index = {}Indexes[slot];\n".format( tableName ) )
+    cFile.write( "    return strcmp( (const char*)key, (const char*){}[index].{} ) ? -1 : index;\n".format( tableName, keyField ) )
+    cFile.write( "}} // end of {}\n\n".format( functionName ) )
+# end of writeCLookupFunction
+
+
+def demo():
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    # Handle command line parameters
+    from optparse import OptionParser
+    import Globals
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 0: print( "{} V{}".format( progName, versionString ) )
+
+    keys = [ "Gen", "Exod", "Lev", "Num", "Deut", "Josh", "Judg", "Ruth", "1Sam", "2Sam", "Matt", "Mark", "Luke", "John", "Acts", "Rev" ]
+    displacements, indexes = makePerfectHash( keys )
+    print( "Displacements:", displacements )
+    print( "Indexes:", indexes )
+    for key in keys + [ "Xyz", "" ]:
+        print( "  {!r} -> {}".format( key, lookup( key, keys, displacements, indexes ) ) )
+# end of demo
+
+if __name__ == '__main__':
+    demo()
+# end of PerfectHash.py
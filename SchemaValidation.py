@@ -0,0 +1,458 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# SchemaValidation.py
+#
+# Module for validating our XML datafiles against their RelaxNG schemas
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for validating our XML datafiles against their RelaxNG schemas (in one run without calling xmllint).
+
+Each DerivedFiles/*.rng schema (made from the DataFiles .rnc files by trangAll.sh) is compiled only once,
+    and then used to validate the matching datafiles, i.e., for the schema X.rng,
+    the X.xml and X_*.xml files in the DataFiles folder which contains X.rnc.
+If Globals.maxProcesses is more than one, the files are validated in parallel.
+
+Only the parts of RelaxNG (and XML Schema datatypes) that trang produces for our schemas are handled
+    (an error is raised for anything else in a schema).
+"""
+
+progName = "Schema validator"
+versionString = "0.01"
+
+
+import logging, os, re
+from gettext import gettext as _
+from collections import OrderedDict
+from decimal import Decimal, InvalidOperation
+from xml.etree.cElementTree import ElementTree
+
+import Globals, DataCache
+
+
+_RNGNamespace = "{http://relaxng.org/ns/structure/1.0}"
+_XSDDatatypeLibrary = "http://www.w3.org/2001/XMLSchema-datatypes"
+
+_datatypeRegexes = {
+    "date": re.compile( r"-?\d{4,}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])(Z|[+-]\d\d:\d\d)?$" ),
+    "decimal": re.compile( r"[+-]?(\d+(\.\d*)?|\.\d+)$" ),
+    "integer": re.compile( r"[+-]?\d+$" ),
+    "positiveInteger": re.compile( r"\+?\d+$" ),
+    "nonNegativeInteger": re.compile( r"\+?\d+$" ),
+    }
+_stringDatatypes = ( "string", "normalizedString", "token", "anyURI", "NCName", "NMTOKEN", "language", )
+_numericDatatypes = ( "decimal", "integer", "positiveInteger", "nonNegativeInteger", )
+_supportedParams = ( "length", "minLength", "maxLength", "minInclusive", "maxInclusive", "minExclusive", "maxExclusive", "totalDigits", "fractionDigits", "pattern", )
+
+
+class RelaxNGSchema:
+    """
+    Class for compiling a RelaxNG schema (XML syntax) and validating element trees against it.
+
+    The compiled patterns are tuples starting with the kind of pattern, e.g.,
+        ('element', name, contentPattern), ('attribute', name, valuePattern), ('group', patternList),
+        ('choice', patternList), ('optional', pattern), ('zeroOrMore', pattern), ('oneOrMore', pattern), ('ref', name),
+        ('data', typeName, paramsDict), ('value', typeName, valueString), ('text',), ('empty',).
+    """
+
+    def __init__( self, schemaFilepath ):
+        """
+        Constructor: compiles the schema from the given .rng file.
+        """
+        self.schemaFilepath = schemaFilepath
+        self.defines = {}
+        root = ElementTree().parse( schemaFilepath )
+        if root.tag != _RNGNamespace+"grammar":
+            raise ValueError( _("Expected a RelaxNG grammar in {} but got '{}'").format( schemaFilepath, root.tag ) )
+        self.start = None
+        for child in root:
+            if not isinstance( child.tag, str ): continue # Skip comments
+            datatypeLibrary = child.get( "datatypeLibrary", root.get( "datatypeLibrary", '' ) )
+            if child.tag == _RNGNamespace+"start":
+                self.start = self.__compileGroup( child, datatypeLibrary )
+            elif child.tag == _RNGNamespace+"define":
+                if child.get( "combine" ): raise ValueError( _("Unsupported combined define '{}' in {}").format( child.get("name"), schemaFilepath ) )
+                self.defines[child.get("name")] = self.__compileGroup( child, datatypeLibrary )
+            else: raise ValueError( _("Unsupported RelaxNG grammar element '{}' in {}").format( child.tag, schemaFilepath ) )
+        if self.start is None: raise ValueError( _("No start pattern in {}").format( schemaFilepath ) )
+        for pattern in [self.start] + list( self.defines.values() ): self.__checkRefs( pattern )
+    # end of __init__
+
+    def __str__( self ):
+        """
+        This method returns the string representation of the schema.
+
+        @return: the name of the schema formatted as a string
+        @rtype: string
+        """
+        result = "RelaxNGSchema object"
+        result += ('\n' if result else '') + "  " + _("From {} with {} defines").format( self.schemaFilepath, len(self.defines) )
+        return result
+    # end of __str__
+
+    def __checkRefs( self, pattern ):
+        """ Checks that all the refs in the pattern are defined. """
+        kind = pattern[0]
+        if kind == 'ref':
+            if pattern[1] not in self.defines: raise ValueError( _("Undefined ref '{}' in {}").format( pattern[1], self.schemaFilepath ) )
+        elif kind in ('group','choice',):
+            for subpattern in pattern[1]: self.__checkRefs( subpattern )
+        elif kind in ('optional','zeroOrMore','oneOrMore',): self.__checkRefs( pattern[1] )
+        elif kind in ('element','attribute',): self.__checkRefs( pattern[2] )
+    # end of __checkRefs
+
+    def __compileGroup( self, element, datatypeLibrary ):
+        """ Compiles the child elements of the given element (which form an implicit group). """
+        patterns = [self.__compile( child, child.get( "datatypeLibrary", datatypeLibrary ) ) for child in element if isinstance( child.tag, str )]
+        if not patterns: raise ValueError( _("Empty {} pattern in {}").format( element.tag, self.schemaFilepath ) )
+        return patterns[0] if len(patterns)==1 else ('group', patterns,)
+    # end of __compileGroup
+
+    def __compile( self, element, datatypeLibrary ):
+        """ Compiles the given RelaxNG element into a pattern tuple. """
+        tag = element.tag[len(_RNGNamespace):] if element.tag.startswith( _RNGNamespace ) else element.tag
+        if tag in ('element','attribute',):
+            name = element.get( "name" )
+            if name is None: raise ValueError( _("Unsupported {} without a name attribute in {}").format( tag, self.schemaFilepath ) )
+            if len([child for child in element if isinstance( child.tag, str )]): content = self.__compileGroup( element, datatypeLibrary )
+            else: content = ('text',) # The default for attributes (and elements aren't allowed to be empty)
+            return (tag, name, content,)
+        if tag == 'group': return self.__compileGroup( element, datatypeLibrary )
+        if tag == 'choice':
+            return ('choice', [self.__compile( child, child.get( "datatypeLibrary", datatypeLibrary ) ) for child in element if isinstance( child.tag, str )],)
+        if tag in ('optional','zeroOrMore','oneOrMore',): return (tag, self.__compileGroup( element, datatypeLibrary ),)
+        if tag == 'ref': return ('ref', element.get("name"),)
+        if tag in ('text','empty',): return (tag,)
+        if tag == 'data':
+            typeName = self.__checkDatatype( element.get("type"), datatypeLibrary )
+            params = OrderedDict()
+            for child in element:
+                if not isinstance( child.tag, str ): continue
+                if child.tag != _RNGNamespace+"param" or child.get("name") not in _supportedParams:
+                    raise ValueError( _("Unsupported datatype parameter '{}' in {}").format( child.get("name", child.tag), self.schemaFilepath ) )
+                params[child.get("name")] = re.compile( child.text + '$' ) if child.get("name")=="pattern" else child.text
+            return ('data', typeName, params,)
+        if tag == 'value':
+            if element.get("type") is None: typeName = "token" # The built-in default
+            else: typeName = self.__checkDatatype( element.get("type"), datatypeLibrary )
+            return ('value', typeName, element.text or '',)
+        raise ValueError( _("Unsupported RelaxNG pattern '{}' in {}").format( tag, self.schemaFilepath ) )
+    # end of __compile
+
+    def __checkDatatype( self, typeName, datatypeLibrary ):
+        """ Checks that we can handle the datatype and returns its name. """
+        if datatypeLibrary not in (_XSDDatatypeLibrary, '',) \
+        or (typeName not in _stringDatatypes and typeName not in _datatypeRegexes):
+            raise ValueError( _("Unsupported datatype '{}' from '{}' in {}").format( typeName, datatypeLibrary, self.schemaFilepath ) )
+        return typeName
+    # end of __checkDatatype
+
+    def __valueMatches( self, pattern, text ):
+        """ Returns True if the text is valid for the data or value pattern. """
+        kind, typeName = pattern[0], pattern[1]
+        if kind == 'text': return True
+        if typeName not in ("string",): text = ' '.join( text.split() ) # Whitespace is collapsed for the other types
+        if kind == 'value': return text == ' '.join( pattern[2].split() ) if typeName!="string" else text == pattern[2]
+        if typeName in _datatypeRegexes and not _datatypeRegexes[typeName].match( text ): return False
+        if typeName == "positiveInteger" and int( text ) < 1: return False
+        for paramName, paramValue in pattern[2].items():
+            if paramName == "pattern":
+                if not paramValue.match( text ): return False
+            elif paramName in ("length","minLength","maxLength",):
+                if paramName=="length" and len(text)!=int(paramValue) \
+                or paramName=="minLength" and len(text)<int(paramValue) \
+                or paramName=="maxLength" and len(text)>int(paramValue): return False
+            elif paramName in ("totalDigits","fractionDigits",):
+                digits = text.lstrip( '+-' ).split( '.' )
+                fraction = digits[1].rstrip( '0' ) if len(digits)>1 else ''
+                if paramName=="totalDigits" and len( (digits[0].lstrip('0') + fraction) ) > int(paramValue) \
+                or paramName=="fractionDigits" and len(fraction) > int(paramValue): return False
+            else: # min/max Inclusive/Exclusive
+                try: number, limit = Decimal( text ), Decimal( paramValue )
+                except InvalidOperation: return False
+                if paramName=="minInclusive" and number<limit or paramName=="maxInclusive" and number>limit \
+                or paramName=="minExclusive" and number<=limit or paramName=="maxExclusive" and number>=limit: return False
+        return True
+    # end of __valueMatches
+
+    def __attributeValueMatches( self, pattern, value ):
+        """ Returns True if the attribute value is valid for the pattern (which may be a choice). """
+        if pattern[0] == 'choice': return any( self.__attributeValueMatches( subpattern, value ) for subpattern in pattern[1] )
+        if pattern[0] == 'ref': return self.__attributeValueMatches( self.defines[pattern[1]], value )
+        if pattern[0] not in ('text','data','value',): raise ValueError( _("Unsupported attribute pattern {} in {}").format( pattern, self.schemaFilepath ) )
+        return self.__valueMatches( pattern, value )
+    # end of __attributeValueMatches
+
+    def __allowsText( self, pattern, seen=None ):
+        """ Returns True if the pattern (not counting the content of nested elements) can match text. """
+        kind = pattern[0]
+        if kind in ('text','data','value',): return True
+        if kind == 'ref':
+            if seen is None: seen = set()
+            if pattern[1] in seen: return False
+            seen.add( pattern[1] )
+            return self.__allowsText( self.defines[pattern[1]], seen )
+        if kind in ('group','choice',): return any( self.__allowsText( subpattern, seen ) for subpattern in pattern[1] )
+        if kind in ('optional','zeroOrMore','oneOrMore',): return self.__allowsText( pattern[1], seen )
+        return False # elements, attributes and empty
+    # end of __allowsText
+
+    def __matchStates( self, pattern, element, children, states, childPaths ):
+        """
+        Matches the pattern against the content of the element, starting from each of the given states.
+
+        A state is (the index of the next child element, a frozenset of the attribute names matched so far).
+        Returns the set of states after the match (empty if it can't match).
+        """
+        kind = pattern[0]
+        if kind in ('empty','text',): return states
+        if kind == 'group':
+            for subpattern in pattern[1]:
+                states = self.__matchStates( subpattern, element, children, states, childPaths )
+                if not states: break
+            return states
+        if kind == 'choice':
+            results = set()
+            for subpattern in pattern[1]: results |= self.__matchStates( subpattern, element, children, states, childPaths )
+            return results
+        if kind == 'optional': return states | self.__matchStates( pattern[1], element, children, states, childPaths )
+        if kind in ('zeroOrMore','oneOrMore',):
+            if kind == 'oneOrMore': states = self.__matchStates( pattern[1], element, children, states, childPaths )
+            results = set( states )
+            while states: # Keep going until we stop getting new states
+                states = self.__matchStates( pattern[1], element, children, states, childPaths ) - results
+                results |= states
+            return results
+        if kind == 'ref': return self.__matchStates( self.defines[pattern[1]], element, children, states, childPaths )
+        if kind == 'attribute':
+            value = element.get( pattern[1] )
+            if value is None or not self.__attributeValueMatches( pattern[2], value ): return set()
+            return set( (position, matched|{pattern[1]}) for position, matched in states if pattern[1] not in matched )
+        if kind == 'element':
+            results = set()
+            for position, matched in states:
+                if position < len(children) and children[position].tag == pattern[1] \
+                and self.__validateElement( pattern, children[position], childPaths[position] ):
+                    results.add( (position+1, matched,) )
+            return results
+        if kind in ('data','value',):
+            if children: return set() # We only handle data in elements without children
+            return states if self.__valueMatches( pattern, element.text or '' ) else set()
+        raise ValueError( _("Unexpected pattern {}").format( pattern ) )
+    # end of __matchStates
+
+    def __getChildPaths( self, children, path ):
+        """ Returns a list of the XPath-like paths of the child elements (for error messages). """
+        counts, childPaths = {}, []
+        for child in children:
+            counts[child.tag] = counts.get( child.tag, 0 ) + 1
+            childPaths.append( "{}/{}[{}]".format( path, child.tag, counts[child.tag] ) )
+        return childPaths
+    # end of __getChildPaths
+
+    def __validateElement( self, pattern, element, path ):
+        """
+        Returns True if the element (and its content) matches the element pattern.
+
+        The results are remembered so that each element is only checked once,
+            and the errors are recorded (we report the most deeply nested one).
+        """
+        key = (id(pattern), id(element),)
+        if key in self.__checked: return self.__checked[key]
+        children = [child for child in element if isinstance( child.tag, str )]
+        content = pattern[2]
+        hasText = bool( (element.text or '').strip() ) or any( (child.tail or '').strip() for child in children )
+        if hasText and not self.__allowsText( content ):
+            self.__addError( path, _("Unexpected text in {} element").format( element.tag ) )
+            result = False
+        else:
+            finalStates = self.__matchStates( content, element, children, set( [(0, frozenset(),)] ), self.__getChildPaths( children, path ) )
+            result = False
+            for position, matched in finalStates:
+                if position == len(children) and len(matched) == len(element.attrib):
+                    result = True; break
+            if not result:
+                if any( position==len(children) for position, matched in finalStates ):
+                    extras = set( element.attrib ) - set().union( *(matched for position, matched in finalStates) )
+                    self.__addError( path, _("Unexpected or invalid attributes {} on {} element").format( sorted(extras), element.tag ) )
+                else:
+                    position = max( [position for position, matched in finalStates] + [0] )
+                    self.__addError( path, _("The attributes or content of the {} element don't match the schema (after {} of its {} child elements)").format( element.tag, position, len(children) ) )
+        self.__checked[key] = result
+        return result
+    # end of __validateElement
+
+    def __addError( self, path, message ):
+        """ Remembers the error if it's at least as deeply nested as the ones that we already have. """
+        depth = path.count( '/' )
+        if depth > self.__errorDepth: self.__errors, self.__errorDepth = [], depth
+        if depth == self.__errorDepth: self.__errors.append( "{}: {}".format( path, message ) )
+    # end of __addError
+
+    def validate( self, tree ):
+        """
+        Validates the given element tree (or root element).
+
+        Returns a list of error strings (empty if the tree is valid).
+        """
+        root = tree.getroot() if hasattr( tree, "getroot" ) else tree
+        self.__checked, self.__errors, self.__errorDepth = {}, [], -1
+        wrapper = [root] # The start pattern is matched against a list containing just the root element
+        finalStates = self.__matchStates( self.start, None, wrapper, set( [(0, frozenset(),)] ), self.__getChildPaths( wrapper, '' ) )
+        valid = any( position==1 for position, matched in finalStates )
+        errors = [] if valid else ( self.__errors if self.__errors else [ _("Unexpected root element '{}'").format( root.tag ) ] )
+        self.__checked = None # Don't keep the element ids
+        return errors
+    # end of validate
+# end of RelaxNGSchema class
+
+
+_compiledSchemas = {} # Key is the schema filepath, value is the RelaxNGSchema (so each process compiles each schema only once)
+
+def getSchema( schemaFilepath ):
+    """
+    Returns the compiled RelaxNGSchema for the .rng file.
+    """
+    if schemaFilepath not in _compiledSchemas:
+        _compiledSchemas[schemaFilepath] = RelaxNGSchema( schemaFilepath )
+    return _compiledSchemas[schemaFilepath]
+# end of getSchema
+
+
+def validateFile( schemaFilepath, dataFilepath ):
+    """
+    Validates the XML datafile against the schema.
+
+    Returns a list of error strings (empty if the file is valid).
+    """
+    if Globals.verbosityLevel > 2: print( _("Validating {} against {}...").format( dataFilepath, schemaFilepath ) )
+    try: tree = ElementTree().parse( dataFilepath )
+    except Exception as err: # Probably not well-formed
+        return [ _("Unable to parse: {}").format( err ) ]
+    return getSchema( schemaFilepath ).validate( tree )
+# end of validateFile
+
+
+def _validateFileInWorker( arguments ):
+    """
+    Validates one file in a worker process (see Globals.runInParallel).
+    """
+    schemaFilepath, dataFilepath = arguments
+    return validateFile( schemaFilepath, dataFilepath )
+# end of _validateFileInWorker
+
+
+def findDataFiles( dataFolder=None, schemaFolder=None ):
+    """
+    Finds each .rng schema in the schemaFolder and the datafiles that it applies to.
+
+    Returns an OrderedDict with the schema filepath as the key and a list of the datafile filepaths as the value.
+    """
+    if dataFolder is None: dataFolder = "DataFiles"
+    if schemaFolder is None: schemaFolder = "DerivedFiles"
+
+    RNCFolders = {} # Key is the base name of the .rnc file, value is the folder that it's in
+    for folder, subfolders, filenames in os.walk( dataFolder ):
+        subfolders.sort()
+        for filename in filenames:
+            filepart, extension = os.path.splitext( filename )
+            if extension.upper() == ".RNC": RNCFolders[filepart] = folder
+
+    results = OrderedDict()
+    for filename in sorted( os.listdir( schemaFolder ) ):
+        filepart, extension = os.path.splitext( filename )
+        if extension.upper() != ".RNG": continue
+        schemaFilepath = os.path.join( schemaFolder, filename )
+        if filepart not in RNCFolders:
+            logging.warning( _("Can't find the .rnc file for the {} schema in {}").format( schemaFilepath, dataFolder ) )
+            continue
+        dataFilepaths = DataCache.getFolderFilepaths( RNCFolders[filepart], filepart+'_' )
+        singleFilepath = os.path.join( RNCFolders[filepart], filepart+".xml" )
+        if os.access( singleFilepath, os.R_OK ): dataFilepaths.insert( 0, singleFilepath )
+        results[schemaFilepath] = dataFilepaths
+    return results
+# end of findDataFiles
+
+
+def validateDataFiles( dataFolder=None, schemaFolder=None ):
+    """
+    Validates all of the datafiles that have schemas, compiling each schema only once.
+    If Globals.maxProcesses is more than one, the files are validated in parallel.
+
+    Returns an OrderedDict with the datafile filepath as the key and (schemaFilepath, errorList) as the value.
+    """
+    fileDict = findDataFiles( dataFolder, schemaFolder )
+    argumentsList = []
+    for schemaFilepath, dataFilepaths in fileDict.items():
+        getSchema( schemaFilepath ) # Compile it now (so that any schema problems are found once, and so that forked workers inherit it)
+        for dataFilepath in dataFilepaths: argumentsList.append( (schemaFilepath, dataFilepath,) )
+
+    if Globals.maxProcesses > 1 and len(argumentsList) > 1:
+        errorLists = Globals.runInParallel( _validateFileInWorker, argumentsList )
+    else: errorLists = [_validateFileInWorker( arguments ) for arguments in argumentsList]
+
+    results = OrderedDict()
+    for (schemaFilepath, dataFilepath), errorList in zip( argumentsList, errorLists ):
+        results[dataFilepath] = (schemaFilepath, errorList,)
+    return results
+# end of validateDataFiles
+
+
+def getSummary( results ):
+    """
+    Returns a summary dictionary for the results from validateDataFiles (suitable for saving as JSON).
+    """
+    failed = OrderedDict( (dataFilepath, errorList) for dataFilepath, (schemaFilepath, errorList) in results.items() if errorList )
+    return { "numFiles":len(results), "numPassed":len(results)-len(failed), "numFailed":len(failed), "failures":failed }
+# end of getSummary
+
+
+def main():
+    """
+    Main program to handle command line parameters and then validate the datafiles.
+    Exits with a non-zero status if any of them are invalid.
+    """
+    # Handle command line parameters
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    parser.add_option("-j", "--json", action="store", dest="JSONFilepath", metavar="FILEPATH", help="also write the summary to a JSON file")
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    results = validateDataFiles()
+    for dataFilepath, (schemaFilepath, errorList) in results.items():
+        if errorList:
+            print( "FAIL {}".format( dataFilepath ) )
+            for error in errorList: print( "  {}".format( error ) )
+        elif Globals.verbosityLevel > 1: print( "pass {}".format( dataFilepath ) )
+    summary = getSummary( results )
+    if Globals.verbosityLevel > 0: print( _("{} files checked: {} passed, {} failed").format( summary["numFiles"], summary["numPassed"], summary["numFailed"] ) )
+    if Globals.commandLineOptions.JSONFilepath:
+        import json
+        with open( Globals.commandLineOptions.JSONFilepath, 'wt' ) as JSONFile: json.dump( summary, JSONFile, indent=2 )
+    return 1 if summary["numFailed"] else 0
+# end of main
+
+if __name__ == '__main__':
+    import sys
+    sys.exit( main() )
+# end of SchemaValidation.py
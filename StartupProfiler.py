@@ -0,0 +1,205 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# StartupProfiler.py
+#
+# Module for timing the phases of loading our reference data
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module for timing the phases of loading our reference data.
+
+When profiling is started (usually by the --profile-startup command line option),
+    the wall time, CPU time and allocated memory of each phase
+    (e.g., XML parse, validation, import, names expansion) are totalled for each component
+    and a report sorted by self wall time is printed (or written as JSON) when the program exits.
+
+Phases can be nested (e.g., loadData around parse, validate and import)
+    so the total times of an enclosing phase include those of the phases inside it.
+The self times exclude the enclosed phases, so the self times can be summed without double counting.
+
+Phases can be run in different threads -- each thread keeps its own stack of active phases.
+
+When profiling isn't started, the phases run with almost no overhead.
+"""
+
+progName = "Startup profiler"
+versionString = "0.03"
+
+
+import time, atexit, threading
+from functools import wraps
+from gettext import gettext as _
+
+import Globals
+
+
+profilingFlag = False
+_JSONFilepath = None
+_totals = {} # Key is (component, phase), value is a list of [count, wallTime, CPUTime, allocatedBytes, selfWallTime, selfCPUTime, selfAllocatedBytes]
+_totalsLock = threading.Lock() # Phases might finish in different threads at the same time
+_activePhases = threading.local() # Each thread has its own stack of (nested) phases
+
+
+class profilePhase:
+    """
+    Context manager which adds the time and memory used by the enclosed code
+        to the totals for the given component and phase.
+    """
+
+    def __init__( self, component, phase ):
+        """
+        Constructor:
+        """
+        self.component, self.phase = component, phase
+    # end of __init__
+
+    def __enter__( self ):
+        if profilingFlag:
+            import tracemalloc # Already imported by startProfiling so this is cheap
+            self.childWallTime, self.childCPUTime, self.childAllocatedBytes = 0.0, 0.0, 0 # Totals of any nested phases
+            if not hasattr( _activePhases, 'stack' ): _activePhases.stack = []
+            _activePhases.stack.append( self )
+            self.startMemory = tracemalloc.get_traced_memory()[0]
+            self.startCPUTime = time.process_time()
+            self.startWallTime = time.perf_counter()
+        return self
+    # end of __enter__
+
+    def __exit__( self, exceptionType, exceptionValue, traceback ):
+        if profilingFlag and hasattr( self, 'startWallTime' ): # Profiling might have been started inside the phase
+            wallTime = time.perf_counter() - self.startWallTime
+            CPUTime = time.process_time() - self.startCPUTime
+            import tracemalloc
+            allocatedBytes = tracemalloc.get_traced_memory()[0] - self.startMemory
+            stack = _activePhases.stack
+            assert( stack[-1] is self )
+            stack.pop()
+            if stack: # Let the enclosing phase know how much of its time was ours
+                parent = stack[-1]
+                parent.childWallTime += wallTime; parent.childCPUTime += CPUTime; parent.childAllocatedBytes += allocatedBytes
+            with _totalsLock:
+                totals = _totals.setdefault( (self.component, self.phase), [0, 0.0, 0.0, 0, 0.0, 0.0, 0] )
+                totals[0] += 1; totals[1] += wallTime; totals[2] += CPUTime; totals[3] += allocatedBytes
+                totals[4] += wallTime - self.childWallTime; totals[5] += CPUTime - self.childCPUTime; totals[6] += allocatedBytes - self.childAllocatedBytes
+        return False # Don't suppress any exceptions
+    # end of __exit__
+# end of profilePhase class
+
+
+def profiledPhase( phase ):
+    """
+    Decorator which profiles each call of the function as the given phase.
+
+    The component is taken from the name of the module that the function is in.
+    """
+    def decorator( function ):
+        @wraps( function )
+        def wrapper( *args, **kwargs ):
+            if not profilingFlag: return function( *args, **kwargs )
+            with profilePhase( function.__module__, phase ):
+                return function( *args, **kwargs )
+        return wrapper
+    return decorator
+# end of profiledPhase
+
+
+def startProfiling( JSONFilepath=None ):
+    """
+    Starts collecting the timings and arranges for the report to be produced at exit.
+
+    If a JSONFilepath is given, the report is written there instead of being printed.
+    """
+    global profilingFlag, _JSONFilepath
+    if not profilingFlag:
+        import tracemalloc # Only imported if we're profiling
+        profilingFlag = True
+        if not tracemalloc.is_tracing(): tracemalloc.start()
+        atexit.register( _finishProfiling )
+    _JSONFilepath = JSONFilepath
+# end of startProfiling
+
+
+def getReport():
+    """
+    Returns a list of dictionaries (one for each component and phase) sorted by decreasing self wall time.
+
+    The wallTime, CPUTime and allocatedBytes totals include any nested phases;
+        the selfWallTime, selfCPUTime and selfAllocatedBytes totals don't.
+    """
+    results = []
+    with _totalsLock:
+        for (component, phase), (count, wallTime, CPUTime, allocatedBytes, selfWallTime, selfCPUTime, selfAllocatedBytes) in _totals.items():
+            results.append( { "component":component, "phase":phase, "count":count, "wallTime":wallTime, "CPUTime":CPUTime, "allocatedBytes":allocatedBytes,
+                            "selfWallTime":selfWallTime, "selfCPUTime":selfCPUTime, "selfAllocatedBytes":selfAllocatedBytes } )
+    return sorted( results, key=lambda entry: entry["selfWallTime"], reverse=True )
+# end of getReport
+
+
+def printReport():
+    """
+    Prints the sorted report to the console.
+    """
+    print( _("Startup profile (sorted by self wall time -- the totals include any nested phases):") )
+    print( "  {:<28} {:<16} {:>6} {:>10} {:>10} {:>10} {:>12}".format( _("Component"), _("Phase"), _("Count"), _("Self (s)"), _("Wall (s)"), _("CPU (s)"), _("Memory (KB)") ) )
+    for entry in getReport():
+        print( "  {:<28} {:<16} {:>6} {:>10.4f} {:>10.4f} {:>10.4f} {:>12.1f}".format( entry["component"], entry["phase"], entry["count"], entry["selfWallTime"], entry["wallTime"], entry["CPUTime"], entry["allocatedBytes"]/1024 ) )
+# end of printReport
+
+
+def writeJSONReport( filepath ):
+    """
+    Writes the sorted report to the given JSON file.
+    """
+    import json
+    with open( filepath, 'wt' ) as myFile:
+        json.dump( getReport(), myFile, indent=2 )
+# end of writeJSONReport
+
+
+def _finishProfiling():
+    """
+    Called at exit to produce the report.
+    """
+    if _JSONFilepath: writeJSONReport( _JSONFilepath )
+    else: printReport()
+# end of _finishProfiling
+
+
+def demo():
+    """
+    Demo program to handle command line parameters and then run what they want.
+    """
+    # Handle command line parameters
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 0: print( "{} V{}".format( progName, versionString ) )
+
+    import StartupProfiler # Not this __main__ module, because that's not the one that the other modules use
+    StartupProfiler.startProfiling( Globals.commandLineOptions.profileJSON ) # Even if --profile-startup wasn't given
+    from BibleOrganizationalSystems import BibleOrganizationalSystems
+    BibleOrganizationalSystems().loadData() # Loads all of the other data too
+# end of demo
+
+if __name__ == '__main__':
+    demo()
+# end of StartupProfiler.py
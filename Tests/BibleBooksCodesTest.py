@@ -4,7 +4,7 @@
 # BibleBooksCodesTest.py
 #
 # Module testing BibleBooksCodes.py
-#   Last modified: 2011-01-21 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,10 +28,10 @@ Module testing BibleBooksCodes.py.
 """
 
 progName = "Bible Books Codes tests"
-versionString = "0.96"
+versionString = "0.98"
 
 
-import sys, os.path
+import sys, os.path, shutil, subprocess, tempfile
 import unittest
 
 sourceFolder = "."
@@ -192,6 +192,17 @@ class BibleBooksCodesTests(unittest.TestCase):
         self.assertRaises( KeyError, self.bbc.getBBBFromOSIS, 'Genesis' )
     # end of test_200_getBBBFromOSIS
 
+    def test_210_translate( self ):
+        """ Test the translate function. """
+        self.assertEqual( self.bbc.translate( ['Gen','1Cor','Rev'], "OSIS", "BBB" ), ['GEN','CO1','REV'] )
+        self.assertEqual( self.bbc.translate( ['GEN','CO1','REV'], "BBB", "OSIS" ), ['Gen','1Cor','Rev'] )
+        self.assertEqual( self.bbc.translate( ('Gen','Matt'), "OSIS", "Paratext" ), ['Gen','Mat'] )
+        self.assertEqual( self.bbc.translate( ['Gen','XYZ'], "OSIS", "referenceNumber" ), [1,None] )
+        self.assertEqual( self.bbc.translate( [], "SBL", "Sword" ), [] )
+        self.assertRaises( ValueError, self.bbc.translate, ['Gen'], "OSIS", "XYZ" )
+        self.assertRaises( ValueError, self.bbc.translate, ['Gen'], "XYZ", "OSIS" )
+    # end of test_210_translate
+
     def test_300_getExpectedChaptersList( self ):
         """ Test the getSingleChapterBooksList function. """
         self.assertEqual( self.bbc.getExpectedChaptersList('GEN'), ['50'] )
@@ -254,6 +265,43 @@ class BibleBooksCodesTests(unittest.TestCase):
 # end of BibleBooksCodesTests class
 
 
+class BibleBooksCodesExportTests(unittest.TestCase):
+    """ Unit tests for the exported BibleBooksCodes tables. """
+
+    def setUp( self ):
+        self.folder = tempfile.mkdtemp()
+        self.bbcc = BibleBooksCodes._BibleBooksCodesConverter().loadAndValidate( os.path.join( sourceFolder, "DataFiles/BibleBooksCodes.xml" ) )
+
+    def tearDown( self ):
+        shutil.rmtree( self.folder )
+
+    @unittest.skipUnless( shutil.which( "gcc" ), "needs gcc" )
+    def test_010_exportDataToC( self ):
+        """ Test that the exported C tables compile and that every key can be looked up. """
+        savedVerbosityLevel, Globals.verbosityLevel = Globals.verbosityLevel, 0
+        try: self.bbcc.exportDataToC( os.path.join( self.folder, "BibleBooksCodes_Tables" ) )
+        finally: Globals.verbosityLevel = savedVerbosityLevel
+        keyFields = dict( BibleBooksCodes.codeSystems.values() )
+        keyFields["EnglishNameDict"] = "nameEnglish"
+        del keyFields["referenceNumberDict"] # Has integer keys so there's no lookup function
+        with open( os.path.join( self.folder, "test.c" ), 'wt' ) as myFile:
+            myFile.write( '#include <stdio.h>\n#include <string.h>\n#include "BibleBooksCodes_Tables.c"\n\nint main( void ) {\n' )
+            for dictName, keyField in sorted( keyFields.items() ):
+                myFile.write( '  for( int j=0; j<(int)(sizeof({0})/sizeof({0}[0])); j++ )\n'.format( dictName ) )
+                myFile.write( '    if( {0}Lookup( {0}[j].{1} ) != j ) printf( "{0} %d\\n", j );\n'.format( dictName, keyField ) )
+                myFile.write( '  if( {0}Lookup( (const unsigned char*)"NotAKey" ) != -1 ) printf( "{0} NotAKey\\n" );\n'.format( dictName ) )
+            myFile.write( '  for( int j=0; j<(int)(sizeof(referenceAbbreviationDict)/sizeof(referenceAbbreviationDict[0])); j++ )\n' )
+            myFile.write( '    printf( "%s %d %s %s\\n", referenceAbbreviationDict[j].referenceAbbreviation, referenceAbbreviationDict[j].referenceNumber,\n' )
+            myFile.write( '      referenceAbbreviationDict[j].OSISAbbreviation, referenceAbbreviationDict[j].nameEnglish );\n  return 0;\n}\n' )
+        subprocess.run( ["gcc", "-std=c99", "-Werror=int-conversion", "-o", "test", "test.c"], cwd=self.folder, check=True, capture_output=True )
+        output = subprocess.run( [os.path.join( self.folder, "test" )], check=True, capture_output=True, universal_newlines=True ).stdout
+        expected = [ "{} {} {} {}".format( BBB, record["referenceNumber"], record["OSISAbbreviation"] or "", record["nameEnglish"] )
+                        for BBB, record in sorted( self.bbcc.importDataToPython()["referenceAbbreviationDict"].items() ) ]
+        self.assertEqual( output.split( '\n' )[:-1], expected ) # No lookup failures were printed first
+    # end of test_010_exportDataToC
+# end of BibleBooksCodesExportTests class
+
+
 if __name__ == '__main__':
     # Handle command line parameters (for compatibility)
     from optparse import OptionParser
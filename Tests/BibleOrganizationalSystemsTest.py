@@ -0,0 +1,148 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# BibleOrganizationalSystemsTest.py
+#
+# Module testing BibleOrganizationalSystems.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing BibleOrganizationalSystems.py.
+"""
+
+progName = "Bible organizational systems tests"
+versionString = "0.02"
+
+
+
+import sys, gc, threading
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, BibleOrganizationalSystems
+from singleton import getRegisteredSingletons
+
+
+def _reportKJVInWorker( workerNumber, queue ):
+    """ Run in each forked worker to report what it can see of the preloaded data. """
+    import BibleVersificationSystems
+    bvss = BibleVersificationSystems.BibleVersificationSystems() # Already loaded before the fork
+    queue.put( (workerNumber, bvss.getVersificationSystem( "KJV" )[0]["MAT"]["numChapters"], len( bvss )) )
+
+
+def _discardAllSingletons():
+    """ Forgets all of the loaded singletons so that the next test has to load them again. """
+    for getinstance in getRegisteredSingletons().values(): getinstance.discard()
+
+
+class WarmUpTests(unittest.TestCase):
+    """ Unit tests for warming up the singletons. """
+
+    def setUp( self ):
+        _discardAllSingletons()
+
+    def tearDown( self ):
+        _discardAllSingletons()
+
+    def test_010_warmUp( self ):
+        """ Test that warmUp (in parallel) loads all of the singletons and returns the shared instances. """
+        results = BibleOrganizationalSystems.warmUp()
+        self.assertEqual( list( results.keys() ), list( BibleOrganizationalSystems.warmUpSingletons.keys() ) )
+        for name, result in results.items():
+            self.assertIs( result, BibleOrganizationalSystems._getWarmUpSingleton( name )() )
+        self.assertTrue( "KJV" in results["versification"].getAvailableVersificationSystemNames() )
+        self.assertEqual( BibleOrganizationalSystems.BibleOrganizationalSystem( "KJV-1611_edition" ).getBBB( "Mat" ), "MAT" )
+    # end of test_010_warmUp
+
+    def test_020_warmUpSerialMatchesParallel( self ):
+        """ Test that a serial warm up loads the same data as a parallel one. """
+        names = ["codes","orders","versification"]
+        parallelResults = BibleOrganizationalSystems.warmUp( names )
+        parallelData = ( len( parallelResults["codes"] ), parallelResults["orders"].getAvailableBookOrderSystemNames(), parallelResults["versification"].getVersificationSystem( "KJV" ) )
+        _discardAllSingletons()
+        serialResults = BibleOrganizationalSystems.warmUp( names, parallel=False )
+        for name in names: self.assertIsNot( serialResults[name], parallelResults[name] )
+        self.assertEqual( ( len( serialResults["codes"] ), serialResults["orders"].getAvailableBookOrderSystemNames(), serialResults["versification"].getVersificationSystem( "KJV" ) ), parallelData )
+    # end of test_020_warmUpSerialMatchesParallel
+
+    def test_030_concurrentLoadData( self ):
+        """ Test that threads which all load the organizational systems at once share one loaded instance. """
+        numThreads = 8
+        barrier = threading.Barrier( numThreads )
+        results = [None] * numThreads
+        def run( j ):
+            barrier.wait() # Start them all at the same time
+            results[j] = BibleOrganizationalSystems.BibleOrganizationalSystems().loadData()
+        threads = [threading.Thread( target=run, args=(j,) ) for j in range( numThreads )]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        for result in results: self.assertIs( result, results[0] )
+        self.assertTrue( "KJV-1611" in results[0].getAvailableOrganizationalSystemNames() )
+    # end of test_030_concurrentLoadData
+
+    def test_040_unknownName( self ):
+        """ Test that an unknown singleton name is rejected before anything is loaded. """
+        self.assertRaises( KeyError, BibleOrganizationalSystems.warmUp, ["codes","nonsense"] )
+    # end of test_040_unknownName
+# end of WarmUpTests class
+
+
+class PreloadAndFreezeTests(unittest.TestCase):
+    """ Unit tests for preloading the singletons and forking workers to use them. """
+
+    def setUp( self ):
+        _discardAllSingletons()
+
+    def tearDown( self ):
+        gc.unfreeze()
+        _discardAllSingletons()
+
+    def test_010_preloadAndFork( self ):
+        """ Test that forked workers can use the preloaded data. """
+        import multiprocessing
+        results = BibleOrganizationalSystems.preloadAndFreeze( ["codes","versification"] )
+        self.assertEqual( list( results.keys() ), ["codes","versification"] )
+        self.assertGreater( gc.get_freeze_count(), 0 )
+        self.assertTrue( gc.isenabled() ) # It's only disabled during the load
+        numWorkers = 3
+        queue = multiprocessing.get_context( "fork" ).Queue()
+        processes = BibleOrganizationalSystems.forkWorkers( numWorkers, _reportKJVInWorker, (queue,) )
+        self.assertEqual( len( processes ), numWorkers )
+        reports = sorted( queue.get( timeout=60 ) for j in range( numWorkers ) )
+        for process in processes:
+            process.join( 60 )
+            self.assertEqual( process.exitcode, 0 )
+        self.assertEqual( reports, [(j, "28", len( results["versification"] )) for j in range( numWorkers )] )
+    # end of test_010_preloadAndFork
+# end of PreloadAndFreezeTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of BibleOrganizationalSystemsTest.py
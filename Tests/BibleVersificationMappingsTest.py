@@ -0,0 +1,150 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# BibleVersificationMappingsTest.py
+#
+# Module testing BibleVersificationMappings.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing BibleVersificationMappings.py.
+"""
+
+progName = "Bible Versification Mappings tests"
+versionString = "0.03"
+
+
+import sys, os.path
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, BibleVersificationMappings, BibleVersificationSystems
+
+
+class BibleVersificationMappingsTests(unittest.TestCase):
+    """ Unit tests for the BibleVersificationMappings object. """
+
+    def setUp( self ):
+        # Create the BibleVersificationMappings object
+        self.bvms = BibleVersificationMappings.BibleVersificationMappings().loadData( os.path.join( sourceFolder, "DataFiles/VersificationMappings/" ) ) # Doesn't reload the XML unnecessarily :)
+
+    def test_010_len( self ):
+        """ Test the __len__ function. """
+        self.assert_( 0 < len(self.bvms) < 50 ) # The number of loaded mappings
+        self.assert_( "Original" in self.bvms.getAvailableMappingNames() )
+    # end of test_010_len
+
+    def test_020_getCanonicalArrays( self ):
+        """ Test the getCanonicalArrays function. """
+        self.assertEqual( self.bvms.getCanonicalArrays( BibleVersificationMappings.canonicalSystemName ), None )
+        toCanonical, fromCanonical = self.bvms.getCanonicalArrays( "Original" )
+        self.assertEqual( len(toCanonical), len(BibleVersificationSystems.BibleVersificationSystem( "Original" ).getVerseOrdinalIndex()) )
+        self.assertEqual( len(fromCanonical), len(BibleVersificationSystems.BibleVersificationSystem( "KJV" ).getVerseOrdinalIndex()) )
+        for systemOrdinal, canonicalOrdinal in enumerate( toCanonical ): # The two arrays must be consistent
+            if canonicalOrdinal != BibleVersificationMappings.noMapping:
+                self.assertEqual( fromCanonical[canonicalOrdinal], systemOrdinal )
+    # end of test_020_getCanonicalArrays
+
+    def test_030_unmappedSystems( self ):
+        """ Test that systems without mapping data aren't silently treated as the canonical system. """
+        for systemName in ("Luther","NIV84","RussianOrthodox",):
+            self.assertFalse( systemName in self.bvms.getAvailableMappingNames() )
+            self.assertRaises( KeyError, self.bvms.getCanonicalArrays, systemName )
+            self.assertRaises( KeyError, BibleVersificationMappings.BibleVersificationMapping, "KJV", systemName )
+            self.assertRaises( KeyError, BibleVersificationMappings.BibleVersificationMapping, systemName, "Original" )
+        self.assertEqual( BibleVersificationMappings.BibleVersificationMapping( "Luther", "Luther" ).mapReference( ('PSA','22','1','') ), ('PSA','22','1','') )
+    # end of test_030_unmappedSystems
+
+    def test_040_traditionalSystems( self ):
+        """ Test the mappings for the Greek, Latin and Russian traditions. """
+        for systemName in ("Septuagint","Vulgate","Synodal",):
+            self.assert_( systemName in self.bvms.getAvailableMappingNames() )
+            toCanonical, fromCanonical = self.bvms.getCanonicalArrays( systemName )
+            for systemOrdinal, canonicalOrdinal in enumerate( toCanonical ):
+                if canonicalOrdinal != BibleVersificationMappings.noMapping:
+                    self.assertEqual( fromCanonical[canonicalOrdinal], systemOrdinal )
+            fromKJV = BibleVersificationMappings.BibleVersificationMapping( "KJV", systemName )
+            self.assertEqual( fromKJV.mapReference( ('PSA','10','1','') ), ('PSA','9','22','') ) # Psalms 9 and 10 are one psalm
+            self.assertEqual( fromKJV.mapReference( ('PSA','51','1','') ), ('PSA','50','3','') ) # The title is two verses
+            self.assertEqual( fromKJV.mapReference( ('PSA','119','176','') ), ('PSA','118','176','') )
+            self.assertEqual( fromKJV.mapReference( ('GEN','1','1','') ), ('GEN','1','1','') )
+        self.assertEqual( BibleVersificationMappings.BibleVersificationMapping( "KJV", "Septuagint" ).mapReference( ('MAL','4','1','') ), ('MAL','3','19','') )
+        self.assertEqual( BibleVersificationMappings.BibleVersificationMapping( "KJV", "Synodal" ).mapReference( ('ROM','16','25','') ), ('ROM','14','24','') )
+        self.assertEqual( BibleVersificationMappings.BibleVersificationMapping( "Vulgate", "KJV" ).mapReference( ('NUM','13','1','') ), ('NUM','12','16','') )
+        self.assertEqual( BibleVersificationMappings.BibleVersificationMapping( "Synodal", "Original" ).mapReference( ('PSA','22','1','') ), ('PSA','23','1','') )
+        self.assertEqual( BibleVersificationMappings.BibleVersificationMapping( "Vulgate", "Synodal" ).mapReference( ('PSA','50','3','') ), ('PSA','50','3','') )
+    # end of test_040_traditionalSystems
+# end of BibleVersificationMappingsTests class
+
+
+class BibleVersificationMappingTests(unittest.TestCase):
+    """ Unit tests for the BibleVersificationMapping object. """
+
+    def setUp( self ):
+        # Create the BibleVersificationMapping objects
+        self.toOriginal = BibleVersificationMappings.BibleVersificationMapping( "KJV", "Original" )
+        self.fromOriginal = BibleVersificationMappings.BibleVersificationMapping( "Original", "KJV" )
+
+    def test_010_len( self ):
+        """ Test the __len__ function. """
+        self.assertEqual( len(self.toOriginal), len(BibleVersificationSystems.BibleVersificationSystem( "KJV" ).getVerseOrdinalIndex()) )
+    # end of test_010_len
+
+    def test_020_mapReference( self ):
+        """ Test the mapReference function. """
+        self.assertEqual( self.toOriginal.mapReference( ('GEN','1','1','') ), ('GEN','1','1','') )
+        self.assertEqual( self.toOriginal.mapReference( ('GEN','31','55','') ), ('GEN','32','1','') )
+        self.assertEqual( self.toOriginal.mapReference( ('MAL','4','1','b') ), ('MAL','3','19','b') )
+        self.assertEqual( self.toOriginal.mapReference( ('MAT','28','20','') ), ('MAT','28','20','') )
+        self.assertEqual( self.toOriginal.mapReference( ('NEH','7','68','') ), None ) # Not in the Hebrew text
+        self.assertEqual( self.toOriginal.mapReference( ('GEN','99','1','') ), None )
+        self.assertEqual( self.fromOriginal.mapReference( ('GEN','32','1','') ), ('GEN','31','55','') )
+        self.assertEqual( self.fromOriginal.mapReference( ('MAL','3','19','') ), ('MAL','4','1','') )
+    # end of test_020_mapReference
+
+    def test_030_roundTrip( self ):
+        """ Test that mapping there and back again gets the same verses. """
+        forwards = self.toOriginal.getMappingArray()
+        for ordinal, mappedOrdinal in enumerate( forwards ):
+            if mappedOrdinal != BibleVersificationMappings.noMapping:
+                self.assertEqual( self.fromOriginal.mapOrdinal( mappedOrdinal ), ordinal )
+    # end of test_030_roundTrip
+
+    def test_040_mapOrdinals( self ):
+        """ Test that the batch mapping matches the individual mappings. """
+        ordinals = list( range( 0, len(self.toOriginal), 7 ) )
+        self.assertEqual( list( self.toOriginal.mapOrdinals( ordinals ) ), [self.toOriginal.mapOrdinal( ordinal ) for ordinal in ordinals] )
+        self.assertRaises( IndexError, self.toOriginal.mapOrdinals, [len(self.toOriginal)] )
+    # end of test_040_mapOrdinals
+# end of BibleVersificationMappingTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of BibleVersificationMappingsTest.py
@@ -4,7 +4,7 @@
 # BibleVersificationSystemsTest.py
 #
 # Module testing BibleVersificationSystems.py
-#   Last modified: 2011-01-23 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -28,17 +28,46 @@ Module testing BibleVersificationSystems.py.
 """
 
 progName = "Bible Versification Systems tests"
-versionString = "0.44"
+versionString = "0.62"
 
 
-import sys, os.path
+import sys, os.path, shutil, tempfile
 import unittest
 from collections import OrderedDict
 
 
 sourceFolder = "."
 sys.path.append( sourceFolder )
-import Globals, BibleVersificationSystems
+import Globals, DataCache, BibleVersificationSystems
+
+
+# A small versification system with some combined and reordered verses (which none of the supplied systems have yet)
+testSystemXML = """<?xml version="1.0" encoding="UTF-8"?>
+<BibleVersificationSystem>
+  <header>
+    <work>
+      <version>0.01</version>
+      <date>2026-10-17</date>
+      <title>Test Bible versification system</title>
+      <contributor role="com">Robert Hunt</contributor>
+      <rights>Public Domain</rights>
+    </work>
+  </header>
+  <BibleBookVersification>
+    <nameEnglish>Matthew</nameEnglish>
+    <referenceAbbreviation>MAT</referenceAbbreviation>
+    <numChapters>2</numChapters>
+    <numVerses chapter="1">25</numVerses>
+    <numVerses chapter="2" combinedVerses="16-17,20" reorderedVerses="3-4">23</numVerses>
+  </BibleBookVersification>
+</BibleVersificationSystem>
+"""
+
+
+def _reportFlagsInWorker( index ):
+    """ Returns the global flags as seen by a worker process (see test_115_parallelFlags). """
+    return index, Globals.strictCheckingFlag, Globals.verbosityLevel, Globals.maxProcesses
+# end of _reportFlagsInWorker
 
 
 class BibleVersificationSystemsTests(unittest.TestCase):
@@ -89,9 +118,139 @@ class BibleVersificationSystemsTests(unittest.TestCase):
         """ Test the getBookList function. """
         for systemName in ('RSV52','NLT96','KJV'):
             testSystem = self.bvss.getVersificationSystem( systemName )
-            self.bvss.checkVersificationSystem( "testSystem", testSystem[0] )
-            self.bvss.checkVersificationSystem( "testSystem", testSystem[0], testSystem[1] ) # include omitted verses check this time
+            self.assertTrue( self.bvss.checkVersificationSystem( "testSystem", testSystem[0] ) )
+            extraVerseInfo = { "omitted":testSystem[1], "combined":testSystem[2], "reordered":testSystem[3] }
+            self.assertTrue( self.bvss.checkVersificationSystem( "testSystem", testSystem[0], extraVerseInfo ) ) # include omitted verses check this time
+        badSystem = OrderedDict( (BBB,[(C,str(int(numVerses)+1)) for C,numVerses in chapterData.items() if C!='numChapters']) for BBB,chapterData in testSystem[0].items() )
+        self.assertEqual( self.bvss.checkVersificationSystem( "badSystem", badSystem, extraVerseInfo, maxMismatches=5 ), 0 )
+        self.assertEqual( BibleVersificationSystems.renderMismatch( ("verse","KJV","GEN","2","26") ), "    Doesn't match 'KJV' system at GEN 2 verse 26" )
+        self.assertEqual( BibleVersificationSystems.renderMismatch( ("omitted","KJV","MAT","17","21") ), "   17:21 is omitted in KJV reference versification for MAT" )
     # end of test_050_checkVersificationSystem
+
+    def test_060_loadSingleSystem( self ):
+        """ Test that loading a single system (as used in lazy mode) gives the same results. """
+        bvsc = BibleVersificationSystems._BibleVersificationSystemsConverter().indexSystems( os.path.join( sourceFolder, "DataFiles/VersificationSystems/" ) )
+        self.assertEqual( sorted( bvsc.getSystemFilepaths() ), sorted( self.bvss.getAvailableVersificationSystemNames() ) )
+        for name in ("KJV","Luther",):
+            self.assertEqual( bvsc.loadSystem( name ).importSystemToPython( name ), self.bvss.getVersificationSystem( name ) )
+    # end of test_060_loadSingleSystem
+
+    def test_070_findSystemsWithBook( self ):
+        """ Test the findSystemsWithBook function. """
+        for name in ("KJV","Luther",):
+            for BBB in ('GEN','MAT','JDE',):
+                chapterData = self.bvss.getVersificationSystem( name )[0][BBB]
+                results = self.bvss.findSystemsWithBook( BBB, chapterData )
+                self.assert_( isinstance( results, list ) )
+                self.assert_( name in results )
+                for otherName in results: self.assertEqual( self.bvss.getVersificationSystem( otherName )[0][BBB], chapterData )
+                self.assertEqual( self.bvss.findSystemsWithBook( BBB, [(C,numVerses) for C,numVerses in chapterData.items() if C!='numChapters'] ), results )
+        self.assertEqual( self.bvss.findSystemsWithBook( 'GEN', {'1':'31'} ), [] )
+        self.assertEqual( self.bvss.findSystemsWithBook( 'XYZ', {'1':'31'} ), [] )
+    # end of test_070_findSystemsWithBook
+
+    def test_075_fingerprints( self ):
+        """ Test that the fingerprints are content digests (not builtin hashes) and that lists and tuples agree. """
+        getFingerprint = BibleVersificationSystems._getFingerprint
+        self.assertEqual( getFingerprint( (('1','31'),('2','25'),) ), getFingerprint( (('1','31'),('2','25'),) ) )
+        self.assertNotEqual( getFingerprint( (('1','31'),) ), getFingerprint( (('1','32'),) ) )
+        self.assertNotEqual( getFingerprint( (-1,) ), getFingerprint( (-2,) ) ) # These have the same builtin hash
+        getBookFingerprint = BibleVersificationSystems._VersificationFingerprintIndex.getBookFingerprint
+        self.assertEqual( getBookFingerprint( OrderedDict( [('1','31'),('2','25')] ) ), getBookFingerprint( [['1','31'],['2','25']] ) )
+    # end of test_075_fingerprints
+
+    def test_080_rankVersificationSystems( self ):
+        """ Test the rankVersificationSystems function. """
+        for name in ("KJV","NIV84","Luther",):
+            chapterDataDict, omittedVersesDict = self.bvss.getVersificationSystem( name )[0:2]
+            results = self.bvss.rankVersificationSystems( chapterDataDict, {"omitted":omittedVersesDict} )
+            self.assertEqual( len(results), len(self.bvss) )
+            self.assertEqual( sorted( result[0] for result in results ), sorted( self.bvss.getAvailableVersificationSystemNames() ) )
+            self.assertEqual( results[0][1:], (0,0,0,0) )
+            self.assert_( name in [result[0] for result in results if result[1:]==(0,0,0,0)] )
+            self.assertEqual( results, sorted( results, key=lambda result: result[1:] ) )
+        scheme = OrderedDict( [('GEN',[('1','31'),('2','26'),('51','1')]), ('XYZ',[('1','1')])] ) # GEN 2 has 25 verses in KJV
+        for systemName,bookMismatchCount,chapterMismatchCount,verseMismatchCount,omittedVerseMismatchCount in self.bvss.rankVersificationSystems( scheme ):
+            if systemName == "KJV": self.assertEqual( (bookMismatchCount,chapterMismatchCount,verseMismatchCount,omittedVerseMismatchCount), (1,1,1,0) )
+        results = dict( (result[0],result[1:]) for result in self.bvss.rankVersificationSystems( scheme, {"omitted":{'GEN':[('1','5')]}} ) )
+        self.assertEqual( results["KJV"], (1,1,1,1) )
+    # end of test_080_rankVersificationSystems
+
+    def test_085_compareSystemsPruning( self ):
+        """ Test that systems are rejected (and not compared further) once they pass the mismatch threshold. """
+        matrix = BibleVersificationSystems._VersificationMatrix()
+        for name in self.bvss.getAvailableVersificationSystemNames():
+            chapterDataDict, omittedVersesDict = self.bvss.getVersificationSystem( name )[0:2]
+            matrix.add( name, OrderedDict( (BBB,OrderedDict( chapterData )) for BBB,chapterData in chapterDataDict.items() ), omittedVersesDict )
+        chapterDataDict, omittedVersesDict = self.bvss.getVersificationSystem( "KJV" )[0:2]
+        fullResults = matrix.compareSystems( chapterDataDict, omittedVersesDict )
+        self.assertEqual( matrix.rankSystems( chapterDataDict, omittedVersesDict ), sorted( [(name,)+counts for name,counts,rejectedFlag in fullResults], key=lambda result: result[1:] ) )
+        self.assertFalse( any( rejectedFlag for name,counts,rejectedFlag in fullResults ) )
+        prunedResults = matrix.compareSystems( chapterDataDict, omittedVersesDict, maxMismatches=5 )
+        for (name,fullCounts,fullRejectedFlag), (prunedName,prunedCounts,rejectedFlag) in zip( fullResults, prunedResults ):
+            self.assertEqual( prunedName, name )
+            self.assertEqual( rejectedFlag, sum( fullCounts ) > 5 )
+            if rejectedFlag: self.assertTrue( 5 < sum( prunedCounts ) <= sum( fullCounts ) ) # It stopped early
+            else: self.assertEqual( prunedCounts, fullCounts )
+        # A corrupted scheme is rejected by every system straight away
+        badScheme = OrderedDict( (BBB,[(C,str(int(numVerses)+1)) for C,numVerses in chapterData.items() if C!='numChapters']) for BBB,chapterData in chapterDataDict.items() )
+        prunedResults = matrix.compareSystems( badScheme, omittedVersesDict, maxMismatches=5 )
+        self.assertTrue( all( rejectedFlag for name,counts,rejectedFlag in prunedResults ) )
+        self.assertTrue( all( sum( counts ) < 200 for name,counts,rejectedFlag in prunedResults ) ) # Rather than about a thousand
+    # end of test_085_compareSystemsPruning
+
+    def test_090_useDeltaStorage( self ):
+        """ Test that storing the systems as deltas saves memory without changing the data. """
+        names = self.bvss.getAvailableVersificationSystemNames()
+        systems = [ repr( self.bvss.getVersificationSystem( name ) ) for name in names ]
+        sizeBefore = self.bvss.getStorageSize()
+        self.bvss.useDeltaStorage()
+        self.assert_( self.bvss.getStorageSize() < sizeBefore )
+        self.assertEqual( [ repr( self.bvss.getVersificationSystem( name ) ) for name in names ], systems )
+        self.assertEqual( BibleVersificationSystems.BibleVersificationSystem( "Vulgate2" ).getNumVersesList( 'GEN' ), [int(numVerses) for C,numVerses in self.bvss.getVersificationSystem( "Vulgate2" )[0]['GEN'].items() if C!='numChapters'] )
+    # end of test_090_useDeltaStorage
+
+    def test_100_lazyLoading( self ):
+        """ Test that lazy mode only loads each system when it's requested and doesn't keep the XML afterwards. """
+        BibleVersificationSystems.BibleVersificationSystems.discard() # So that we can make a lazy one
+        DataCache.useCache = False # Make sure that the XML is actually loaded
+        try:
+            bvss = BibleVersificationSystems.BibleVersificationSystems().loadData( os.path.join( sourceFolder, "DataFiles/VersificationSystems/" ), lazy=True )
+            self.assertEqual( bvss.getAvailableVersificationSystemNames(), self.bvss.getAvailableVersificationSystemNames() )
+            self.assertEqual( bvss.getVersificationSystem( "KJV" ), self.bvss.getVersificationSystem( "KJV" ) )
+            self.assertFalse( "KJV" in BibleVersificationSystems._BibleVersificationSystemsConverter().XMLSystems )
+        finally:
+            DataCache.useCache = True
+            BibleVersificationSystems.BibleVersificationSystems.discard() # The next test will get a normal one again
+    # end of test_100_lazyLoading
+
+    def test_110_parallelLoading( self ):
+        """ Test that loading the systems in worker processes gives the same results as a serial load. """
+        XMLFolder = os.path.join( sourceFolder, "DataFiles/VersificationSystems/" )
+        converter = BibleVersificationSystems._BibleVersificationSystemsConverter
+        savedMaxProcesses = Globals.maxProcesses
+        try:
+            results = []
+            for maxProcesses in (1, 2):
+                converter.discard() # Start again with a fresh converter each time
+                Globals.maxProcesses = maxProcesses
+                results.append( converter().loadSystems( XMLFolder ).importDataToPython() )
+            self.assertEqual( list(results[1].keys()), list(results[0].keys()) )
+            self.assertEqual( results[1], results[0] )
+        finally:
+            Globals.maxProcesses = savedMaxProcesses
+            converter.discard()
+    # end of test_110_parallelLoading
+
+    def test_115_parallelFlags( self ):
+        """ Test that worker processes see the parent's global flags. """
+        savedFlags = Globals.strictCheckingFlag, Globals.verbosityLevel, Globals.maxProcesses
+        try:
+            Globals.strictCheckingFlag, Globals.verbosityLevel, Globals.maxProcesses = False, 1, 2
+            self.assertEqual( Globals.runInParallel( _reportFlagsInWorker, [0, 1] ), [(0, False, 1, 1), (1, False, 1, 1)] )
+        finally:
+            Globals.strictCheckingFlag, Globals.verbosityLevel, Globals.maxProcesses = savedFlags
+    # end of test_115_parallelFlags
 # end of BibleVersificationSystemsTests class
 
 
@@ -156,6 +315,165 @@ class BibleVersificationSystemTests(unittest.TestCase):
         for badBBB in ('XYZ','Gen','MA6', ):
             self.assertRaises( KeyError, self.bvs.getNumVersesList, badBBB )
     # end of test_060_getNumVersesList
+
+    def test_070_getNumVersesInt( self ):
+        """ Test the getNumVersesInt and getVerseCounts functions. """
+        for BBB,C,value in (('GEN',1,31),('GEN',50,26),('MAT',28,20), ):
+            self.assertEqual( self.bvs.getNumVersesInt(BBB,C), value )
+            self.assertEqual( self.bvs.getVerseCounts(BBB)[C], value )
+            self.assertEqual( self.bvs.getNumVerses(BBB,str(C)), value )
+        self.assertEqual( len(self.bvs.getVerseCounts('GEN')), 51 )
+        for BBB,badC in (('GEN',0),('GEN',51),('GEN',-1), ):
+            self.assertRaises( KeyError, self.bvs.getNumVersesInt, BBB, badC )
+        self.assertRaises( KeyError, self.bvs.getNumVerses, 'GEN', 'numChapters' )
+        self.assertRaises( KeyError, self.bvs.getVerseCounts, 'XYZ' )
+    # end of test_070_getNumVersesInt
+
+    def test_080_isValidBCVRefInt( self ):
+        """ Test the isValidBCVRef and isValidBCVRefInt functions. """
+        for BBB,C,V in (('GEN',1,1),('GEN',50,26),('MAT',28,20), ):
+            self.assertTrue( self.bvs.isValidBCVRefInt(BBB,C,V) )
+            self.assertTrue( self.bvs.isValidBCVRef( (BBB,str(C),str(V),''), None ) )
+        for BBB,C,V in (('GEN',1,32),('GEN',51,1),('GEN',0,1),('XYZ',1,1), ):
+            self.assertFalse( self.bvs.isValidBCVRefInt(BBB,C,V) )
+            self.assertFalse( self.bvs.isValidBCVRef( (BBB,str(C),str(V),''), None ) )
+        self.assertFalse( self.bvs.isValidBCVRefInt('GEN',1,0) )
+    # end of test_080_isValidBCVRefInt
+
+    def test_090_verseOrdinals( self ):
+        """ Test the toOrdinal and fromOrdinal functions. """
+        index = self.bvs.getVerseOrdinalIndex()
+        self.assertTrue( index is self.bvs.getVerseOrdinalIndex() ) # Only built once
+        self.assertEqual( self.bvs.toOrdinal( ('GEN','1','1','') ), 0 )
+        self.assertEqual( self.bvs.toOrdinal( ('GEN','2','1','') ), 31 )
+        self.assertEqual( self.bvs.fromOrdinal( 31 ), ('GEN','2','1','') )
+        self.assertTrue( self.bvs.toOrdinal( ('GEN','50','26','') ) < self.bvs.toOrdinal( ('EXO','1','1','') ) )
+        for ordinal in range( 0, len(index), 97 ):
+            self.assertEqual( self.bvs.toOrdinal( self.bvs.fromOrdinal( ordinal ) ), ordinal )
+        for badRef in (('GEN','1','32',''),('GEN','51','1',''),('XYZ','1','1',''), ):
+            self.assertRaises( KeyError, self.bvs.toOrdinal, badRef )
+        for badOrdinal in (-1,len(index), ):
+            self.assertRaises( IndexError, self.bvs.fromOrdinal, badOrdinal )
+    # end of test_090_verseOrdinals
+
+    def test_100_expandCVRange( self ):
+        """ Test the expandCVRange function and the VerseRange objects that it returns. """
+        expected = [('GEN','1','30','a'),('GEN','1','31',''),('GEN','2','1',''),('GEN','2','2','b')]
+        self.assertEqual( self.bvs.expandCVRange( ('GEN','1','30','a'), ('GEN','2','2','b'), wantList=True ), expected )
+        result = self.bvs.expandCVRange( ('GEN','1','30','a'), ('GEN','2','2','b') )
+        self.assertTrue( isinstance( result, BibleVersificationSystems.VerseRange ) )
+        self.assertEqual( len(result), 4 )
+        self.assertEqual( list(result), expected )
+        self.assertEqual( result, expected )
+        self.assertEqual( (result[0], result[2], result[-1]), (expected[0], expected[2], expected[-1]) )
+        self.assertEqual( list(result[1:3]), expected[1:3] )
+        self.assertEqual( list(result[::2]), expected[::2] )
+        self.assertEqual( len(result[3:1]), 0 )
+        self.assertRaises( IndexError, result.__getitem__, 4 )
+        self.assertTrue( ('GEN','1','31','') in result )
+        self.assertFalse( ('GEN','1','31','a') in result )
+        self.assertTrue( result.containsBCV( ('GEN','1','31','a') ) )
+        self.assertFalse( ('GEN','2','3','') in result )
+        self.assertFalse( ('GEN','x','3','') in result )
+        self.assertEqual( self.bvs.expandCVRange( ('GEN','2','2',''), ('GEN','1','30','') ), None )
+
+        # A whole book (without the verse numbers)
+        result = self.bvs.expandCVRange( ('GEN','1','',''), ('GEN','50','','') )
+        self.assertEqual( len(result), sum(self.bvs.getNumVersesList('GEN')) )
+        self.assertEqual( len(list(result)), len(result) )
+        self.assertEqual( result[-1], ('GEN','50','26','') )
+    # end of test_100_expandCVRange
+
+    def test_110_omittedVerses( self ):
+        """ Test the isOmittedVerse and isOmittedVerseInt functions. """
+        self.assertFalse( self.bvs.isOmittedVerse( ('MAT','17','21','') ) )
+        self.assertFalse( self.bvs.isOmittedVerseInt( 'MAT', 17, 21 ) )
+        NIV = BibleVersificationSystems.BibleVersificationSystem( "NIV84" )
+        for BBB,C,V in NIV.getOmittedVerseList( 'MAT', fullRefs=True ):
+            self.assertTrue( NIV.isOmittedVerse( (BBB,C,V,'') ) )
+            self.assertTrue( NIV.isOmittedVerseInt( BBB, int(C), int(V) ) )
+            self.assertFalse( NIV.isValidBCVRefInt( BBB, int(C), int(V) ) )
+            self.assertFalse( NIV.isOmittedVerseInt( BBB, int(C), int(V)+1 ) )
+        self.assertTrue( NIV.isOmittedVerse( ('MAT','17','21','') ) )
+        self.assertFalse( NIV.isOmittedVerseInt( 'MAT', 17, -1 ) )
+        self.assertFalse( NIV.isCombinedVerse( ('MAT','17','21','') ) )
+        self.assertFalse( NIV.isReorderedVerse( ('MAT','17','','') ) )
+        self.assertEqual( BibleVersificationSystems._parseVerseNumbers( "7-9" ), [7,8,9] )
+        self.assertEqual( BibleVersificationSystems._parseVerseNumbers( "7,8" ), [7,8] )
+        self.assertEqual( BibleVersificationSystems._parseVerseNumbers( "3-4,12" ), [3,4,12] )
+        self.assertRaises( ValueError, BibleVersificationSystems._parseVerseNumbers, "9-7" )
+    # end of test_110_omittedVerses
+
+    def test_120_validateMany( self ):
+        """ Test the validateMany function. """
+        NIV = BibleVersificationSystems.BibleVersificationSystem( "NIV84" )
+        refs = [('GEN','1','1',''), ('MAT','17','21',''), ('GEN','1','',''), ('GEN','51','1',''), ('GEN','1','99',''), ('XYZ','1','1','')]
+        mask, failures = NIV.validateMany( refs )
+        self.assertEqual( list(mask), [1,0,1,0,0,0] )
+        self.assertEqual( list(mask), [int(NIV.isValidBCVRef(ref)) for ref in refs] )
+        self.assertEqual( failures, [(1,"omitted"), (3,"chapter"), (4,"verse"), (5,"book")] )
+        ordinals = [0, NIV.toOrdinal( ('MAT','17','21','') ), -1, len(NIV.getVerseOrdinalIndex())]
+        self.assertEqual( NIV.validateMany( ordinals ), (bytearray([1,0,0,0]), [(1,"omitted"), (2,"ordinal"), (3,"ordinal")]) )
+        self.assertEqual( NIV.validateMany( [] ), (bytearray(), []) )
+        # Arrays and ranges of ordinals are checked in bulk (and must give the same results)
+        from array import array
+        for typecode in ('l','q',):
+            self.assertEqual( NIV.validateMany( array( typecode, ordinals ) ), NIV.validateMany( ordinals ) )
+        self.assertEqual( NIV.validateMany( array( 'L' ) ), (bytearray(), []) )
+        allOrdinals = range( len(NIV.getVerseOrdinalIndex()) )
+        mask, failures = NIV.validateMany( allOrdinals )
+        self.assertEqual( mask, NIV.getOrdinalValidity() )
+        self.assertEqual( (mask, failures), NIV.validateMany( list( allOrdinals ) ) )
+        self.assertEqual( sorted( ix for ix,reason in failures ), sorted( NIV.getOmittedOrdinals() ) )
+        self.assertEqual( set( reason for ix,reason in failures ), {"omitted"} )
+        # Both functions must agree about the awkward ones too
+        refs = [('GEN','01','1',''), ('GEN','1','01',''), ('GEN','1',1,''), ('GEN','1','0',''), ('GEN','1','x',''), ('GEN','numChapters','1',''), ('MAT','17',21,''), ('GEN',1,'1','')]
+        mask, failures = NIV.validateMany( refs )
+        self.assertEqual( list(mask), [0,0,1,0,0,0,0,0] )
+        self.assertEqual( list(mask), [int(NIV.isValidBCVRef(ref)) for ref in refs] )
+        self.assertEqual( [reason for ix,reason in failures], ["chapter","verse","verse","verse","chapter","omitted","chapter"] )
+        # Any integral type can be used for the ordinals (e.g., NumPy integers which are registered as numbers.Integral)
+        import numbers
+        class Ordinal:
+            def __init__( self, value ): self.value = value
+            def __index__( self ): return self.value
+        numbers.Integral.register( Ordinal )
+        self.assertEqual( NIV.validateMany( [True, Ordinal(0), Ordinal(-1)] ), (bytearray([1,1,0]), [(2,"ordinal")]) )
+    # end of test_120_validateMany
+
+    def test_130_combinedVerses( self ):
+        """ Test the combined and reordered verse functions. """
+        self.assertEqual( BibleVersificationSystems._makeVerseIntervals( "7-9" ), ((7,9),) )
+        self.assertEqual( BibleVersificationSystems._makeVerseIntervals( "7,8" ), ((7,8),) )
+        self.assertEqual( BibleVersificationSystems._makeVerseIntervals( "3-4,12" ), ((3,4),(12,12)) )
+        self.assertRaises( ValueError, BibleVersificationSystems._makeVerseIntervals, "9-7" )
+        self.assertEqual( self.bvs.getCombinedVerseRange( ('MAT','9','17','') ), None )
+        self.assertEqual( self.bvs.getReorderedVerseRangeInt( 'MAT', 9, 17 ), None )
+        # None of the data files have any combined verses yet so load a small test system
+        folder = tempfile.mkdtemp()
+        with open( os.path.join( folder, "BibleVersificationSystem_Test.xml" ), 'wt' ) as myFile: myFile.write( testSystemXML )
+        BibleVersificationSystems.BibleVersificationSystems.discard(); BibleVersificationSystems._BibleVersificationSystemsConverter.discard()
+        DataCache.useCache = False # Don't save a snapshot of the test system
+        try:
+            BibleVersificationSystems.BibleVersificationSystems().loadData( folder )
+            bvs = BibleVersificationSystems.BibleVersificationSystem( "Test" )
+            self.assertEqual( bvs.getNumVerses( 'MAT', '2' ), 23 )
+            self.assertEqual( bvs.getCombinedVerseRangeInt( 'MAT', 2, 17 ), (16,17) )
+            self.assertEqual( bvs.getCombinedVerseRangeInt( 'MAT', 2, 18 ), None )
+            self.assertEqual( bvs.getCombinedVerseRangeInt( 'MAT', 1, 17 ), None )
+            self.assertEqual( bvs.getCombinedVerseRange( ('MAT','2','16','a') ), (('MAT','2','16',''), ('MAT','2','17','')) )
+            self.assertEqual( bvs.getCombinedVerseRange( ('MAT','2','20','') ), (('MAT','2','20',''), ('MAT','2','20','')) )
+            self.assertTrue( bvs.isCombinedVerse( ('MAT','2','20','') ) )
+            self.assertFalse( bvs.isCombinedVerse( ('MAT','2','','') ) )
+            self.assertEqual( bvs.getReorderedVerseRangeInt( 'MAT', 2, 4 ), (3,4) )
+            self.assertEqual( bvs.getReorderedVerseRange( ('MAT','2','3','') ), (('MAT','2','3',''), ('MAT','2','4','')) )
+            self.assertTrue( bvs.isReorderedVerse( ('MAT','2','3','') ) )
+            self.assertFalse( bvs.isReorderedVerse( ('MAT','2','16','') ) )
+        finally:
+            DataCache.useCache = True
+            BibleVersificationSystems.BibleVersificationSystems.discard(); BibleVersificationSystems._BibleVersificationSystemsConverter.discard() # Back to the normal systems
+            shutil.rmtree( folder )
+    # end of test_130_combinedVerses
 # end of BibleVersificationSystemTests class
 
 
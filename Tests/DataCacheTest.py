@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# DataCacheTest.py
+#
+# Module testing DataCache.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing DataCache.py.
+"""
+
+progName = "Data cache tests"
+versionString = "0.01"
+
+
+import sys, os, shutil, tempfile
+import unittest
+from collections import OrderedDict
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, DataCache
+
+
+class DataCacheTests(unittest.TestCase):
+    """ Unit tests for the DataCache module. """
+
+    def setUp( self ):
+        # Use a temporary folder for both the source file and the snapshots
+        self.tempFolder = tempfile.mkdtemp()
+        self.savedCacheFolder = DataCache.cacheFolder
+        DataCache.cacheFolder = os.path.join( self.tempFolder, "CachedFiles" )
+        self.sourceFilepath = os.path.join( self.tempFolder, "TestSource_One.xml" )
+        with open( self.sourceFilepath, 'wt' ) as sourceFile: sourceFile.write( "<test>One</test>" )
+        self.data = OrderedDict( [('GEN',(1,'Gen',)), ('EXO',(2,'Exo',))] )
+
+    def tearDown( self ):
+        DataCache.cacheFolder = self.savedCacheFolder
+        shutil.rmtree( self.tempFolder )
+
+    def test_010_getFolderFilepaths( self ):
+        """ Test the getFolderFilepaths function. """
+        with open( os.path.join( self.tempFolder, "OtherSource.xml" ), 'wt' ) as otherFile: otherFile.write( "<test/>" )
+        self.assertEqual( DataCache.getFolderFilepaths( self.tempFolder, "TestSource_" ), [self.sourceFilepath] )
+    # end of test_010_getFolderFilepaths
+
+    def test_020_roundTrip( self ):
+        """ Test that saved data is loaded back again. """
+        self.assertEqual( DataCache.loadSnapshot( "Test", [self.sourceFilepath] ), None )
+        DataCache.saveSnapshot( "Test", [self.sourceFilepath], self.data )
+        self.assertEqual( DataCache.loadSnapshot( "Test", [self.sourceFilepath] ), self.data )
+    # end of test_020_roundTrip
+
+    def test_030_staleSource( self ):
+        """ Test that a changed source file invalidates the snapshot. """
+        DataCache.saveSnapshot( "Test", [self.sourceFilepath], self.data )
+        with open( self.sourceFilepath, 'wt' ) as sourceFile: sourceFile.write( "<test>Changed</test>" )
+        self.assertEqual( DataCache.loadSnapshot( "Test", [self.sourceFilepath] ), None )
+        self.assertEqual( DataCache.loadSnapshot( "Test", [] ), None )
+    # end of test_030_staleSource
+
+    def test_040_touchedSource( self ):
+        """ Test that a source file with a new timestamp but the same contents still uses the snapshot. """
+        DataCache.saveSnapshot( "Test", [self.sourceFilepath], self.data )
+        fileStat = os.stat( self.sourceFilepath )
+        os.utime( self.sourceFilepath, (fileStat.st_atime+10, fileStat.st_mtime+10) )
+        self.assertEqual( DataCache.loadSnapshot( "Test", [self.sourceFilepath] ), self.data )
+    # end of test_040_touchedSource
+
+    def test_050_corruptSnapshot( self ):
+        """ Test that a damaged snapshot file is ignored. """
+        DataCache.saveSnapshot( "Test", [self.sourceFilepath], self.data )
+        with open( os.path.join( DataCache.cacheFolder, "Test.pickle" ), 'wb' ) as snapshotFile: snapshotFile.write( b"Rubbish" )
+        self.assertEqual( DataCache.loadSnapshot( "Test", [self.sourceFilepath] ), None )
+    # end of test_050_corruptSnapshot
+# end of DataCacheTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of DataCacheTest.py
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# DeferredValidationTest.py
+#
+# Module testing DeferredValidation.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing DeferredValidation.py.
+"""
+
+progName = "Deferred validation tests"
+versionString = "0.01"
+
+
+
+import sys, logging
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, DeferredValidation
+
+
+def _badCheck( message ):
+    logging.error( message )
+
+
+class DeferredValidationTests(unittest.TestCase):
+    """ Unit tests for the DeferredValidation module. """
+
+    def setUp( self ):
+        self.savedFlag = Globals.backgroundCheckingFlag
+
+    def tearDown( self ):
+        Globals.backgroundCheckingFlag = self.savedFlag
+
+    def test_010_runNow( self ):
+        """ Test that checks are run straight away normally. """
+        Globals.backgroundCheckingFlag = False
+        results = []
+        DeferredValidation.runOrDefer( "Test", results.append, 1 )
+        self.assertEqual( results, [1] )
+    # end of test_010_runNow
+
+    def test_020_runInBackground( self ):
+        """ Test that background checks finish and that their findings are collected. """
+        Globals.backgroundCheckingFlag = True
+        report = DeferredValidation.getReport()
+        DeferredValidation.runOrDefer( "Test", _badCheck, "Test finding" )
+        self.assertTrue( report.wait( 10 ) )
+        self.assertTrue( report.isComplete() )
+        self.assert_( ("Test","ERROR","Test finding",) in report.getFindings() )
+    # end of test_020_runInBackground
+# end of DeferredValidationTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of DeferredValidationTest.py
@@ -0,0 +1,131 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# ExportAllTest.py
+#
+# Module testing ExportAll.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing ExportAll.py.
+"""
+
+progName = "Export driver tests"
+versionString = "0.02"
+
+
+
+import sys, os.path, shutil, tempfile
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, ExportAll
+
+
+class ExportAllTests(unittest.TestCase):
+    """ Unit tests for the ExportAll module. """
+
+    def setUp( self ):
+        # Use a temporary manifest file
+        self.tempFolder = tempfile.mkdtemp()
+        self.savedManifestFilepath = ExportAll.manifestFilepath
+        ExportAll.manifestFilepath = os.path.join( self.tempFolder, "ExportManifest.json" )
+
+    def tearDown( self ):
+        ExportAll.manifestFilepath = self.savedManifestFilepath
+        shutil.rmtree( self.tempFolder )
+
+    def test_010_getSourceFilepaths( self ):
+        """ Test that the sources include the used components. """
+        results = ExportAll.getSourceFilepaths( "BibleBookOrders" )
+        for filepath in ("BibleBookOrders.py","BibleBooksCodes.py","DataFiles/BibleBooksCodes.xml",):
+            self.assert_( filepath in results )
+        self.assert_( len(results) > 10 )
+        self.assertFalse( "BiblePunctuationSystems.py" in results )
+    # end of test_010_getSourceFilepaths
+
+    def test_020_findStaleExports( self ):
+        """ Test that only the outputs with changed sources are stale. """
+        staleExports = ExportAll.findStaleExports( ["BibleBooksCodes","BibleBookOrders",], ["Python","JSON",] )
+        self.assertEqual( len(staleExports), 4 ) # There's no manifest yet
+        ExportAll.saveManifest( dict( (componentName+'.'+formatName, sourcesHash) for (componentName, formatName), sourcesHash in staleExports.items() ) )
+        self.assertEqual( len( ExportAll.findStaleExports( ["BibleBooksCodes","BibleBookOrders",], ["Python","JSON",] ) ), 0 )
+        self.assertEqual( len( ExportAll.findStaleExports( ["BibleBooksCodes","BibleBookOrders",], ["Python","JSON",], force=True ) ), 4 )
+        self.assertEqual( list( ExportAll.findStaleExports( ["BibleBooksCodes",] ).keys() ), [("BibleBooksCodes","C",)] )
+        self.assertRaises( KeyError, ExportAll.findStaleExports, ["XYZ"] )
+    # end of test_020_findStaleExports
+
+    def test_030_unsupportedFormats( self ):
+        """ Test that formats which a component can't export are skipped. """
+        for componentName in ("BibleVersificationSystems","BibleBooksNames","BibleOrganizationalSystems",):
+            self.assertEqual( len( ExportAll.findStaleExports( [componentName], ["C"] ) ), 0 )
+            self.assertEqual( [formatName for c, formatName in ExportAll.findStaleExports( [componentName] )], ["Python","JSON"] )
+    # end of test_030_unsupportedFormats
+
+    def test_040_unforkedWorker( self ):
+        """ Test that a worker which didn't inherit a loaded converter loads its own. """
+        import BiblePunctuationSystems
+        converterClass = BiblePunctuationSystems._BiblePunctuationSystemsConverter
+        savedLoadedComponentNames = set( ExportAll._loadedComponentNames )
+        try:
+            converterClass.discard()
+            ExportAll._loadedComponentNames.clear() # As in a spawned worker
+            converter = ExportAll._getLoadedConverter( "BiblePunctuationSystems" )
+            self.assertTrue( "BiblePunctuationSystems" in ExportAll._loadedComponentNames )
+            self.assertTrue( "English" in converter.importDataToPython() )
+        finally:
+            ExportAll._loadedComponentNames.clear()
+            ExportAll._loadedComponentNames.update( savedLoadedComponentNames )
+            converterClass.discard()
+    # end of test_040_unforkedWorker
+
+    def test_050_failedExport( self ):
+        """ Test that a failed export isn't recorded in the manifest and gives a non-zero exit status. """
+        componentName = "BiblePunctuationSystems"
+        ExportAll.exportFormats["Broken"] = "exportDataToNowhere" # The converter doesn't have this function
+        ExportAll.exportComponents[componentName]["outputs"]["Broken"] = []
+        savedArgv, savedOptions = sys.argv, (Globals.commandLineOptions, Globals.commandLineArguments, Globals.verbosityLevel,)
+        try:
+            self.assertRaises( AttributeError, ExportAll.exportAll, [componentName], ["Broken"] )
+            self.assertEqual( ExportAll.loadManifest(), {} )
+            sys.argv = [ "ExportAll.py", "--silent", "--format", "Broken", componentName ]
+            self.assertEqual( ExportAll.main(), 1 )
+        finally:
+            sys.argv = savedArgv
+            Globals.commandLineOptions, Globals.commandLineArguments, verbosityLevel = savedOptions
+            Globals.setVerbosity( verbosityLevel )
+            del ExportAll.exportFormats["Broken"]
+            del ExportAll.exportComponents[componentName]["outputs"]["Broken"]
+    # end of test_050_failedExport
+# end of ExportAllTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of ExportAllTest.py
@@ -0,0 +1,181 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# ISO_639_3_LanguagesTest.py
+#
+# Module testing ISO_639_3_Languages.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing ISO_639_3_Languages.py.
+"""
+
+progName = "ISO 639-3 languages tests"
+versionString = "0.03"
+
+
+import sys, os, shutil, tempfile
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, DataCache, ISO_639_3_Languages
+
+
+def _writeTestXML( filepath, entries ):
+    """ Writes a small ISO 639-3 XML file with the given list of attribute dictionaries. """
+    with open( filepath, 'wt', encoding='utf-8' ) as XMLFile:
+        XMLFile.write( '<?xml version="1.0" encoding="UTF-8" ?>\n<iso_639_3_entries>\n' )
+        for entry in entries:
+            XMLFile.write( "  <iso_639_3_entry {} />\n".format( ' '.join( '{}="{}"'.format( name, value ) for name, value in entry.items() ) ) )
+        XMLFile.write( '</iso_639_3_entries>\n' )
+# end of _writeTestXML
+
+
+class ISO_639_3_LanguagesConverterTests(unittest.TestCase):
+    """ Unit tests for the _ISO_639_3_Languages_Converter object. """
+
+    def setUp( self ):
+        self.tempFolder = tempfile.mkdtemp()
+        self.savedFlags = Globals.strictCheckingFlag, Globals.backgroundCheckingFlag
+        ISO_639_3_Languages._ISO_639_3_Languages_Converter.discard() # So that each test starts with an empty converter
+
+    def tearDown( self ):
+        Globals.strictCheckingFlag, Globals.backgroundCheckingFlag = self.savedFlags
+        ISO_639_3_Languages._ISO_639_3_Languages_Converter.discard()
+        shutil.rmtree( self.tempFolder )
+
+    def test_010_loadAndImport( self ):
+        """ Test that streaming the XML gives the same dictionaries as loading the whole tree. """
+        XMLFilepath = os.path.join( sourceFolder, "DataFiles", "iso_639_3.xml" )
+        streamedDicts = ISO_639_3_Languages._ISO_639_3_Languages_Converter().loadAndImport( XMLFilepath )
+        ISO_639_3_Languages._ISO_639_3_Languages_Converter.discard()
+        treeDicts = ISO_639_3_Languages._ISO_639_3_Languages_Converter().loadAndValidate( XMLFilepath ).importDataToPython()
+        self.assertEqual( streamedDicts, treeDicts )
+        self.assertEqual( list( streamedDicts[0].keys() ), list( treeDicts[0].keys() ) ) # Same order too
+        self.assertEqual( streamedDicts[0]['eng'][0], "English" )
+    # end of test_010_loadAndImport
+
+    def test_020_loadAndImportValidates( self ):
+        """ Test that the streamed entries are still checked when we're doing strict checking. """
+        XMLFilepath = os.path.join( self.tempFolder, "iso_639_3.xml" )
+        _writeTestXML( XMLFilepath, [ {"id":"aaa","scope":"I","type":"L","name":"One"}, {"id":"aaa","scope":"I","type":"L","name":"Two","extra":"x"} ] )
+        Globals.strictCheckingFlag, Globals.backgroundCheckingFlag = True, False
+        with self.assertLogs( level="WARNING" ) as logs:
+            IDDict, NameDict = ISO_639_3_Languages._ISO_639_3_Languages_Converter().loadAndImport( XMLFilepath )
+        self.assertTrue( any( "'aaa' data repeated" in message for message in logs.output ) )
+        self.assertTrue( any( "Additional 'extra' attribute" in message for message in logs.output ) )
+        self.assertEqual( list( NameDict.keys() ), ["One","Two"] )
+    # end of test_020_loadAndImportValidates
+# end of ISO_639_3_LanguagesConverterTests class
+
+
+class ISO_639_3_LanguagesTableTests(unittest.TestCase):
+    """ Unit tests for the memory-mapped _ISO_639_3_LanguagesTable object. """
+
+    def setUp( self ):
+        self.tempFolder = tempfile.mkdtemp()
+        self.savedCacheFolder = DataCache.cacheFolder
+        DataCache.cacheFolder = os.path.join( self.tempFolder, "CachedFiles" )
+        self.XMLFilepath = os.path.join( self.tempFolder, "iso_639_3.xml" )
+        _writeTestXML( self.XMLFilepath, [ {"id":"aaa","scope":"I","type":"L","name":"One"}, {"id":"bbb","scope":"M","type":"L","name":"Twö","part1_code":"bb","part2_code":"bbc"} ] )
+        ISO_639_3_Languages._ISO_639_3_Languages_Converter.discard() # So that each test starts from scratch
+        ISO_639_3_Languages.ISO_639_3_Languages.discard()
+
+    def tearDown( self ):
+        DataCache.cacheFolder = self.savedCacheFolder
+        ISO_639_3_Languages._ISO_639_3_Languages_Converter.discard()
+        ISO_639_3_Languages.ISO_639_3_Languages.discard()
+        shutil.rmtree( self.tempFolder )
+
+    def test_010_roundTrip( self ):
+        """ Test that every entry in the real data file can be found again in the binary table. """
+        converter = ISO_639_3_Languages._ISO_639_3_Languages_Converter()
+        IDDict, NameDict = converter.loadAndImport( os.path.join( sourceFolder, "DataFiles", "iso_639_3.xml" ) )
+        tableFilepath = os.path.join( self.tempFolder, "test.table" )
+        converter.exportDataToBinary( tableFilepath )
+        table = ISO_639_3_Languages._ISO_639_3_LanguagesTable( tableFilepath )
+        self.assertEqual( len(table), len(IDDict) )
+        for ID, entry in IDDict.items():
+            self.assertTrue( ID in table )
+            self.assertEqual( table.getEntry( ID ), entry )
+            self.assertEqual( table.getName( ID ), entry[0] )
+    # end of test_010_roundTrip
+
+    def test_020_unknownCodes( self ):
+        """ Test that codes which aren't in the table are handled. """
+        lgs = ISO_639_3_Languages.ISO_639_3_Languages().loadData( self.XMLFilepath, mapped=True )
+        self.assertEqual( lgs.getLanguageName( 'bbb' ), "Twö" )
+        for badCode in ( "abc", "AAA", "", "aa", "aaaa", "é", None, 123, ):
+            self.assertFalse( lgs.isValidLanguageCode( badCode ) )
+            self.assertEqual( lgs.getLanguageName( badCode ), None )
+        with open( os.path.join( self.tempFolder, "bad.table" ), 'wb' ) as badFile: badFile.write( b"NotATable" + bytes(16) )
+        self.assertRaises( ValueError, ISO_639_3_Languages._ISO_639_3_LanguagesTable, os.path.join( self.tempFolder, "bad.table" ) )
+    # end of test_020_unknownCodes
+
+    def test_030_staleTable( self ):
+        """ Test that the table is only rebuilt when the stamps of its source files don't match. """
+        tableFilepath = os.path.join( DataCache.cacheFolder, "ISO_639_3_Languages.table" )
+        def reload( XMLFilepath ):
+            ISO_639_3_Languages.ISO_639_3_Languages.discard()
+            ISO_639_3_Languages._ISO_639_3_Languages_Converter.discard()
+            return ISO_639_3_Languages.ISO_639_3_Languages().loadData( XMLFilepath, mapped=True )
+        self.assertEqual( reload( self.XMLFilepath ).getLanguageName( 'aaa' ), "One" )
+        stamps = ISO_639_3_Languages.ISO_639_3_Languages()._table.getSourceStamps()
+        self.assertEqual( stamps[0][0], os.path.abspath( self.XMLFilepath ) )
+        self.assertEqual( stamps[0][3], DataCache.getContentHash( self.XMLFilepath ) )
+        tableInode = os.stat( tableFilepath ).st_ino
+
+        # Loading again with an unchanged XML file must use the existing table
+        reload( self.XMLFilepath )
+        self.assertEqual( os.stat( tableFilepath ).st_ino, tableInode )
+
+        # A different XML file must not get the old table, even if it's older than the table
+        otherXMLFilepath = os.path.join( self.tempFolder, "other.xml" )
+        _writeTestXML( otherXMLFilepath, [ {"id":"ccc","scope":"I","type":"L","name":"Three"} ] )
+        tableMtime = os.stat( tableFilepath ).st_mtime
+        os.utime( otherXMLFilepath, (tableMtime-100, tableMtime-100,) )
+        lgs = reload( otherXMLFilepath )
+        self.assertEqual( lgs.getLanguageName( 'ccc' ), "Three" )
+        self.assertFalse( lgs.isValidLanguageCode( 'aaa' ) )
+
+        # Now change the contents of the XML file without changing its size
+        _writeTestXML( self.XMLFilepath, [ {"id":"aaa","scope":"I","type":"L","name":"Uno"}, {"id":"bbb","scope":"I","type":"L","name":"Twö"} ] )
+        reload( self.XMLFilepath )
+        XMLStat = os.stat( self.XMLFilepath )
+        _writeTestXML( self.XMLFilepath, [ {"id":"aaa","scope":"I","type":"L","name":"Ein"}, {"id":"bbb","scope":"I","type":"L","name":"Twö"} ] )
+        self.assertEqual( os.stat( self.XMLFilepath ).st_size, XMLStat.st_size )
+        os.utime( self.XMLFilepath, (XMLStat.st_atime, XMLStat.st_mtime+1,) ) # A different mtime makes it check the hash
+        self.assertEqual( reload( self.XMLFilepath ).getLanguageName( 'aaa' ), "Ein" )
+    # end of test_030_staleTable
+# end of ISO_639_3_LanguagesTableTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of ISO_639_3_LanguagesTest.py
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# ImportTimeTest.py
+#
+# Module testing the import times of our entry point modules
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing the import times of our entry point modules.
+"""
+
+progName = "Import time tests"
+versionString = "0.03"
+
+
+
+import sys, os, subprocess, tempfile, shutil
+import unittest
+from collections import OrderedDict
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals
+
+
+# For each entry point module: the (heavy) modules which mustn't be imported until they're actually used
+lazyImports = OrderedDict( [
+    ("USFMFilenames", ("BibleBooksCodes","DataCache","xml.etree.ElementTree",),),
+    ("BibleReferences", ("BibleBooksCodes","BibleOrganizationalSystems",),),
+    ("USFMBible", ("BibleBooksCodes","BibleOrganizationalSystems","BibleReferences","XMLWriter","ControlFiles","SFMFile",),),
+    ("BibleBooksCodes", ("xml.etree.ElementTree","pickle","hashlib","json","tracemalloc",),),
+    ("BibleOrganizationalSystems", ("ISO_639_3_Languages","xml.etree.ElementTree",),),
+    ] )
+
+# The import times depend on the machine, so each entry point is only allowed this many times the import time of logging
+#   (which they all use anyway) measured in the same run
+importTimeBudgetRatio = 5
+
+
+def _runPython( code, environment ):
+    """ Runs the Python code in a fresh interpreter in the source folder and returns (stdout, stderr). """
+    process = subprocess.run( [sys.executable, "-X", "importtime", "-c", code], cwd=sourceFolder, env=environment, capture_output=True, universal_newlines=True, check=True )
+    return process.stdout, process.stderr
+
+
+class ImportTimeTests(unittest.TestCase):
+    """ Unit tests for the import times of the entry point modules. """
+
+    def setUp( self ):
+        # Let the interpreters cache their bytecode (but somewhere temporary)
+        self.pycacheFolder = tempfile.mkdtemp()
+        self.environment = dict( os.environ )
+        self.environment.pop( "PYTHONDONTWRITEBYTECODE", None )
+        self.environment["PYTHONPYCACHEPREFIX"] = self.pycacheFolder
+
+    def tearDown( self ):
+        shutil.rmtree( self.pycacheFolder )
+
+    def test_010_lazyImports( self ):
+        """ Test that the heavy modules aren't imported by the entry points. """
+        for moduleName, lazyModuleNames in lazyImports.items():
+            output = _runPython( "import sys; import {}; print( '\\n'.join( sys.modules ) )".format( moduleName ), self.environment )[0]
+            importedModuleNames = output.split( '\n' )
+            self.assert_( moduleName in importedModuleNames )
+            for lazyModuleName in lazyModuleNames:
+                self.assertFalse( lazyModuleName in importedModuleNames, "{} imports {}".format( moduleName, lazyModuleName ) )
+    # end of test_010_lazyImports
+
+    def _getImportTime( self, moduleName ):
+        """ Returns the best cumulative import time (in milliseconds) of the module in a fresh interpreter. """
+        times = []
+        for attempt in range( 4 ): # The first one caches the bytecode
+            lastLine = _runPython( "import {}".format( moduleName ), self.environment )[1].strip().split( '\n' )[-1]
+            self.assert_( lastLine.endswith( "| " + moduleName ) )
+            times.append( int( lastLine.split( '|' )[1] ) / 1000 ) # Cumulative microseconds to milliseconds
+        return min( times[1:] )
+    # end of _getImportTime
+
+    def test_020_importTimes( self ):
+        """ Test that the import time of each entry point is within its budget (relative to logging). """
+        loggingTime = self._getImportTime( "logging" )
+        if Globals.verbosityLevel > 2: print( "  logging imported in {:.1f}ms".format( loggingTime ) )
+        for moduleName in lazyImports:
+            importTime = self._getImportTime( moduleName )
+            if Globals.verbosityLevel > 2: print( "  {} imported in {:.1f}ms".format( moduleName, importTime ) )
+            self.assertLess( importTime, importTimeBudgetRatio * loggingTime, "{} took {:.1f}ms to import (logging took {:.1f}ms)".format( moduleName, importTime, loggingTime ) )
+    # end of test_020_importTimes
+# end of ImportTimeTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of ImportTimeTest.py
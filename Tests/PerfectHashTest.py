@@ -0,0 +1,88 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# PerfectHashTest.py
+#
+# Module testing PerfectHash.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing PerfectHash.py.
+"""
+
+progName = "Perfect hash tests"
+versionString = "0.01"
+
+
+
+import sys, io
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, PerfectHash
+
+
+osisKeys = [ "Gen", "Exod", "Lev", "Num", "Deut", "Josh", "Judg", "Ruth", "1Sam", "2Sam", "1Kgs", "2Kgs", "1Chr", "2Chr", "Ezra", "Neh", "Esth", "Job", "Ps", "Prov",
+                "Matt", "Mark", "Luke", "John", "Acts", "Rom", "1Cor", "2Cor", "Gal", "Eph", "Phil", "Col", "1Thess", "2Thess", "1Tim", "2Tim", "Titus", "Phlm", "Heb", "Rev" ]
+
+
+class PerfectHashTests(unittest.TestCase):
+    """ Unit tests for the PerfectHash module. """
+
+    def test_010_makePerfectHash( self ):
+        """ Test that every key is found in its own position and that other keys aren't found. """
+        for keys in ( osisKeys, ["ABC"], ["a{}".format(j) for j in range(1000)], ["", "é", "ß"], ):
+            displacements, indexes = PerfectHash.makePerfectHash( keys )
+            self.assertEqual( len(displacements), len(keys) )
+            self.assertEqual( sorted(indexes), list(range(len(keys))) )
+            for j, key in enumerate( keys ):
+                self.assertEqual( PerfectHash.lookup( key, keys, displacements, indexes ), j )
+            for key in ( "Xyz", "gen", "a1000", "Genesis", ):
+                if key not in keys: self.assertEqual( PerfectHash.lookup( key, keys, displacements, indexes ), -1 )
+        self.assertRaises( ValueError, PerfectHash.makePerfectHash, ["Gen","Exod","Gen"] )
+    # end of test_010_makePerfectHash
+
+    def test_020_writeCLookupFunction( self ):
+        """ Test the C code that is written. """
+        hFile, cFile = io.StringIO(), io.StringIO()
+        PerfectHash.writeCHashFunction( cFile )
+        PerfectHash.writeCLookupFunction( hFile, cFile, osisKeys, "OSISAbbreviationDict", "OSISAbbreviation" )
+        self.assertEqual( hFile.getvalue().count( "int OSISAbbreviationDictLookup( const unsigned char* key );" ), 1 )
+        cCode = cFile.getvalue()
+        self.assertEqual( cCode.count( "static uint32_t perfectHash(" ), 1 )
+        self.assertTrue( "static const int32_t OSISAbbreviationDictDisplacements[{}] = {{".format( len(osisKeys) ) in cCode )
+        self.assertTrue( "static const uint16_t OSISAbbreviationDictIndexes[{}] = {{".format( len(osisKeys) ) in cCode )
+        self.assertTrue( "OSISAbbreviationDict[index].OSISAbbreviation" in cCode )
+    # end of test_020_writeCLookupFunction
+# end of PerfectHashTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of PerfectHashTest.py
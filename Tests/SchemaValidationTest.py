@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# SchemaValidationTest.py
+#
+# Module testing SchemaValidation.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing SchemaValidation.py.
+"""
+
+progName = "Schema validation tests"
+versionString = "0.02"
+
+
+
+import sys, os.path
+import unittest
+from xml.etree.cElementTree import ElementTree, SubElement
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, SchemaValidation
+
+
+class SchemaValidationTests(unittest.TestCase):
+    """ Unit tests for the SchemaValidation module. """
+
+    def setUp( self ):
+        self.schema = SchemaValidation.getSchema( os.path.join( sourceFolder, "DerivedFiles/BibleVersificationSystem.rng" ) )
+        self.tree = ElementTree().parse( os.path.join( sourceFolder, "DataFiles/VersificationSystems/BibleVersificationSystem_KJV.xml" ) )
+
+    def test_010_validFile( self ):
+        """ Test that a good file validates. """
+        self.assertEqual( self.schema.validate( self.tree ), [] )
+        self.assert_( SchemaValidation.getSchema( os.path.join( sourceFolder, "DerivedFiles/BibleVersificationSystem.rng" ) ) is self.schema ) # Only compiled once
+    # end of test_010_validFile
+
+    def test_020_invalidData( self ):
+        """ Test that bad values are found. """
+        numVerses = self.tree.find( "BibleBookVersification/numVerses" )
+        numVerses.text = "0"
+        errors = self.schema.validate( self.tree )
+        self.assertEqual( len(errors), 1 )
+        self.assert_( errors[0].startswith( "/BibleVersificationSystem[1]/BibleBookVersification[1]/numVerses[1]:" ) )
+        numVerses.text = "31"
+        numVerses.set( "chapter", "X" )
+        self.assertEqual( len( self.schema.validate( self.tree ) ), 1 )
+        numVerses.set( "chapter", "1" )
+        self.tree.find( "header/work/contributor" ).set( "role", "xyz" ) # Not one of the choices
+        self.assertEqual( len( self.schema.validate( self.tree ) ), 1 )
+    # end of test_020_invalidData
+
+    def test_030_invalidStructure( self ):
+        """ Test that missing and unexpected elements and attributes are found. """
+        book = self.tree.find( "BibleBookVersification" )
+        numChapters = book.find( "numChapters" )
+        book.remove( numChapters )
+        self.assert_( "/BibleBookVersification[1]:" in self.schema.validate( self.tree )[0] )
+        book.insert( 2, numChapters )
+        self.assertEqual( self.schema.validate( self.tree ), [] )
+        SubElement( book, "extra" ).text = "1"
+        self.assertEqual( len( self.schema.validate( self.tree ) ), 1 )
+        book.remove( book.find( "extra" ) )
+        book.set( "extra", "1" )
+        self.assertEqual( len( self.schema.validate( self.tree ) ), 1 )
+    # end of test_030_invalidStructure
+
+    def test_040_findDataFiles( self ):
+        """ Test that the datafiles are matched with their schemas. """
+        results = SchemaValidation.findDataFiles( os.path.join( sourceFolder, "DataFiles" ), os.path.join( sourceFolder, "DerivedFiles" ) )
+        self.assertEqual( len(results), 8 )
+        for schemaFilepath, dataFilepaths in results.items():
+            self.assert_( dataFilepaths )
+        self.assertEqual( results[os.path.join( sourceFolder, "DerivedFiles", "BibleBooksCodes.rng" )], [os.path.join( sourceFolder, "DataFiles", "BibleBooksCodes.xml" )] )
+    # end of test_040_findDataFiles
+# end of SchemaValidationTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of SchemaValidationTest.py
@@ -0,0 +1,116 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# SingletonTest.py
+#
+# Module testing singleton.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing singleton.py.
+"""
+
+progName = "Singleton tests"
+versionString = "0.01"
+
+
+
+import sys, time, threading
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals
+from singleton import singleton, getRegisteredSingletons
+
+
+@singleton
+class _SlowSingleton:
+    """ A singleton which is slow to construct and to load (to give the threads a chance to collide). """
+    numConstructed, numLoaded = 0, 0
+
+    def __init__( self ):
+        time.sleep( 0.01 )
+        _SlowSingleton.numConstructed += 1
+        self.data = None
+
+    def loadData( self ):
+        if self.data is None:
+            time.sleep( 0.01 )
+            _SlowSingleton.numLoaded += 1
+            self.data = "loaded"
+        return self
+# end of _SlowSingleton class
+
+
+class SingletonTests(unittest.TestCase):
+    """ Unit tests for the singleton decorator. """
+
+    def setUp( self ):
+        _SlowSingleton.discard()
+        _SlowSingleton.numConstructed = _SlowSingleton.numLoaded = 0
+
+    def tearDown( self ):
+        _SlowSingleton.discard()
+
+    def test_010_concurrentConstruction( self ):
+        """ Test that threads which all ask for the singleton at once get the same single instance, loaded only once. """
+        numThreads = 16
+        barrier = threading.Barrier( numThreads )
+        results = [None] * numThreads
+        def run( j ):
+            barrier.wait() # Start them all at the same time
+            results[j] = _SlowSingleton().loadData()
+        threads = [threading.Thread( target=run, args=(j,) ) for j in range( numThreads )]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertEqual( _SlowSingleton.numConstructed, 1 )
+        self.assertEqual( _SlowSingleton.numLoaded, 1 )
+        for result in results: self.assertIs( result, results[0] )
+        self.assertEqual( results[0].data, "loaded" )
+    # end of test_010_concurrentConstruction
+
+    def test_020_discard( self ):
+        """ Test that a discarded singleton gets constructed again. """
+        first = _SlowSingleton()
+        self.assertIs( _SlowSingleton(), first )
+        _SlowSingleton.discard()
+        self.assertIsNot( _SlowSingleton(), first )
+        self.assertEqual( _SlowSingleton.numConstructed, 2 )
+    # end of test_020_discard
+
+    def test_030_registry( self ):
+        """ Test that the singleton is registered. """
+        self.assertIs( getRegisteredSingletons()[__name__+"._SlowSingleton"], _SlowSingleton )
+    # end of test_030_registry
+# end of SingletonTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of SingletonTest.py
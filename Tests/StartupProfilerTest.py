@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# StartupProfilerTest.py
+#
+# Module testing StartupProfiler.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing StartupProfiler.py.
+"""
+
+progName = "Startup profiler tests"
+versionString = "0.01"
+
+
+
+import sys, time, atexit, threading
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, StartupProfiler
+
+
+class StartupProfilerTests(unittest.TestCase):
+    """ Unit tests for the StartupProfiler module. """
+
+    def setUp( self ):
+        import tracemalloc
+        self.wasTracing = tracemalloc.is_tracing()
+        self.savedTotals = dict( StartupProfiler._totals )
+        StartupProfiler._totals.clear()
+        StartupProfiler.startProfiling()
+
+    def tearDown( self ):
+        import tracemalloc
+        StartupProfiler.profilingFlag = False
+        atexit.unregister( StartupProfiler._finishProfiling ) # Don't print a report at the end of the tests
+        if not self.wasTracing: tracemalloc.stop()
+        StartupProfiler._totals.clear()
+        StartupProfiler._totals.update( self.savedTotals )
+
+    def getEntry( self, component, phase ):
+        """ Returns the report entry for the given component and phase. """
+        for entry in StartupProfiler.getReport():
+            if entry["component"]==component and entry["phase"]==phase: return entry
+        self.fail( "No report entry for {} {}".format( component, phase ) )
+
+    def test_010_phaseTotals( self ):
+        """ Test that the counts and times of repeated phases are totalled. """
+        for j in range( 3 ):
+            with StartupProfiler.profilePhase( "Test", "parse" ): time.sleep( 0.01 )
+        entry = self.getEntry( "Test", "parse" )
+        self.assertEqual( entry["count"], 3 )
+        self.assertGreaterEqual( entry["wallTime"], 0.03 )
+        self.assertEqual( entry["selfWallTime"], entry["wallTime"] ) # Nothing was nested inside it
+        self.assertEqual( len( StartupProfiler.getReport() ), 1 )
+    # end of test_010_phaseTotals
+
+    def test_020_profiledPhase( self ):
+        """ Test the decorator version. """
+        @StartupProfiler.profiledPhase( "validate" )
+        def check( value ): return value * 2
+        self.assertEqual( check( 21 ), 42 )
+        self.assertEqual( self.getEntry( __name__, "validate" )["count"], 1 )
+    # end of test_020_profiledPhase
+
+    def test_030_nestedPhases( self ):
+        """ Test that the self times of an enclosing phase don't include its nested phases. """
+        with StartupProfiler.profilePhase( "Test", "loadData" ):
+            time.sleep( 0.01 )
+            for phase in ("parse","validate","import",):
+                with StartupProfiler.profilePhase( "Test", phase ): time.sleep( 0.02 )
+        outer = self.getEntry( "Test", "loadData" )
+        inner = [self.getEntry( "Test", phase ) for phase in ("parse","validate","import",)]
+        innerWallTime = sum( entry["wallTime"] for entry in inner )
+        self.assertGreaterEqual( outer["wallTime"], innerWallTime + 0.01 )
+        self.assertAlmostEqual( outer["selfWallTime"], outer["wallTime"] - innerWallTime )
+        self.assertLess( outer["selfWallTime"], innerWallTime )
+        # The self times add up to the total time of the outermost phase
+        self.assertAlmostEqual( sum( entry["selfWallTime"] for entry in StartupProfiler.getReport() ), outer["wallTime"] )
+    # end of test_030_nestedPhases
+
+    def test_040_threads( self ):
+        """ Test that phases in different threads don't lose updates or get nested in each other. """
+        numThreads, numPhases = 8, 200
+        def run():
+            for j in range( numPhases ):
+                with StartupProfiler.profilePhase( "Test", "outer" ):
+                    with StartupProfiler.profilePhase( "Test", "inner" ): pass
+        threads = [threading.Thread( target=run ) for j in range( numThreads )]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+        self.assertEqual( self.getEntry( "Test", "outer" )["count"], numThreads * numPhases )
+        self.assertEqual( self.getEntry( "Test", "inner" )["count"], numThreads * numPhases )
+        self.assertEqual( len( StartupProfiler.getReport() ), 2 )
+    # end of test_040_threads
+# end of StartupProfilerTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of StartupProfilerTest.py
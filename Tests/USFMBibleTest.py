@@ -0,0 +1,132 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+#
+# USFMBibleTest.py
+#
+# Module testing USFMBible.py
+#   Last modified: 2026-10-17 (also update versionString below)
+#
+# Copyright (C) 2011 Robert Hunt
+# Author: Robert Hunt <robert316@users.sourceforge.net>
+# License: See gpl-3.0.txt
+#
+#   This program is free software: you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation, either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module testing USFMBible.py.
+"""
+
+progName = "USFM Bible tests"
+versionString = "0.01"
+
+
+
+import sys, os.path, shutil, tempfile
+import unittest
+
+
+sourceFolder = "."
+sys.path.append( sourceFolder )
+import Globals, DataCache, BibleVersificationSystems, USFMBible
+
+
+# A small versification system with some combined verses (which none of the supplied systems have yet)
+testSystemXML = """<?xml version="1.0" encoding="UTF-8"?>
+<BibleVersificationSystem>
+  <header>
+    <work>
+      <version>0.01</version>
+      <date>2026-10-17</date>
+      <title>Test Bible versification system</title>
+      <contributor role="com">Robert Hunt</contributor>
+      <rights>Public Domain</rights>
+    </work>
+  </header>
+  <BibleBookVersification>
+    <nameEnglish>Matthew</nameEnglish>
+    <referenceAbbreviation>MAT</referenceAbbreviation>
+    <numChapters>2</numChapters>
+    <numVerses chapter="1" combinedVerses="5-6,10-12">25</numVerses>
+    <numVerses chapter="2" combinedVerses="16-17">23</numVerses>
+  </BibleBookVersification>
+</BibleVersificationSystem>
+"""
+
+# A small USFM book which follows the combined verses in chapter 1 but not in chapter 2
+testUSFM = """\\id MAT Test
+\\c 1
+\\p
+\\v 4 Four.
+\\v 5 Five and six.
+\\v 7 Seven.
+\\v 10-11 Ten and eleven.
+\\v 12 Twelve.
+\\c 2
+\\p
+\\v 16 Sixteen.
+\\v 17 Seventeen.
+"""
+
+
+class USFMBibleBookTests(unittest.TestCase):
+    """ Unit tests for the USFMBibleBook object. """
+
+    def setUp( self ):
+        self.tempFolder = tempfile.mkdtemp()
+        with open( os.path.join( self.tempFolder, "BibleVersificationSystem_Test.xml" ), 'wt' ) as myFile: myFile.write( testSystemXML )
+        with open( os.path.join( self.tempFolder, "MAT.SFM" ), 'wt' ) as myFile: myFile.write( testUSFM )
+        self.book = USFMBible.USFMBibleBook()
+        self.book.load( "MAT", self.tempFolder, "MAT.SFM" )
+
+    def tearDown( self ):
+        shutil.rmtree( self.tempFolder )
+
+    def test_010_getVerseNumbers( self ):
+        """ Test that the verse numbers (including verse ranges) are found for each chapter. """
+        self.assertEqual( self.book.getVerseNumbers(), { '1':{4,5,7,10,11,12}, '2':{16,17} } )
+    # end of test_010_getVerseNumbers
+
+    def test_020_getCombinedVerseEnd( self ):
+        """ Test that single verses are only treated as combined verses if the following verses aren't also in the book. """
+        BibleVersificationSystems.BibleVersificationSystems.discard(); BibleVersificationSystems._BibleVersificationSystemsConverter.discard()
+        DataCache.useCache = False # Don't save a snapshot of the test system
+        try:
+            BibleVersificationSystems.BibleVersificationSystems().loadData( self.tempFolder )
+            bvs = BibleVersificationSystems.BibleVersificationSystem( "Test" )
+            self.assertEqual( self.book.getCombinedVerseEnd( bvs, '1', '4' ), None ) # Not a combined verse
+            self.assertEqual( self.book.getCombinedVerseEnd( bvs, '1', '5' ), 6 )
+            self.assertEqual( self.book.getCombinedVerseEnd( bvs, '1', '6' ), None ) # Doesn't start the combined verse
+            with self.assertLogs( level='WARNING' ) as logs:
+                self.assertEqual( self.book.getCombinedVerseEnd( bvs, '1', '10' ), None ) # Verses 11 and 12 are there
+                self.assertEqual( self.book.getCombinedVerseEnd( bvs, '2', '16' ), None ) # Verse 17 is there
+            self.assertEqual( len(logs.output), 2 )
+            self.assertTrue( "[17]" in logs.output[1] )
+            self.assertEqual( self.book.getCombinedVerseEnd( bvs, '2', 'x' ), None )
+        finally:
+            DataCache.useCache = True
+            BibleVersificationSystems.BibleVersificationSystems.discard(); BibleVersificationSystems._BibleVersificationSystemsConverter.discard() # Back to the normal systems
+    # end of test_020_getCombinedVerseEnd
+# end of USFMBibleBookTests class
+
+
+if __name__ == '__main__':
+    # Handle command line parameters (for compatibility)
+    from optparse import OptionParser
+    parser = OptionParser( version="v{}".format( versionString ) )
+    Globals.addStandardOptionsAndProcess( parser )
+
+    if Globals.verbosityLevel > 1: print( "{} V{}".format( progName, versionString ) )
+
+    unittest.main() # Automatically runs all of the above tests
+# end of USFMBibleTest.py
@@ -3,7 +3,7 @@
 # USFMBible.py
 #
 # Module handling the USFM markers for Bible books
-#   Last modified: 2011-01-27 by RJH (also update versionString below)
+#   Last modified: 2026-10-17 by RJH (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -27,7 +27,7 @@ Module for defining and manipulating USFM Bible markers.
 """
 
 progName = "USFM Bible handler"
-versionString = "0.19"
+versionString = "0.22"
 
 
 import os, logging, datetime
@@ -35,11 +35,8 @@ from gettext import gettext as _
 from collections import OrderedDict
 
 from singleton import singleton
-import Globals, ControlFiles
-from BibleBooksCodes import BibleBooksCodes
-from BibleOrganizationalSystems import BibleOrganizationalSystem
-from BibleReferences import BibleReferenceList
-from XMLWriter import XMLWriter
+import Globals
+# The data tables and export helpers are imported when first needed (so that importing this module stays quick)
 
 
 # Globals
@@ -139,6 +136,7 @@ class USFMBibleBook:
         Create the object.
         """
         self.lines = []
+        self.__verseNumbers = None # Found as needed by getCombinedVerseEnd
     # end of __init_
 
     def __str__( self ):
@@ -266,6 +264,38 @@ class USFMBibleBook:
         if reorderedVerses: print( reorderedVerses ); halt
         return versification, omittedVerses, combinedVerses, reorderedVerses
     # end of getVersification
+
+    def getVerseNumbers( self ):
+        """
+        Returns a dictionary (indexed by the chapter number strings) of sets of the integer verse numbers in the book.
+            A verse range like 16-17 adds all of the verses in the range.
+        """
+        verseNumbers, chapterNumberString = {}, '0'
+        for marker,text in self.lines:
+            if marker == 'c': chapterNumberString = text.strip()
+            elif marker == 'v' and text.strip():
+                bits = text.split( None, 1 )[0].replace( '–', '-' ).split( '-' )
+                if len(bits) <= 2 and all( bit.isdigit() for bit in bits ):
+                    verseNumbers.setdefault( chapterNumberString, set() ).update( range( int(bits[0]), int(bits[-1])+1 ) )
+        return verseNumbers
+    # end of getVerseNumbers
+
+    def getCombinedVerseEnd( self, versificationSystem, chapterNumberString, verseNumberString ):
+        """
+        Returns the last (integer) verse number if the versification system says that the given single verse
+            starts a combined verse and the book doesn't also contain any of the following verses of it.
+        Otherwise returns None (and logs a warning if it's because the book contains the following verses).
+        """
+        if not chapterNumberString.isdigit() or not verseNumberString.isdigit(): return None
+        combinedRange = versificationSystem.getCombinedVerseRangeInt( self.bookReferenceCode, int(chapterNumberString), int(verseNumberString) )
+        if combinedRange is None or combinedRange[0] != int(verseNumberString) or combinedRange[1] == combinedRange[0]: return None
+        if self.__verseNumbers is None: self.__verseNumbers = self.getVerseNumbers()
+        presentVerses = self.__verseNumbers.get( chapterNumberString, set() ).intersection( range( combinedRange[0]+1, combinedRange[1]+1 ) )
+        if presentVerses:
+            logging.warning( _("{} {}:{} wasn't treated as the combined verse {}-{} because the book also contains verse(s) {}").format( self.bookReferenceCode, chapterNumberString, verseNumberString, combinedRange[0], combinedRange[1], sorted(presentVerses) ) )
+            return None
+        return combinedRange[1]
+    # end of getCombinedVerseEnd
 # end of class USFMBibleBook
 
 
@@ -281,6 +311,7 @@ class USFMBible:
         self.name = name
         self.books = OrderedDict()
 
+        from BibleBooksCodes import BibleBooksCodes
         self.BibleBooksCodes = BibleBooksCodes().loadData()
         self.OneChapterBBBBookCodes = self.BibleBooksCodes.getSingleChapterBooksList()
     # end of __init_
@@ -346,6 +377,11 @@ class USFMBible:
         This format is roughly documented at http://de.wikipedia.org/wiki/Zefania_XML
             but more fields can be discovered by looking at downloaded files.
         """
+        import ControlFiles
+        from BibleOrganizationalSystems import BibleOrganizationalSystem
+        from BibleReferences import BibleReferenceList
+        from XMLWriter import XMLWriter
+
         # Get the data tables that we need for proper checking
         MediaWikiControls = {}
         ControlFiles.readControlFile( controlFileFolder, controlFilename, MediaWikiControls )
@@ -562,6 +598,11 @@ class USFMBible:
         This format is roughly documented at http://de.wikipedia.org/wiki/Zefania_XML
             but more fields can be discovered by looking at downloaded files.
         """
+        import ControlFiles
+        from BibleOrganizationalSystems import BibleOrganizationalSystem
+        from BibleReferences import BibleReferenceList
+        from XMLWriter import XMLWriter
+
         # Get the data tables that we need for proper checking
         ZefaniaControls = {}
         ControlFiles.readControlFile( controlFileFolder, controlFilename, ZefaniaControls )
@@ -644,6 +685,11 @@ class USFMBible:
 
         TODO: We're not consistent about handling errors: sometimes we use assert, sometime raise (both of which abort the program), and sometimes log errors or warnings.
         """
+        import ControlFiles
+        from BibleOrganizationalSystems import BibleOrganizationalSystem
+        from BibleReferences import BibleReferenceList
+        from XMLWriter import XMLWriter
+
         # Get the data tables that we need for proper checking
         OSISControls = {}
         ControlFiles.readControlFile( controlFileFolder, controlFilename, OSISControls )
@@ -838,6 +884,8 @@ class USFMBible:
                 Has to handle joined verses, e.g.,
                     <verse sID="Esth.9.16" osisID="Esth.9.16 Esth.9.17"/>text<verse eID="Esth.9.16"/> (Crosswire)
                     <verse sID="Esth.9.16-Esth.9.17" osisID="Esth.9.16 Esth.9.17" n="16-17"/>text<verse eID="Esth.9.16-Esth.9.17"/> (Snowfall)
+                    (including single verses which the versification system says start a combined verse
+                    -- see USFMBibleBook.getCombinedVerseEnd).
                 """
                 nonlocal verseNumberString
                 verseNumberString = text.split()[0] # Get the first token which is the first number
@@ -852,7 +900,12 @@ class USFMBible:
                 elif ',' in verseNumberString:
                     raise Exception( "not written yet for comma in versenumber" )
                 elif verseNumberString.isdigit():
-                    sID = osisID = toOSISGlobals["vRef"] = cRef + '.' + verseNumberString
+                    combinedEnd = bkData.getCombinedVerseEnd( BOS, currentChapterNumberString, verseNumberString )
+                    if combinedEnd is not None: # The versification system combines this verse with the following one(s)
+                        toOSISGlobals["vRef"]  = cRef + '.' + verseNumberString
+                        sID    = toOSISGlobals["vRef"] + '-' + cRef + '.' + str(combinedEnd)
+                        osisID = ' '.join( cRef + '.' + str(Vint) for Vint in range( int(verseNumberString), combinedEnd+1 ) )
+                    else: sID = osisID = toOSISGlobals["vRef"] = cRef + '.' + verseNumberString
                 else: logging.critical( _("Doesn't handle verse number of form '{}' yet for {}").format(verseNumberString,cRef) )
                 adjText = processXRefsAndFootnotes( verseText )
                 writerObject.writeLineOpenSelfclose( 'verse', [('sID',sID), ('osisID',osisID)] )
@@ -1070,6 +1123,11 @@ class USFMBible:
         import struct
         assert( struct.calcsize("IH") == 6 ) # Six-byte format
 
+        import ControlFiles
+        from BibleOrganizationalSystems import BibleOrganizationalSystem
+        from BibleReferences import BibleReferenceList
+        from XMLWriter import XMLWriter
+
         # Get the data tables that we need for proper checking
         SwordControls = {}
         ControlFiles.readControlFile( controlFileFolder, controlFilename, SwordControls )
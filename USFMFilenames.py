@@ -3,7 +3,7 @@
 # USFMFilenames.py
 #
 # Module handling USFM Bible filenames
-#   Last modified: 2011-01-18 (also update versionString below)
+#   Last modified: 2026-10-17 (also update versionString below)
 #
 # Copyright (C) 2010-2011 Robert Hunt
 # Author: Robert Hunt <robert316@users.sourceforge.net>
@@ -27,7 +27,7 @@ Module for creating and manipulating USFM filenames.
 """
 
 progName = "USFM Bible filenames handler"
-versionString = "0.55"
+versionString = "0.56"
 
 
 import os
@@ -36,7 +36,6 @@ from gettext import gettext as _
 
 from singleton import singleton
 import Globals
-from BibleBooksCodes import BibleBooksCodes
 
 
 #@singleton # Can only ever have one instance
@@ -50,6 +49,7 @@ class USFMFilenames:
         Create the object.
         """
         # Get the data tables that we need for proper checking
+        from BibleBooksCodes import BibleBooksCodes # Imported here so that importing this module stays quick
         self.BibleBooksCodes = BibleBooksCodes().loadData()
 
         self.folder = folder
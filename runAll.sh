@@ -2,13 +2,13 @@
 #
 # runAll.sh
 #
-#   Last modified: 2011-01-18 by RJH
+#   Last modified: 2026-10-17
 #
-# Run xmllint on all the XML files in the DataFiles folder
+# Validate all the XML files in the DataFiles folder
 # Then run Python code for each module
 #
 
-# Run xmllint on all the XML files in the DataFiles folder
+# Validate all the XML files in the DataFiles folder
 sh checkAll.sh
 
 Python="python3"
@@ -17,6 +17,7 @@ echo "Running Python modules in demo mode..."
 $Python ISO_639_3_Languages.py
 $Python BibleBooksCodes.py
 $Python BibleVersificationSystems.py
+$Python BibleVersificationMappings.py
 $Python BibleBookOrders.py
 $Python BibleBooksNames.py
 $Python BiblePunctuationSystems.py
@@ -26,13 +27,8 @@ $Python USFMBible.py
 $Python BibleReferences.py
 
 echo "Running Python module exports..."
-$Python ISO_639_3_Languages.py --export
-$Python BibleBooksCodes.py --export
-$Python BibleVersificationSystems.py --export
-$Python BibleBookOrders.py --export
-$Python BibleBooksNames.py --export
-$Python BiblePunctuationSystems.py --export
-$Python BibleOrganizationalSystems.py --export
+# Only regenerates the exports whose sources have changed (use --all to regenerate everything)
+$Python ExportAll.py --processes 4
 
 #$Python BibleChaptersVerses.py --scrape
 #$Python BibleOrganizationalSystems.py --scrape
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 #
 # singleton.py
-#   Last modified: 2010-12-15
+#   Last modified: 2026-10-17
 #
 # Taken from http://en.wikipedia.org/wiki/Singleton_pattern
 #
@@ -11,14 +11,53 @@
 #       @singleton
 #       class MyClass:
 #           ...
+#
+# It's thread-safe: each singleton class gets its own (re-entrant) lock
+#   which is held while the instance is created and while its loadData method (if any) runs,
+#   so that two threads can't both load the same data.
+#   The lock is also available to the class as self._singletonLock.
+
+import threading
+from functools import wraps
+
+
+_registry = {} # Key is "moduleName.className", value is the getinstance function
+_registryLock = threading.Lock()
+
+
+def _synchronised( function, lock ):
+    """ Returns a version of the function which holds the lock while it runs. """
+    @wraps( function )
+    def wrapper( *args, **kwargs ):
+        with lock:
+            return function( *args, **kwargs )
+    return wrapper
 
 
 def singleton(cls):
     instance_container = []
+    lock = threading.RLock() # Re-entrant so loadData can safely call other methods that take it
+    cls._singletonLock = lock
+    if hasattr( cls, 'loadData' ): cls.loadData = _synchronised( cls.loadData, lock )
     def getinstance():
-        if not len(instance_container):
-            instance_container.append(cls())
+        if not len(instance_container): # Quick check without the lock
+            with lock:
+                if not len(instance_container): # Check again now that we have the lock
+                    instance_container.append(cls())
         return instance_container[0]
+    def discard():
+        """ Forgets the instance (if any) so that the next call creates a new one. """
+        with lock:
+            instance_container.clear()
+    getinstance.discard = discard
+    with _registryLock:
+        _registry[cls.__module__ + '.' + cls.__name__] = getinstance
     return getinstance
 
+
+def getRegisteredSingletons():
+    """ Returns a dictionary of the getinstance functions of the singleton classes defined so far (keyed by "moduleName.className"). """
+    with _registryLock:
+        return dict( _registry )
+
 # end of singleton.py
@@ -2,7 +2,7 @@
 #
 # trangAll.sh
 #
-#   Last modified: 2010-12-22 by RJH
+#   Last modified: 2026-10-17 by RJH
 #
 # Create the rng files for the RNC schema files in the DataFiles folder
 #
@@ -15,6 +15,7 @@ trang DataFiles/BibleOrganizationalSystems.rnc DerivedFiles/BibleOrganizationalS
 
 # In DataFiles subfolders
 trang DataFiles/VersificationSystems/BibleVersificationSystem.rnc DerivedFiles/BibleVersificationSystem.rng
+trang DataFiles/VersificationMappings/BibleVersificationMapping.rnc DerivedFiles/BibleVersificationMapping.rng
 trang DataFiles/PunctuationSystems/BiblePunctuationSystem.rnc DerivedFiles/BiblePunctuationSystem.rng
 trang DataFiles/BookOrders/BibleBookOrder.rnc DerivedFiles/BibleBookOrder.rng
 trang DataFiles/BookNames/BibleBooksNames.rnc DerivedFiles/BibleBooksNames.rng